@@ -102,23 +102,26 @@ INV_005: Audio conversion runs in thread → main thread calls _auto_save_mod_st
 import sys
 import os
 import math
+import threading
+import time
 import random
 import webbrowser
 from pathlib import Path
-from functools import partial
+from functools import partial, lru_cache
+from collections import namedtuple, defaultdict
 
 # ⚡ CRITICAL FIX: Add pygui directory to Python path so imports work from ANY working directory
 # This allows running: python starsound_gui.py from ANY folder, not just from pygui/
 pygui_dir = Path(__file__).parent.absolute()
 if str(pygui_dir) not in sys.path:
     sys.path.insert(0, str(pygui_dir))
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QPushButton, QLineEdit, QFileDialog, QMessageBox, QVBoxLayout, QHBoxLayout, QGridLayout, QScrollArea, QMenuBar, QAction, QToolBar, QWidgetAction, QStackedLayout, QTextEdit, QDialog, QListWidget, QListWidgetItem, QButtonGroup, QRadioButton, QInputDialog, QComboBox, QCheckBox, QProgressBar
-from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QBrush, QFont
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer, QCoreApplication
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QPushButton, QLineEdit, QFileDialog, QMessageBox, QVBoxLayout, QHBoxLayout, QGridLayout, QScrollArea, QMenuBar, QAction, QToolBar, QWidgetAction, QStackedLayout, QTextEdit, QDialog, QListWidget, QListWidgetItem, QButtonGroup, QRadioButton, QInputDialog, QComboBox, QCheckBox, QProgressBar, QListView, QAbstractItemView, QStyledItemDelegate, QStyleOptionViewItem, QStyle
+from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QBrush, QFont, QFontMetrics, QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer, QCoreApplication, QAbstractListModel, QModelIndex, QEvent, QRect, QSize, QObject, QRunnable, QThreadPool
 QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
 QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-from utils.patch_generator import generate_patch, get_all_biomes_by_category
-from utils.audio_utils import validate_file_exists, validate_file_duration, validate_file_format, convert_to_ogg
+from utils.patch_generator import generate_patch, get_all_biomes_by_category, get_vanilla_tracks_for_biome
+from utils.audio_utils import validate_file_exists, validate_file_duration, validate_file_format, convert_to_ogg, batch_probe
 from utils.logger import get_logger
 from utils.starbound_locator import get_mods_folder, get_storage_folder
 from utils.screenshot_manager import take_screenshot
@@ -133,6 +136,17 @@ from dialogs.split_progress_dialog import SplitProgressDialog
 from dialogs.split_preview_dialog import SplitPreviewDialog
 from dialogs.help_window import HelpWindow
 
+# StarSound root folder (parent of pygui/) - staging/ and the mod save folders live here
+STARSOUND_DIR = Path(os.path.dirname(os.path.dirname(__file__)))
+
+
+@lru_cache(maxsize=64)
+def _safe_mod_name(mod_name):
+    """Mod name reduced to letters, digits, spaces, '_' and '-' (the staging/mods folder name).
+    Cached because the same name is sanitized by every step of a generate/export run."""
+    return "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+
+
 class EmergencyBeaconDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -227,7 +241,12 @@ class EmergencyBeaconDialog(QDialog):
                 else:
                     item.setToolTip('✓ Normal Starbound error (hover for details)')
                 self.error_list.addItem(item)
-        self.show_status(f'Found {len(crit)} critical, {len(benign)} benign errors.')
+        crit_count = log_data.get('criticalCount', len(crit))
+        benign_count = log_data.get('benignCount', len(benign))
+        status = f'Found {crit_count} critical, {benign_count} benign errors.'
+        if crit_count > len(crit) or benign_count > len(benign):
+            status += ' (showing the most recent)'
+        self.show_status(status)
 
 
 class SplitAudioWorker(QThread):
@@ -269,7 +288,7 @@ class MainWindow(QMainWindow):
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         
         # Initialize settings manager early
-        starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+        starsound_dir = STARSOUND_DIR
         self.settings = SettingsManager(starsound_dir)
         
         # Anti-duplicate guard: track last font applied to prevent rapid re-application
@@ -678,7 +697,7 @@ class MainWindow(QMainWindow):
             mod_name = self.modname_input.text().strip() or 'blank_mod'
             if mod_name == self._last_saved_modname:
                 return  # Don't save duplicate names
-            starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+            starsound_dir = STARSOUND_DIR
             mod_folder = save_mod_to_staging(get_current_mod_data(), mod_name, starsound_dir)
             self._last_saved_modname = mod_name
         # Only save to staging when Mod Name field loses focus (focus out)
@@ -1078,9 +1097,9 @@ class MainWindow(QMainWindow):
                 return
             import os
             from pathlib import Path
-            starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+            starsound_dir = STARSOUND_DIR
             staging_dir = starsound_dir / 'staging'
-            safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+            safe_mod_name = _safe_mod_name(mod_name)
             music_folder = staging_dir / safe_mod_name / 'music'
             if not music_folder.exists():
                 QMessageBox.warning(self, 'Open Music Folder', f'Music folder does not exist: {music_folder}')
@@ -1499,9 +1518,9 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, 'Select Music Files', 'Please enter a mod name first.')
             return
         
-        starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+        starsound_dir = STARSOUND_DIR
         staging_dir = starsound_dir / 'staging'
-        safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+        safe_mod_name = _safe_mod_name(mod_name)
         music_folder = staging_dir / safe_mod_name / 'music'
         if not music_folder.exists():
             QMessageBox.warning(self, 'Select Music Files', f'Music folder does not exist: {music_folder}')
@@ -1594,9 +1613,9 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, 'Select Music Files', 'Please enter a mod name first.')
             return
         
-        starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+        starsound_dir = STARSOUND_DIR
         staging_dir = starsound_dir / 'staging'
-        safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+        safe_mod_name = _safe_mod_name(mod_name)
         music_folder = staging_dir / safe_mod_name / 'music'
         if not music_folder.exists():
             QMessageBox.warning(self, 'Select Music Files', f'Music folder does not exist: {music_folder}')
@@ -2032,8 +2051,8 @@ class MainWindow(QMainWindow):
 
     def _get_backup_path(self, mod_name):
         """Get the backup folder path for a mod (root-level backups)"""
-        starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
-        safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+        starsound_dir = STARSOUND_DIR
+        safe_mod_name = _safe_mod_name(mod_name)
         backup_dir = starsound_dir / 'backups' / safe_mod_name
         backup_dir.mkdir(parents=True, exist_ok=True)
         return backup_dir
@@ -3865,7 +3884,8 @@ QGroupBox {{
             self.files_needing_split.clear()
             self.split_decisions.clear()
             
-            from utils.audio_utils import get_audio_duration
+            from utils.audio_utils import batch_probe, get_audio_duration
+            batch_probe(self.selected_audio_files)  # One parallel pass; the lookups below hit its cache
             for file_path, basename in zip(self.selected_audio_files, filenames):
                 duration_minutes = get_audio_duration(file_path)
                 
@@ -4021,9 +4041,9 @@ QGroupBox {{
                 if mod_name:
                     from pathlib import Path
                     import shutil
-                    starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+                    starsound_dir = STARSOUND_DIR
                     staging_dir = starsound_dir / 'staging'
-                    safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+                    safe_mod_name = _safe_mod_name(mod_name)
                     mod_music_path = staging_dir / safe_mod_name / 'music'
                     
                     ogg_message = (
@@ -4113,9 +4133,9 @@ QGroupBox {{
             mod_name = self.modname_input.text().strip()
             if mod_name:
                 from pathlib import Path
-                starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+                starsound_dir = STARSOUND_DIR
                 staging_dir = starsound_dir / 'staging'
-                safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+                safe_mod_name = _safe_mod_name(mod_name)
                 mod_music_path = staging_dir / safe_mod_name / 'music'
                 
                 # Check for duplicates and filter based on user choice
@@ -4131,7 +4151,8 @@ QGroupBox {{
                     if hasattr(self, 'selected_audio_files') and self.selected_audio_files:
                         filenames = [os.path.basename(f) for f in self.selected_audio_files]
                         bullet_lines = ['<span style="font-size:13px">Selected:</span>']
-                        from utils.audio_utils import get_audio_duration
+                        from utils.audio_utils import batch_probe, get_audio_duration
+                        batch_probe(self.selected_audio_files)  # One parallel pass; the lookups below hit its cache
                         for file_path, basename in zip(self.selected_audio_files, filenames):
                             duration_minutes = get_audio_duration(file_path)
                             if duration_minutes and duration_minutes > 30:
@@ -4169,7 +4190,8 @@ QGroupBox {{
                 self.files_needing_split.clear()
                 self.split_decisions.clear()
                 
-                from utils.audio_utils import get_audio_duration
+                from utils.audio_utils import batch_probe, get_audio_duration
+                batch_probe(self.selected_audio_files)  # One parallel pass; the lookups below hit its cache
                 for file_path, basename in zip(self.selected_audio_files, filenames):
                     duration_minutes = get_audio_duration(file_path)
                     
@@ -4192,9 +4214,9 @@ QGroupBox {{
             if mod_name:
                 from pathlib import Path
                 import shutil
-                starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+                starsound_dir = STARSOUND_DIR
                 staging_dir = starsound_dir / 'staging'
-                safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+                safe_mod_name = _safe_mod_name(mod_name)
                 backup_root = self._get_backup_path(safe_mod_name)
                 originals_folder = backup_root / 'originals'
                 originals_folder.mkdir(parents=True, exist_ok=True)
@@ -4256,6 +4278,7 @@ QGroupBox {{
             self.logger.warn('Validate Audio: No file selected.')
             return
         valid_count = 0
+        batch_probe([f for f in files if validate_file_exists(f)])  # Duration + format checks below read this cache
         for file_path in files:
             self.logger.log(f'User started audio validation for: {file_path}')
             if not validate_file_exists(file_path):
@@ -4499,17 +4522,19 @@ QGroupBox {{
         # Build filter chains with actual file durations
         from utils.audio_utils import build_audio_filter_chain, get_audio_duration
         per_track_filters = {}
+        per_track_durations = {}
         for file_path, track_settings in per_track_settings.items():
             converted_settings = self._convert_per_track_to_audio_options(track_settings)
             # Get actual file duration for proper fade-out calculation
             file_duration_minutes = get_audio_duration(file_path)
+            per_track_durations[file_path] = file_duration_minutes
             audio_filter = build_audio_filter_chain(converted_settings, file_duration_minutes=file_duration_minutes)
             per_track_filters[file_path] = audio_filter
         
         self.logger.log(f'[CONVERT_FLOW] Per-track filters built: {len(per_track_filters)} filter(s)')
         
         # Now run the actual conversion with the per-track filters
-        self._run_audio_conversion(files, mod_name, bitrate_value, per_track_filters)
+        self._run_audio_conversion(files, mod_name, bitrate_value, per_track_filters, per_track_durations)
     
     def _on_split_error(self, error_msg: str):
         """Worker thread encountered error."""
@@ -4536,7 +4561,7 @@ QGroupBox {{
             temp_dirs_to_remove = set()
             
             for wav_file in files_to_add:
-                if wav_file.endswith('.wav') and os.path.isfile(wav_file):
+                if wav_file.endswith(('.wav', '.flac')) and os.path.isfile(wav_file):  # .flac: stream-copied FLAC segments
                     try:
                         # Track temp directory for cleanup
                         wav_dir = os.path.dirname(wav_file)
@@ -4780,6 +4805,7 @@ QGroupBox {{
         # If files were split, shows segments grouped by parent file
         self.logger.log('[CONVERT_FLOW] STEP 2.5: Checking if per-track config needed')
         per_track_filters = {}  # Will map file_path -> audio_filter
+        per_track_durations = {}  # file_path -> minutes, probed once here and reused by the converter
         
         if len(files) > 1:
             self.logger.log(f'[CONVERT_FLOW] Multiple files ({len(files)}) detected - showing per-track config')
@@ -4836,6 +4862,7 @@ QGroupBox {{
                 
                 # Get actual file duration for proper fade-out calculation
                 file_duration_minutes = get_audio_duration(file_path)
+                per_track_durations[file_path] = file_duration_minutes
                 audio_filter = build_audio_filter_chain(converted_settings, file_duration_minutes=file_duration_minutes)
                 per_track_filters[file_path] = audio_filter
             
@@ -4848,19 +4875,24 @@ QGroupBox {{
             for file_path in files:
                 # Get actual file duration for proper fade-out calculation
                 file_duration_minutes = get_audio_duration(file_path)
+                per_track_durations[file_path] = file_duration_minutes
                 audio_filter = build_audio_filter_chain(audio_processing_options, file_duration_minutes=file_duration_minutes)
                 per_track_filters[file_path] = audio_filter
             self.logger.log(f'[CONVERT_FLOW] Uniform filter chain applied to all {len(files)} file(s) with actual durations')
         
         # ===== PERFORM CONVERSION =====
-        self._run_audio_conversion(files, mod_name, bitrate_value, per_track_filters)
+        self._run_audio_conversion(files, mod_name, bitrate_value, per_track_filters, per_track_durations)
     
-    def _run_audio_conversion(self, files: list, mod_name: str, bitrate_value: str, per_track_filters: dict):
+    def _run_audio_conversion(self, files: list, mod_name: str, bitrate_value: str, per_track_filters: dict,
+                              per_track_durations: dict = None):
         """
         Run audio conversion in parallel using ThreadPoolExecutor.
         Converts 2-3 files simultaneously for ~2-3x speedup.
         Used by both normal convert_audio() and post-split conversion workflow.
+        per_track_durations: {file_path: minutes} already probed while building the filters, so the
+        converter doesn't run ffprobe on the same input again.
         """
+        per_track_durations = per_track_durations or {}
         import os
         import threading
         from pathlib import Path
@@ -4868,9 +4900,9 @@ QGroupBox {{
         from concurrent.futures import ThreadPoolExecutor, as_completed
         
         # Setup conversion environment
-        starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+        starsound_dir = STARSOUND_DIR
         staging_dir = starsound_dir / 'staging'
-        safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+        safe_mod_name = _safe_mod_name(mod_name)
         mod_path = staging_dir / safe_mod_name
         backup_root = self._get_backup_path(mod_name)  # Get root backup path
         
@@ -4910,10 +4942,11 @@ QGroupBox {{
             success, msg, ogg_path = backup_and_convert_audio(
                 file_path, str(mod_path), bitrate=bitrate_value,
                 audio_filter=audio_filter, ffmpeg_log_callback=ffmpeg_log_callback,
-                backup_path=str(backup_root)
+                backup_path=str(backup_root), input_duration=per_track_durations.get(file_path)
             )
             
-            is_wav = file_path.endswith('.wav')
+            # FLAC sources are split into .flac segments (stream copy) - those are temporary too, unlike a user's own .flac
+            is_wav = file_path.endswith('.wav') or (file_path.endswith('.flac') and file_path in getattr(self, 'segment_origins', {}))
             self.logger.log(f'[PARALLEL] Completed: {os.path.basename(file_path)} - {"✓ Success" if success else "✗ Failed"}')
             
             return (success, msg, ogg_path, is_wav, file_path)
@@ -5097,9 +5130,9 @@ QGroupBox {{
         try:
             mod_name = self.modname_input.text().strip() if hasattr(self, 'modname_input') else ''
             if mod_name:
-                starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+                starsound_dir = STARSOUND_DIR
                 staging_dir = starsound_dir / 'staging'
-                safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+                safe_mod_name = _safe_mod_name(mod_name)
                 
                 # Validate and fix backups folder structure (located at root backups/)
                 backup_root = self._get_backup_path(safe_mod_name)
@@ -5184,7 +5217,7 @@ QGroupBox {{
     def _launch_patch_generation_worker(self, mod_name, format_choice):
         """Launch patch generation in a background thread with progress dialog"""
         # Create and launch worker
-        self.patch_worker = PatchGenerationWorker(self, mod_name, format_choice)
+        self.patch_worker = PatchGenerationWorker(self, mod_name, format_choice, snapshot=_generation_snapshot(self))
         
         # Create progress dialog
         progress_dialog = QMessageBox(self)
@@ -6020,9 +6053,9 @@ QGroupBox {{
                         print(f'[LOAD_MOD] Saved loaded mod to settings: {mod_name_to_validate}')
                         
                         try:
-                            starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+                            starsound_dir = STARSOUND_DIR
                             staging_dir = starsound_dir / 'staging'
-                            safe_mod_name = "".join(c for c in mod_name_to_validate if c.isalnum() or c in (' ', '_', '-')).rstrip()
+                            safe_mod_name = _safe_mod_name(mod_name_to_validate)
                             
                             # Backups are at root-level backups/
                             backup_root = self._get_backup_path(mod_name_to_validate)
@@ -6242,15 +6275,74 @@ QGroupBox {{
         event.accept()
 
 
-# SearchFilterWorker - background thread for fast track searching
-class SearchFilterWorker(QThread):
-    """Background worker for filtering tracks - keeps UI responsive during search"""
-    filter_complete = pyqtSignal(list, int)  # Emits (filtered_data, total_count)
+def _build_flat_search_index(search_index):
+    """Flatten search_index into parallel columns for SearchFilterRunnable (one slot per track, index order):
+    'names' (casefolded file names), 'entry_ids' (position of the track's biome in search_index), 'tracks'
+    (the original track tuples) and 'postings' (3-character slice of a name -> sorted slots containing it)."""
+    names = []
+    entry_ids = []
+    tracks = []
+    postings = defaultdict(list)
+    for entry_pos, index_entry in enumerate(search_index):
+        for track in index_entry['tracks']:
+            row_id = len(names)
+            name = track[0]
+            names.append(name)
+            entry_ids.append(entry_pos)
+            tracks.append(track)
+            for trigram in {name[i:i + 3] for i in range(len(name) - 2)}:
+                postings[trigram].append(row_id)
+    return {'names': names, 'entry_ids': entry_ids, 'tracks': tracks, 'postings': postings}
+
+
+class SearchFilterSignals(QObject):
+    """Signals for SearchFilterRunnable (a QRunnable is not a QObject, so it can't emit on its own)"""
+    filter_complete = pyqtSignal(list, int, int)  # Emits (filtered_data, total_count, total_visible)
+
+
+# SearchFilterRunnable - fast track searching on the shared QThreadPool
+class SearchFilterRunnable(QRunnable):
+    """Background job for filtering tracks - keeps UI responsive during search.
+    Runs on QThreadPool.globalInstance(), so a search reuses a pooled thread instead of starting a new one."""
     
-    def __init__(self, search_index, query):
+    def __init__(self, search_index, query, flat_index=None):
         super().__init__()
+        self.signals = SearchFilterSignals()  # Created on the UI thread, so results arrive there queued
+        self.filter_complete = self.signals.filter_complete
+        self.cancelled = threading.Event()  # Set when a newer search (or clearing the box) supersedes this one
         self.search_index = search_index  # Lightweight index of all tracks
-        self.query = query.lower().strip()  # Search query
+        self.query = query.casefold().strip()  # Search query (casefolded like the index names)
+        self.flat_index = flat_index  # From _build_flat_search_index - built here (off the UI thread) if not given
+    
+    def _matching_tracks(self):
+        """{entry position: [track tuples whose name contains the query]}, tracks kept in index order"""
+        if self.flat_index is None:
+            self.flat_index = _build_flat_search_index(self.search_index)
+        query = self.query
+        names = self.flat_index['names']
+        
+        if len(query) < 3:
+            # Too short for trigrams - one comprehension over the casefolded name column
+            row_ids = [i for i, name in enumerate(names) if query in name]
+        else:
+            # Every trigram of the query must appear in the name - intersect the posting lists
+            # (smallest first), then confirm the real substring match on the few survivors
+            postings = self.flat_index['postings']
+            posting_lists = sorted((postings.get(query[i:i + 3], ()) for i in range(len(query) - 2)), key=len)
+            candidates = set(posting_lists[0])
+            for posting in posting_lists[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(posting)
+            row_ids = [i for i in sorted(candidates) if query in names[i]]
+        
+        # Group by biome in a single pass
+        entry_ids = self.flat_index['entry_ids']
+        tracks = self.flat_index['tracks']
+        matches = defaultdict(list)
+        for i in row_ids:
+            matches[entry_ids[i]].append(tracks[i])
+        return matches
     
     def run(self):
         """Execute search in background thread"""
@@ -6260,19 +6352,27 @@ class SearchFilterWorker(QThread):
                 filtered_data = []
                 total_count = 0
                 # This shouldn't happen (called from UI), but handle it
-                self.filter_complete.emit([], 0)
+                self.filter_complete.emit([], 0, 0)
                 return
             
             # Fast search through lightweight index
             filtered_data = []
             total_count = sum(len(entry['tracks']) for entry in self.search_index)
+            total_visible = 0  # Matching tracks, counted here so the UI thread doesn't re-sum the results
+            name_matches = self._matching_tracks()
             
-            for index_entry in self.search_index:
+            for entry_pos, index_entry in enumerate(self.search_index):
                 biome = index_entry['biome']
                 biome_text = index_entry['biome_text']
                 
-                # Check if biome matches
-                biome_matches = self.query in biome_text
+                # Track matches if biome matches OR track name matches
+                if self.query in biome_text:
+                    tracks = index_entry['tracks']
+                else:
+                    tracks = name_matches.get(entry_pos)
+                if not tracks:
+                    continue
+                total_visible += len(tracks)
                 
                 # Collect matching tracks
                 day_dict = {}
@@ -6281,41 +6381,32 @@ class SearchFilterWorker(QThread):
                 night_list = []
                 is_replace = None
                 
-                for track_name, track_path, is_day, is_replace_mode, key_idx in index_entry['tracks']:
-                    # Track matches if biome matches OR track name matches
-                    if biome_matches or self.query in track_name:
-                        is_replace = is_replace_mode
-                        
-                        if is_replace_mode:
-                            # Replace mode: store as dict with index
-                            if is_day:
-                                day_dict[key_idx] = track_path
-                            else:
-                                night_dict[key_idx] = track_path
+                for track_name, track_path, is_day, is_replace_mode, key_idx in tracks:
+                    is_replace = is_replace_mode
+                    
+                    if is_replace_mode:
+                        # Replace mode: store as dict with index
+                        if is_day:
+                            day_dict[key_idx] = track_path
                         else:
-                            # Add mode: store as list
-                            if is_day:
-                                day_list.append(track_path)
-                            else:
-                                night_list.append(track_path)
+                            night_dict[key_idx] = track_path
+                    else:
+                        # Add mode: store as list
+                        if is_day:
+                            day_list.append(track_path)
+                        else:
+                            night_list.append(track_path)
                 
-                # Only include biome if it has matching tracks
-                if day_dict or night_dict or day_list or night_list:
-                    filtered_data.append({
-                        'biome': biome,
-                        'day': day_dict if is_replace else day_list,
-                        'night': night_dict if is_replace else night_list,
-                        'is_replace': is_replace
-                    })
-            
-            # Calculate total visible (only matching tracks)
-            total_visible = sum(
-                len(d['day']) + len(d['night']) 
-                for d in filtered_data
-            )
+                filtered_data.append({
+                    'biome': biome,
+                    'day': day_dict if is_replace else day_list,
+                    'night': night_dict if is_replace else night_list,
+                    'is_replace': is_replace
+                })
             
-            # Emit results
-            self.filter_complete.emit(filtered_data, total_count)
+            # Emit results (unless a newer search already replaced this one)
+            if not self.cancelled.is_set():
+                self.filter_complete.emit(filtered_data, total_count, total_visible)
         
         except Exception as e:
             print(f'[SEARCH_ERROR] Error in search filter: {e}')
@@ -6323,9 +6414,474 @@ class SearchFilterWorker(QThread):
             traceback.print_exc()
 
 
+def _track_file_name(track_path):
+    """File name of a selected track - os.path.basename is a plain string split, much cheaper than
+    building a Path for every row on every refresh and search"""
+    return os.path.basename(str(track_path))
+
+
+@lru_cache(maxsize=None)
+def _vanilla_track_names(category, biome_name):
+    """(day_names, night_names) of a biome's vanilla tracks, in biome file order.
+    Vanilla biome files never change while the app runs, so each biome is parsed once."""
+    vanilla_data = get_vanilla_tracks_for_biome(category, biome_name)
+    return (tuple(_track_file_name(p) for p in vanilla_data.get('dayTracks', [])),
+            tuple(_track_file_name(p) for p in vanilla_data.get('nightTracks', [])))
+
+
+# Set True to trace tracks viewer rebuilds in the console. Off by default - the rebuild
+# path prints per biome on every refresh and console writes are slow (synchronous on Windows).
+TRACKS_VIEWER_DEBUG = False
+
+
+# One line of the tracks viewer list (or of its search results). Which fields matter depends on kind:
+#   *_header / *_empty / separator rows only use kind
+#   *_biome rows use category, biome and index (= number of tracks in the biome)
+#   *_section rows use category, biome, day_night and index (= number of tracks in the section)
+#   add_track rows use path, replace_track rows use index/path/vanilla_name, vanilla_track rows use vanilla_name
+#   search_* rows mirror the search results: search_biome (index = match count), search_section (day_night only),
+#   search_track (path, plus index = slot number for Replace tracks)
+TrackRow = namedtuple('TrackRow', 'kind category biome day_night index path vanilla_name')
+
+
+class TracksModel(QAbstractListModel):
+    """Flat list model behind TracksViewerWindow - Qt only asks for the rows that are actually on screen"""
+    KindRole = Qt.UserRole + 1
+    RowRole = Qt.UserRole + 2  # The TrackRow itself, for TracksViewerWindow.remove_row()
+    CountRole = Qt.UserRole + 3  # '(N tracks)' text drawn after a biome name
+
+    HEADER_TEXT = {
+        'add_header': '➕ NEW TRACKS WILL BE ADDED',
+        'replace_header': '🔄 TRACKS TO REPLACE',
+        'remove_header': '🗑️ VANILLA TRACKS WILL BE REMOVED (100% of your music guaranteed)',
+        'add_empty': 'No tracks selected yet.',
+        'replace_empty': 'No tracks to replace.',
+        'biome_empty': '    (no tracks selected yet)',
+        'separator': '',
+    }
+
+    # kind -> (color, pixel size, bold, italic)
+    ROW_STYLES = {
+        'add_header': ('#99ff99', 13, True, False),
+        'replace_header': ('#ff9999', 13, True, False),
+        'remove_header': ('#ff9999', 13, True, False),
+        'add_empty': ('#b19cd9', 11, False, True),
+        'replace_empty': ('#b19cd9', 11, False, True),
+        'biome_empty': ('#666666', 9, False, True),
+        'add_biome': ('#00d4ff', 12, True, False),
+        'replace_biome': ('#ffcccc', 11, True, False),
+        'remove_biome': ('#ffcccc', 11, True, False),
+        'add_section': (None, 11, True, False),
+        'replace_section': (None, 10, False, False),
+        'remove_section': (None, 10, False, False),
+        'add_track': ('#e6ecff', 10, False, False),
+        'replace_track': ('#e6ecff', 9, False, False),
+        'vanilla_track': ('#e6ecff', 9, False, False),
+        'separator': ('#3a4a6a', 9, False, False),
+        'search_biome': ('#ccffcc', 11, True, False),
+        'search_section': (None, 10, False, False),
+        'search_track': ('#e6ecff', 9, False, False),
+    }
+    SECTION_COLORS = {'day': '#FFD700', 'night': '#87CEEB'}
+
+    # data() runs for every visible row on every paint, so hand out shared QColor/QFont objects
+    FOREGROUNDS = {kind: QColor(style[0]) for kind, style in ROW_STYLES.items() if style[0]}
+    SECTION_FOREGROUNDS = {day_night: QColor(color) for day_night, color in SECTION_COLORS.items()}
+    DEFAULT_FOREGROUND = QColor('#e6ecff')
+    _fonts = {}  # kind -> QFont, filled on first use (QFont needs the QApplication to exist)
+
+    FETCH_BATCH = 200  # Rows handed to the view at a time - the rest arrive via fetchMore() as the user scrolls
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # [TrackRow, ...] in display order
+        self._loaded = 0  # How many of _rows the view knows about (rowCount)
+        self._texts = {}  # TrackRow -> display text, filled the first time a row is painted
+
+    def set_rows(self, rows):
+        """Swap in a row list that was built off to the side - one model reset, the view drops all cached rows at once.
+        Only the first FETCH_BATCH rows are exposed, so the view lays out a screenful instead of every track."""
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), self.FETCH_BATCH)
+        self._texts = {}
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self._rows) - self._loaded, self.FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    @staticmethod
+    def _row_identity(row):
+        """What makes a row 'the same row' across rebuilds - counts in biome/section titles may change"""
+        if row.kind.endswith('_biome') or row.kind.endswith('_section'):
+            return row._replace(index=None)
+        return row
+
+    def remove_missing_rows(self, rows):
+        """Bring the model in line with a rebuilt row list using rowsRemoved/dataChanged only.
+        Returns False (model untouched) if the new list contains rows that aren't already shown."""
+        old_rows = self._rows
+        removed_runs = []  # [(first, last), ...] in ascending order
+        changed = []
+        new_pos = 0
+        for old_pos, old_row in enumerate(old_rows):
+            if new_pos < len(rows) and self._row_identity(rows[new_pos]) == self._row_identity(old_row):
+                if rows[new_pos] != old_row:
+                    changed.append(new_pos)
+                new_pos += 1
+            elif removed_runs and removed_runs[-1][1] == old_pos - 1:
+                removed_runs[-1] = (removed_runs[-1][0], old_pos)
+            else:
+                removed_runs.append((old_pos, old_pos))
+        if new_pos != len(rows):
+            return False
+
+        # Remove from the bottom up so earlier row numbers stay valid.
+        # Rows the view hasn't fetched yet are dropped without telling it.
+        for first, last in reversed(removed_runs):
+            visible_last = min(last, self._loaded - 1)
+            if first > visible_last:
+                del self._rows[first:last + 1]
+                continue
+            self.beginRemoveRows(QModelIndex(), first, visible_last)
+            del self._rows[first:last + 1]
+            self._loaded -= visible_last - first + 1
+            self.endRemoveRows()
+
+        self._rows = rows
+        for row in changed:
+            if row < self._loaded:
+                self.dataChanged.emit(self.index(row), self.index(row))
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        row = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            # Rows are immutable, so the file name split and f-string only happen once per row, not per repaint
+            text = self._texts.get(row)
+            if text is None:
+                text = self._texts[row] = self._display_text(row)
+            return text
+        if role == self.KindRole:
+            return row.kind
+        if role == self.RowRole:
+            return row
+        if role == self.CountRole:
+            return self._count_text(row)
+        if role == Qt.ForegroundRole:
+            if row.kind in self.FOREGROUNDS:
+                return self.FOREGROUNDS[row.kind]
+            return self.SECTION_FOREGROUNDS.get(row.day_night, self.DEFAULT_FOREGROUND)
+        if role == Qt.FontRole:
+            return self._font(row.kind)
+        if role == Qt.TextAlignmentRole:
+            if row.kind in ('add_empty', 'replace_empty'):
+                return Qt.AlignCenter
+            return Qt.AlignLeft | Qt.AlignVCenter
+        if role == Qt.ToolTipRole:
+            return self._tooltip(row)
+        return None
+
+    @classmethod
+    def _font(cls, kind):
+        font = cls._fonts.get(kind)
+        if font is None:
+            _, size, bold, italic = cls.ROW_STYLES[kind]
+            font = QFont()
+            font.setPixelSize(size)
+            font.setBold(bold)
+            font.setItalic(italic)
+            cls._fonts[kind] = font
+        return font
+
+    def _display_text(self, row):
+        kind = row.kind
+        if kind in self.HEADER_TEXT:
+            return self.HEADER_TEXT[kind]
+        if kind == 'search_section':
+            return '    🌅 Day' if row.day_night == 'day' else '    🌙 Night'
+        if kind == 'search_track':
+            if row.index is None:
+                return f'      • {_track_file_name(row.path)}'
+            return f'      • [{row.index}] {_track_file_name(row.path)}'
+        if kind == 'add_biome':
+            return f'📍 {row.category.upper()}: {row.biome}'
+        if kind in ('replace_biome', 'remove_biome', 'search_biome'):
+            return f'  📍 {row.category.upper()}: {row.biome}'
+        if kind.endswith('_section'):
+            indent = '  ' if kind == 'add_section' else '    '
+            label = '🌅 Day' if row.day_night == 'day' else '🌙 Night'
+            return f'{indent}{label} ({row.index})'
+        if kind == 'add_track':
+            return f'    • {_track_file_name(row.path)}'
+        if kind == 'replace_track':
+            return f'      • {row.vanilla_name} → {_track_file_name(row.path)}'
+        if kind == 'vanilla_track':
+            return f'      • {row.vanilla_name}'
+        return ''
+
+    def _count_text(self, row):
+        nouns = {'add_biome': 'track', 'replace_biome': 'replacement', 'remove_biome': 'removal', 'search_biome': 'track'}
+        if row.kind not in nouns:
+            return None
+        return f'({row.index} {nouns[row.kind]}{"" if row.index == 1 else "s"})'
+
+    def _tooltip(self, row):
+        if row.kind in ('add_track', 'search_track'):
+            return f'Remove {_track_file_name(row.path)}'
+        if row.kind == 'replace_track':
+            return f'Remove replacement for {row.vanilla_name}'
+        if row.kind == 'add_biome':
+            return f'Remove {row.biome} from selection'
+        if row.kind == 'replace_biome':
+            return f'Remove {row.biome} from Replace selection'
+        if row.kind == 'remove_header':
+            return 'Remove Mode: ONLY your custom music will play. ⚠️ Can conflict with other REPLACE-based music mods.'
+        return None
+
+
+class TrackRowDelegate(QStyledItemDelegate):
+    """Paints TracksModel rows (text plus an optional button) and emits button_clicked for the row whose button was hit.
+    Drawing the buttons here means no QPushButton (or click handler) is created per track."""
+    button_clicked = pyqtSignal(QModelIndex)  # Connected once by the owning window
+
+    # kind -> (button text, width, color, hover color)
+    BUTTONS = {
+        'add_track': ('✕', 20, QColor('#c41e3a'), QColor('#e0304f')),
+        'replace_track': ('✕', 20, QColor('#c41e3a'), QColor('#e0304f')),
+        'add_biome': ('✕ Remove', 80, QColor('#8b3a3a'), QColor('#a04a4a')),
+        'replace_biome': ('✕ Remove', 80, QColor('#8b3a3a'), QColor('#a04a4a')),
+        'add_section': ('Clear All', 70, QColor('#c41e3a'), QColor('#e0304f')),
+        'remove_header': ('✕ Cancel Remove', 100, QColor('#8b3a3a'), QColor('#a04a4a')),
+        'search_track': ('✕', 16, QColor('#8B0000'), QColor('#a01010')),
+    }
+    BUTTON_TEXT_COLOR = QColor('white')
+    BUTTON_HEIGHT = 18
+    # kind -> (color, pixel size) of the '(N tracks)' count after biome names
+    COUNT_STYLES = {
+        'add_biome': (QColor('#b19cd9'), 10),
+        'replace_biome': (QColor('#ff9999'), 9),
+        'remove_biome': (QColor('#ff9999'), 9),
+        'search_biome': (QColor('#99ff99'), 9),
+    }
+    ROW_HEIGHTS = {
+        'add_header': 30, 'replace_header': 30, 'remove_header': 30,
+        'add_biome': 30, 'replace_biome': 28, 'remove_biome': 28,
+        'separator': 20,
+        'search_biome': 28, 'search_section': 20, 'search_track': 18,
+    }
+    DEFAULT_ROW_HEIGHT = 22
+
+    _derived_fonts = {}  # (base font key, pixel size, bold) -> QFont, so paint() doesn't copy fonts per row
+
+    @classmethod
+    def _derived_font(cls, base_font, pixel_size, bold):
+        key = (base_font.key(), pixel_size, bold)
+        font = cls._derived_fonts.get(key)
+        if font is None:
+            font = QFont(base_font)
+            font.setPixelSize(pixel_size)
+            font.setBold(bold)
+            cls._derived_fonts[key] = font
+        return font
+
+    _button_pixmaps = {}  # (kind, hovered, base font key, device pixel ratio) -> QPixmap shared by every row of that kind
+
+    @classmethod
+    def _button_pixmap(cls, kind, hovered, base_font, dpr):
+        """The row's button, rendered once - paint() then just blits it instead of redrawing the rounded
+        rect and shaping the '✕' text for every visible track"""
+        key = (kind, hovered, base_font.key(), dpr)
+        pixmap = cls._button_pixmaps.get(key)
+        if pixmap is None:
+            text, width, color, hover_color = cls.BUTTONS[kind]
+            button_rect = QRect(0, 0, width, cls.BUTTON_HEIGHT)
+            pixmap = QPixmap(round(width * dpr), round(cls.BUTTON_HEIGHT * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(hover_color if hovered else color)
+            painter.drawRoundedRect(button_rect, 3, 3)
+            painter.setFont(cls._derived_font(base_font, 10 if text == '✕' else 9, text == '✕'))
+            painter.setPen(cls.BUTTON_TEXT_COLOR)
+            painter.drawText(button_rect, Qt.AlignCenter, text)
+            painter.end()
+            cls._button_pixmaps[key] = pixmap
+        return pixmap
+
+    def _button_rect(self, rect, kind):
+        """Where the row's button sits - right-aligned and vertically centred"""
+        _, width, _, _ = self.BUTTONS[kind]
+        return QRect(rect.right() - width - 4, rect.center().y() - self.BUTTON_HEIGHT // 2, width, self.BUTTON_HEIGHT)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        kind = index.data(TracksModel.KindRole)
+        rect = opt.rect
+        painter.save()
+
+        if kind == 'separator':
+            painter.setPen(opt.palette.text().color())
+            painter.drawLine(rect.left() + 4, rect.center().y(), rect.right() - 4, rect.center().y())
+            painter.restore()
+            return
+
+        text_rect = rect.adjusted(4, 0, -4, 0)
+        if kind in self.BUTTONS:
+            button_rect = self._button_rect(rect, kind)
+            hovered = bool(opt.state & QStyle.State_MouseOver)
+            painter.drawPixmap(button_rect.topLeft(),
+                               self._button_pixmap(kind, hovered, opt.font, painter.device().devicePixelRatioF()))
+            text_rect.setRight(button_rect.left() - 6)
+
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.text().color())
+        painter.drawText(text_rect, int(opt.displayAlignment), opt.text)
+
+        count_text = index.data(TracksModel.CountRole)
+        if count_text:
+            count_color, count_size = self.COUNT_STYLES[kind]
+            count_rect = text_rect.adjusted(QFontMetrics(opt.font).horizontalAdvance(opt.text) + 6, 0, 0, 0)
+            painter.setFont(self._derived_font(opt.font, count_size, False))
+            painter.setPen(count_color)
+            painter.drawText(count_rect, Qt.AlignLeft | Qt.AlignVCenter, count_text)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        kind = index.data(TracksModel.KindRole)
+        return QSize(0, self.ROW_HEIGHTS.get(kind, self.DEFAULT_ROW_HEIGHT))
+
+    def editorEvent(self, event, model, option, index):
+        """One signal for every row button - the window decides what to do from the clicked index"""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            kind = index.data(TracksModel.KindRole)
+            if kind in self.BUTTONS and self._button_rect(option.rect, kind).contains(event.pos()):
+                self.button_clicked.emit(QModelIndex(index))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+# One stylesheet for the whole tracks viewer, applied once at dialog level.
+# Widgets opt in via setObjectName() so Qt parses a single sheet per window.
+_TRACKS_VIEWER_QSS = '''
+* {
+    background-color: #0a0e27;
+    color: #e6ecff;
+}
+QLabel#tracksViewerTitle {
+    color: #00d4ff;
+    font-weight: bold;
+    font-size: 14px;
+    margin-bottom: 8px;
+}
+QLabel#searchLabel {
+    color: #b19cd9;
+    font-size: 11px;
+}
+QLabel#trackCountLabel {
+    color: #b19cd9;
+    font-size: 10px;
+    min-width: 60px;
+}
+QLabel#trackCountLabel[highlighted="true"] {
+    color: #FFD700;
+    font-weight: bold;
+}
+QLineEdit#searchInput {
+    background-color: #283046;
+    color: #e6ecff;
+    border: 1px solid #3a4a6a;
+    border-radius: 4px;
+    padding: 4px;
+    font-size: 11px;
+}
+QLineEdit#searchInput:focus {
+    border: 1px solid #6bbcff;
+    background-color: #2d3a4a;
+}
+QPushButton#clearSearchBtn {
+    background-color: #3a4a6a;
+    color: #ff6b6b;
+    border: 1px solid #3a4a6a;
+    border-radius: 3px;
+    font-weight: bold;
+    font-size: 12px;
+}
+QPushButton#clearSearchBtn:hover {
+    background-color: #4a5a7a;
+}
+QPushButton#clearSearchBtn:pressed {
+    background-color: #2a3a5a;
+}
+QListView#tracksList {
+    border: 1px solid #3a4a6a;
+    border-radius: 4px;
+    background: #0a0e27;
+    padding: 4px;
+}
+QListView#tracksList QScrollBar:vertical {
+    background-color: #1a2540;
+    width: 16px;
+    border-radius: 8px;
+    margin: 0px 0px 0px 0px;
+}
+QListView#tracksList QScrollBar::handle:vertical {
+    background-color: #4a6a9a;
+    border-radius: 8px;
+    min-height: 60px;
+}
+QListView#tracksList QScrollBar::handle:vertical:hover {
+    background-color: #6a8aba;
+}
+QListView#tracksList QScrollBar::add-line:vertical,
+QListView#tracksList QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+}
+QPushButton#refreshBtn {
+    background-color: #3a6ea5;
+    color: #e6ecff;
+    padding: 6px 12px;
+    border-radius: 4px;
+}
+QPushButton#refreshBtn:hover {
+    background-color: #4e8cff;
+}
+QPushButton#closeBtn {
+    background-color: #2d5a3d;
+    color: #e6ecff;
+    padding: 6px 12px;
+    border-radius: 4px;
+}
+QPushButton#closeBtn:hover {
+    background-color: #3a8a55;
+}
+'''
+
+
 class TracksViewerWindow(QDialog):
     """Separate window for viewing and managing selected tracks"""
-    search_filter_complete = pyqtSignal(list, int)  # (filtered_data, total_count)
+    search_filter_complete = pyqtSignal(list, int, int)  # (filtered_data, total_count, total_visible)
     
     def __init__(self, parent, main_window):
         super().__init__(parent)
@@ -6337,7 +6893,7 @@ class TracksViewerWindow(QDialog):
         
         # Get current font from main window and apply it
         current_font = getattr(main_window, 'current_font', 'Hobo')
-        self.setStyleSheet(f'background-color: #0a0e27; color: #e6ecff; font-family: "{current_font}";')
+        self.setStyleSheet(f'* {{ font-family: "{current_font}"; }}' + _TRACKS_VIEWER_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -6345,108 +6901,74 @@ class TracksViewerWindow(QDialog):
         
         # Title
         title = QLabel('🎵 Your Selected Tracks')
-        title.setStyleSheet('color: #00d4ff; font-weight: bold; font-size: 14px; margin-bottom: 8px;')
+        title.setObjectName('tracksViewerTitle')
         layout.addWidget(title)
         
         # 🆕 SEARCH BAR
         search_layout = QHBoxLayout()
         search_label = QLabel('🔍 Search:')
-        search_label.setStyleSheet('color: #b19cd9; font-size: 11px;')
+        search_label.setObjectName('searchLabel')
         search_layout.addWidget(search_label)
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText('Type track name or biome to filter...')
-        self.search_input.setStyleSheet('''QLineEdit {
-            background-color: #283046;
-            color: #e6ecff;
-            border: 1px solid #3a4a6a;
-            border-radius: 4px;
-            padding: 4px;
-            font-size: 11px;
-        }
-        QLineEdit:focus {
-            border: 1px solid #6bbcff;
-            background-color: #2d3a4a;
-        }''')
+        self.search_input.setObjectName('searchInput')
         self.search_input.textChanged.connect(self._on_search_changed)
         self.search_input.returnPressed.connect(lambda: None)  # Prevent Enter from doing anything
         search_layout.addWidget(self.search_input, 1)
         
         # Track count display
         self.count_label = QLabel('(0 / 0)')
-        self.count_label.setStyleSheet('color: #b19cd9; font-size: 10px; min-width: 60px;')
+        self.count_label.setObjectName('trackCountLabel')
         search_layout.addWidget(self.count_label)
         
         # Clear search button (X)
         self.clear_search_btn = QPushButton('✕')
         self.clear_search_btn.setMaximumWidth(28)
-        self.clear_search_btn.setStyleSheet('''QPushButton {
-            background-color: #3a4a6a;
-            color: #ff6b6b;
-            border: 1px solid #3a4a6a;
-            border-radius: 3px;
-            font-weight: bold;
-            font-size: 12px;
-        }
-        QPushButton:hover {
-            background-color: #4a5a7a;
-        }
-        QPushButton:pressed {
-            background-color: #2a3a5a;
-        }''')
+        self.clear_search_btn.setObjectName('clearSearchBtn')
         self.clear_search_btn.clicked.connect(self._clear_search)
         search_layout.addWidget(self.clear_search_btn)
         
         layout.addLayout(search_layout)
         
-        # Scrollable content area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet('''
-            QScrollArea {
-                border: 1px solid #3a4a6a;
-                border-radius: 4px;
-                background: #0a0e27;
-            }
-            QScrollBar:vertical {
-                background-color: #1a2540;
-                width: 16px;
-                border-radius: 8px;
-                margin: 0px 0px 0px 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #4a6a9a;
-                border-radius: 8px;
-                min-height: 60px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #6a8aba;
-            }
-            QScrollBar::add-line:vertical {
-                border: none;
-                background: none;
-            }
-            QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        ''')
-        
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(8, 8, 8, 8)
-        self.content_layout.setSpacing(6)
-        self.scroll_area.setWidget(self.content_widget)
-        
-        layout.addWidget(self.scroll_area)
+        # Full track list - a single virtualized view instead of one widget row per track.
+        # Search results are a separate TracksModel swapped into the same view (see _show_model)
+        self.tracks_model = TracksModel(self)
+        self.results_model = None  # Search results model while one is on screen
+        self.tracks_view = QListView()
+        self.tracks_view.setObjectName('tracksList')
+        self.tracks_view.setModel(self.tracks_model)
+        row_delegate = TrackRowDelegate(self)
+        row_delegate.button_clicked.connect(self.remove_row)
+        self.tracks_view.setItemDelegate(row_delegate)
+        self.tracks_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tracks_view.setFocusPolicy(Qt.NoFocus)
+        self.tracks_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tracks_view.setMouseTracking(True)  # Hover highlight on the row buttons
+        # Row heights vary by kind (headers are taller), so uniform item sizes are out - lay rows out in
+        # batches instead so a resize with thousands of fetched rows doesn't block in one sizeHint() pass
+        self.tracks_view.setLayoutMode(QListView.Batched)
+        self.tracks_view.setBatchSize(TracksModel.FETCH_BATCH)
+        self._shown_results = None  # (filtered_data, total_count) the search results were built from
+        self._last_snapshot = None  # Selections the model was last built from (see _selection_snapshot)
+        
+        # Coalesce refresh_display() calls - several in one event-loop turn become a single rebuild
+        self._refresh_forced = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh_display)
+        
+        layout.addWidget(self.tracks_view)
         
         # Store search query and full track data for filtering
         self.current_search = ''
         self.all_track_data = []  # Will store: (biome, type, tracks_dict, is_replace_mode)
         self.search_index = []  # Lightweight index: [{'biome': tuple, 'biome_text': str, 'tracks': [(name, path, is_day, is_replace), ...]}, ...]
-        self.search_worker = None  # Background worker thread for filtering
-        self.search_filter_complete = pyqtSignal(list, int)
-        
+        self._flat_search_index = None  # Column form of search_index, built lazily by _perform_search
+        self.search_worker = None  # SearchFilterRunnable of the latest search
+        self.search_filter_complete = pyqtSignal(list, int, int)
+
         # Debounce timer - wait 800ms after user stops typing before searching
         self.search_debounce_timer = QTimer()
         self.search_debounce_timer.setSingleShot(True)
@@ -6459,31 +6981,13 @@ class TracksViewerWindow(QDialog):
         # Refresh and close buttons
         button_layout = QHBoxLayout()
         refresh_btn = QPushButton('🔄 Refresh')
-        refresh_btn.setStyleSheet('''QPushButton {
-            background-color: #3a6ea5;
-            color: #e6ecff;
-            padding: 6px 12px;
-            border-radius: 4px;
-        }
-        QPushButton:hover {
-            background-color: #4e8cff;
-        }
-        ''')
+        refresh_btn.setObjectName('refreshBtn')
         refresh_btn.clicked.connect(self._on_refresh_clicked)
         button_layout.addWidget(refresh_btn)
         button_layout.addStretch()
         
         close_btn = QPushButton('Close')
-        close_btn.setStyleSheet('''QPushButton {
-            background-color: #2d5a3d;
-            color: #e6ecff;
-            padding: 6px 12px;
-            border-radius: 4px;
-        }
-        QPushButton:hover {
-            background-color: #3a8a55;
-        }
-        ''')
+        close_btn.setObjectName('closeBtn')
         close_btn.clicked.connect(self.accept)
         button_layout.addWidget(close_btn)
         
@@ -6491,7 +6995,7 @@ class TracksViewerWindow(QDialog):
     
     def _on_search_changed(self, search_text):
         """Search text changed - only search on new typed text, ignore backspace"""
-        new_search = search_text.lower().strip()
+        new_search = search_text.casefold().strip()
         
         # Check if search is getting shorter (backspacing) or longer (typing)
         is_getting_shorter = len(new_search) < len(self.current_search)
@@ -6501,16 +7005,13 @@ class TracksViewerWindow(QDialog):
         if not self.current_search:
             self.search_debounce_timer.stop()
             self.current_search_id += 1  # Invalidate any pending search results
-            # Kill any running search worker
-            if self.search_worker and self.search_worker.isRunning():
-                self.search_worker.requestInterruption()
-            
-            # Process any pending events to ensure old widgets are fully deleted
-            from PyQt5.QtCore import QCoreApplication
-            QCoreApplication.processEvents()
+            # Cancel any pending search
+            if self.search_worker:
+                self.search_worker.cancelled.set()
             
-            # Clear search - restore full original window with all controls (deferred to avoid visual artifacts)
-            QTimer.singleShot(400, self.refresh_display)
+            # Clear search - back to the full list. refresh_display() already waits for the next event-loop
+            # turn, and there are no result widgets left to tear down, so no processEvents()/extra delay needed
+            self.refresh_display()
             return
         
         # If backspacing: do nothing! Leave current filtered results visible
@@ -6544,42 +7045,55 @@ class TracksViewerWindow(QDialog):
         # Capture current search ID so we can ignore stale results
         search_id = self.current_search_id
         
-        # Kill previous worker if still running
-        if self.search_worker and self.search_worker.isRunning():
-            self.search_worker.requestInterruption()
+        # Cancel the previous search if it has not reported yet
+        if self.search_worker:
+            self.search_worker.cancelled.set()
         
-        # Spawn new worker thread for filtering
-        self.search_worker = SearchFilterWorker(self.search_index, self.current_search)
-        # Pass search_id so we can validate results are still current
-        self.search_worker.filter_complete.connect(lambda data, count: self._on_search_complete(data, count, search_id))
-        self.search_worker.start()
+        # The flat index (name column + trigram postings) is built once per rebuild, not per keystroke
+        if self._flat_search_index is None:
+            self._flat_search_index = _build_flat_search_index(self.search_index)
+        
+        # Queue the filtering on the shared thread pool
+        self.search_worker = SearchFilterRunnable(self.search_index, self.current_search, self._flat_search_index)
+        # Tag the signals with search_id so we can validate results are still current (read back via sender())
+        self.search_worker.signals.setProperty('searchId', search_id)
+        self.search_worker.filter_complete.connect(self._on_search_complete)
+        QThreadPool.globalInstance().start(self.search_worker)
     
-    def _on_search_complete(self, filtered_data, total_count, search_id):
+    def _on_search_complete(self, filtered_data, total_count, total_visible):
         """Slot called when search worker completes - only display if result is still current"""
         # Ignore stale results from old searches (e.g., if user cleared the search)
-        if search_id != self.current_search_id:
+        worker = self.sender()
+        if worker is None or worker.property('searchId') != self.current_search_id:
             return
         
-        self._display_filtered_results(filtered_data, total_count)
+        self._display_filtered_results(filtered_data, total_count, total_visible)
+    
+    def _set_count_text(self, text, highlighted=False):
+        """Update the track count label - the gold highlighted look comes from the viewer stylesheet via a
+        dynamic property, so Qt re-polishes one widget instead of parsing a new stylesheet string"""
+        self.count_label.setText(text)
+        if self.count_label.property('highlighted') != highlighted:
+            self.count_label.setProperty('highlighted', highlighted)
+            self.count_label.style().unpolish(self.count_label)
+            self.count_label.style().polish(self.count_label)
     
     def _on_refresh_clicked(self):
         """Refresh button clicked - rebuild display (deferred to keep UI responsive)"""
         # Show immediate feedback
-        self.count_label.setText('(refreshing...)')
-        self.count_label.setStyleSheet('color: #FFD700; font-size: 10px; min-width: 60px; font-weight: bold;')
+        self._set_count_text('(refreshing...)', highlighted=True)
         
         # Defer the heavy rebuild so UI can respond immediately
         QTimer.singleShot(50, self._do_refresh_display_deferred)
     
     def _do_refresh_display_deferred(self):
         """Actually rebuild display after UI has processed events"""
-        self.refresh_display()
+        self._do_refresh_display(force=True)
         
         # Update count label to show actual track count
         if self.all_track_data:
             total_count = sum(len(b['day']) + len(b['night']) for b in self.all_track_data)
-            self.count_label.setText(f'({total_count} / {total_count})')
-            self.count_label.setStyleSheet('color: #b19cd9; font-size: 10px; min-width: 60px;')
+            self._set_count_text(f'({total_count} / {total_count})')
         
         QMessageBox.information(self, 'Refreshed', '✓ Display updated')
     
@@ -6587,8 +7101,7 @@ class TracksViewerWindow(QDialog):
         """Remove a track and refresh display"""
         print(f'[TRACKS_VIEWER] Removing {track_type} track: {track_path}')
         self.main_window.remove_biome_track(biome, track_type, track_path)
-        print(f'[TRACKS_VIEWER] Refreshing display after removal')
-        self.refresh_display()
+        self._remove_rows_and_refresh()
         QMessageBox.information(self, 'Track Removed', f'✓ Removed from {biome[1]}')
     
     def _remove_track_from_search_and_refresh(self, biome, track_type, track_path):
@@ -6596,19 +7109,17 @@ class TracksViewerWindow(QDialog):
         print(f'[TRACKS_VIEWER] Removing {track_type} track from search: {track_path}')
         self.main_window.remove_biome_track(biome, track_type, track_path)
         print(f'[TRACKS_VIEWER] Re-running search after removal')
-        # Re-run the current search to update filtered results
-        if self.current_search:
-            self._run_search(self.current_search)
-        else:
-            self._display_filtered_results(self.all_track_data, len(self._get_all_tracks()))
+        # Bring the full list (and with it the search index) up to date, then re-run the current search -
+        # unless that needed a full rebuild, which clears the search and shows the whole list instead
+        if self._remove_rows_and_refresh():
+            self._perform_search()
         QMessageBox.information(self, 'Track Removed', f'✓ Removed from {biome[1]}')
     
     def _clear_biome_and_refresh(self, biome, track_type):
         """Clear all tracks of a type and refresh display"""
         print(f'[TRACKS_VIEWER] Clearing {track_type} tracks for {biome}')
         self.main_window.clear_biome_tracks(biome, track_type)
-        print(f'[TRACKS_VIEWER] Refreshing display after clear')
-        self.refresh_display()
+        self._remove_rows_and_refresh()
         QMessageBox.information(self, 'Tracks Cleared', f'✓ All {track_type} tracks cleared from {biome[1]}')
     
     def _remove_biome_and_refresh(self, biome):
@@ -6633,8 +7144,7 @@ class TracksViewerWindow(QDialog):
         self.main_window._auto_save_mod_state(f'Removed biome {biome[1]}')
         self.main_window.update_selected_tracks_label()
         self.main_window.update_patch_btn_state()
-        print(f'[TRACKS_VIEWER] Biome removed, refreshing display')
-        self.refresh_display()
+        self._remove_rows_and_refresh()
         QMessageBox.information(self, 'Biome Removed', f'✓ {biome[1]} removed from selection')
     
     def _remove_replace_biome_and_refresh(self, biome):
@@ -6647,8 +7157,7 @@ class TracksViewerWindow(QDialog):
         self.main_window._auto_save_mod_state(f'Removed biome {biome[1]} from Replace')
         self.main_window.update_selected_tracks_label()
         self.main_window.update_patch_btn_state()
-        print(f'[TRACKS_VIEWER] Biome removed from replace, refreshing display')
-        self.refresh_display()
+        self._remove_rows_and_refresh()
         QMessageBox.information(self, 'Biome Removed', f'✓ {biome[1]} removed from Replace selection')
     
     def _remove_replace_track_and_refresh(self, biome, track_type, track_idx):
@@ -6668,8 +7177,7 @@ class TracksViewerWindow(QDialog):
         self.main_window._auto_save_mod_state(f'Removed replacement track from {biome[1]}')
         self.main_window.update_selected_tracks_label()
         self.main_window.update_patch_btn_state()
-        print(f'[TRACKS_VIEWER] Refreshing display after track removal')
-        self.refresh_display()
+        self._remove_rows_and_refresh()
         QMessageBox.information(self, 'Track Removed', f'✓ Removed from {biome[1]} Replace')
     
     def _on_cancel_remove_vanilla(self):
@@ -6680,684 +7188,379 @@ class TracksViewerWindow(QDialog):
         if hasattr(self.main_window, 'remove_vanilla_checkbox'):
             self.main_window.remove_vanilla_checkbox.setChecked(False)
         self.main_window._auto_save_mod_state('Cancelled Remove Vanilla Tracks from View All Tracks')
+        self._remove_rows_and_refresh()
+
+    def remove_row(self, index):
+        """Row button clicked in the tracks list - run the matching remove/clear handler for that row"""
+        row = index.data(TracksModel.RowRole)
+        if row is None:
+            return
+        biome = (row.category, row.biome)
+        if row.kind == 'add_track':
+            self._remove_track_and_refresh(biome, row.day_night, row.path)
+        elif row.kind == 'replace_track':
+            self._remove_replace_track_and_refresh(biome, row.day_night, row.index)
+        elif row.kind == 'add_section':
+            self._clear_biome_and_refresh(biome, row.day_night)
+        elif row.kind == 'add_biome':
+            self._remove_biome_and_refresh(biome)
+        elif row.kind == 'replace_biome':
+            self._remove_replace_biome_and_refresh(biome)
+        elif row.kind == 'remove_header':
+            self._on_cancel_remove_vanilla()
+        elif row.kind == 'search_track':
+            self._remove_track_from_search_and_refresh(biome, row.day_night, row.path)
+
+    def _selection_snapshot(self):
+        """Hashable copy of everything the track list is built from - equal snapshots mean identical rows.
+        Costs O(biomes) Python work (the per-biome tuple() copies run in C), and unlike a count-based
+        signature it also notices a replacement swapped at the same index or a track swapped for another,
+        so the main window never has to tell the viewer that something changed."""
+        patch_mode = getattr(self.main_window, 'patch_mode', 'add')
+        add_selections = getattr(self.main_window, 'add_selections', {})
+        replace_selections = getattr(self.main_window, 'replace_selections', {})
+        return (
+            patch_mode,
+            getattr(self.main_window, 'remove_vanilla_tracks', False),
+            tuple(getattr(self.main_window, 'selected_biomes', [])),
+            tuple((biome, tuple(data.get('day', [])), tuple(data.get('night', [])))
+                  for biome, data in add_selections.items()),
+            tuple((biome, tuple(data.get('day', {}).items()), tuple(data.get('night', {}).items()))
+                  for biome, data in replace_selections.items()),
+        )
+
+    def _remove_rows_and_refresh(self):
+        """
+        After a removal, drop just the affected rows from the model instead of rebuilding the list.
+        Returns True if the rows were updated in place, False if a full rebuild (which clears the search) was scheduled.
+        """
+        snapshot = self._selection_snapshot()
+        if snapshot == self._last_snapshot:
+            return True
+        if self._last_snapshot is not None and snapshot[0] == self._last_snapshot[0]:
+            add_keys, replace_keys = self._sorted_selection_keys()
+            rows = self._build_rows(add_keys, replace_keys)
+            if self.tracks_model.remove_missing_rows(rows):
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Removed rows in place, {len(rows)} rows left')
+                self._last_snapshot = snapshot
+                return True
+        if TRACKS_VIEWER_DEBUG:
+            print(f'[TRACKS_VIEWER] Rows were added or patch mode changed, rebuilding display')
         self.refresh_display()
-    
-    def _display_add_tracks_section(self):
-        """Display the 'NEW TRACKS WILL BE ADDED' section with all buttons and controls (shared by Both mode and Add mode)"""
-        from PyQt5.QtCore import QCoreApplication
-        
+        return False
+
+    def _display_add_tracks_section(self, rows, add_keys):
+        """Append the 'NEW TRACKS WILL BE ADDED' rows with their buttons (shared by Both mode and Add mode)"""
         add_selections = getattr(self.main_window, 'add_selections', {})
-        
+
         # Add header
-        add_header = QLabel('➕ NEW TRACKS WILL BE ADDED')
-        add_header.setStyleSheet('color: #99ff99; font-weight: bold; font-size: 13px; margin-bottom: 4px; margin-top: 8px;')
-        self.content_layout.addWidget(add_header)
-        
+        rows.append(TrackRow('add_header', None, None, None, None, None, None))
+
         if not add_selections:
-            empty_label = QLabel('No tracks selected yet.')
-            empty_label.setStyleSheet('color: #b19cd9; font-style: italic; font-size: 11px;')
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.content_layout.addWidget(empty_label)
+            rows.append(TrackRow('add_empty', None, None, None, None, None, None))
         else:
-            total_tracks = 0
-            print(f'[TRACKS_VIEWER] Building Add display for {len(add_selections)} biome(s)')
-            
-            for (category, biome_name) in sorted(add_selections.keys()):
+            if TRACKS_VIEWER_DEBUG:
+                print(f'[TRACKS_VIEWER] Building Add display for {len(add_selections)} biome(s)')
+
+            for (category, biome_name) in add_keys:
                 biome_data = add_selections[(category, biome_name)]
                 day_tracks = biome_data.get('day', [])
                 night_tracks = biome_data.get('night', [])
-                
+
                 biome_count = len(day_tracks) + len(night_tracks)
-                
-                print(f'[TRACKS_VIEWER] Add: {category}/{biome_name}: {len(day_tracks)} day, {len(night_tracks)} night')
-                
+
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Add: {category}/{biome_name}: {len(day_tracks)} day, {len(night_tracks)} night')
+
                 # Biome header with count and remove button
-                biome_header = QHBoxLayout()
-                biome_label = QLabel(f'📍 {category.upper()}: {biome_name}')
-                biome_label.setStyleSheet('color: #00d4ff; font-weight: bold; font-size: 12px;')
-                biome_header.addWidget(biome_label)
-                
-                count_label = QLabel(f'({biome_count} track{"" if biome_count == 1 else "s"})')
-                count_label.setStyleSheet('color: #b19cd9; font-size: 10px;')
-                biome_header.addWidget(count_label)
-                biome_header.addStretch()
-                
-                # Add remove biome button
-                remove_biome_btn = QPushButton('✕ Remove')
-                remove_biome_btn.setFixedWidth(80)
-                remove_biome_btn.setStyleSheet('''QPushButton {
-                    background-color: #8b3a3a;
-                    color: white;
-                    font-size: 9px;
-                    padding: 2px;
-                    border-radius: 3px;
-                    border: 1px solid #a04a4a;
-                }
-                QPushButton:hover {
-                    background-color: #a04a4a;
-                    border: 1px solid #c05a5a;
-                }''')
-                remove_biome_btn.setToolTip(f'Remove {biome_name} from selection')
-                remove_biome_btn.clicked.connect(partial(self._remove_biome_and_refresh, (category, biome_name)))
-                biome_header.addWidget(remove_biome_btn)
-                
-                self.content_layout.addLayout(biome_header)
-                
+                rows.append(TrackRow('add_biome', category, biome_name, None, biome_count, None, None))
+                index_tracks = self._new_search_entry((category, biome_name), day_tracks, night_tracks, False)
+
                 # If empty, show message
                 if biome_count == 0:
-                    empty_msg = QLabel('    (no tracks selected yet)')
-                    empty_msg.setStyleSheet('color: #666; font-size: 9px; font-style: italic;')
-                    self.content_layout.addWidget(empty_msg)
-                else:
-                    # Day tracks
-                    if day_tracks:
-                        print(f'[TRACKS_VIEWER] Adding {len(day_tracks)} day tracks')
-                        day_section = QVBoxLayout()
-                        day_title = QHBoxLayout()
-                        day_label = QLabel(f'  🌅 Day ({len(day_tracks)})')
-                        day_label.setStyleSheet('color: #FFD700; font-weight: bold; font-size: 11px;')
-                        day_title.addWidget(day_label)
-                        day_title.addStretch()
-                        
-                        clear_btn = QPushButton('Clear All')
-                        clear_btn.setFixedWidth(70)
-                        clear_btn.setStyleSheet('background-color: #c41e3a; color: white; font-size: 9px; padding: 3px; border-radius: 3px;')
-                        clear_btn.clicked.connect(partial(self._clear_biome_and_refresh, (category, biome_name), 'day'))
-                        day_title.addWidget(clear_btn)
-                        day_section.addLayout(day_title)
-                        
-                        for idx, track_path in enumerate(day_tracks):
-                            track_item = QHBoxLayout()
-                            track_name = Path(track_path).name
-                            track_label = QLabel(f'    • {track_name}')
-                            track_label.setStyleSheet('color: #e6ecff; font-size: 10px;')
-                            track_item.addWidget(track_label)
-                            track_item.addStretch()
-                            
-                            delete_btn = QPushButton('✕')
-                            delete_btn.setFixedSize(20, 20)
-                            delete_btn.setStyleSheet('background-color: #c41e3a; color: white; font-weight: bold; padding: 0px; border-radius: 3px; font-size: 10px;')
-                            delete_btn.setToolTip(f'Remove {track_name}')
-                            delete_btn.clicked.connect(partial(self._remove_track_and_refresh, (category, biome_name), 'day', track_path))
-                            track_item.addWidget(delete_btn)
-                            day_section.addLayout(track_item)
-                            
-                            # Allow UI to respond every 15 widgets
-                            if (idx + 1) % 15 == 0:
-                                QCoreApplication.processEvents()
-                        
-                        self.content_layout.addLayout(day_section)
-                    
-                    # Night tracks
-                    if night_tracks:
-                        print(f'[TRACKS_VIEWER] Adding {len(night_tracks)} night tracks')
-                        night_section = QVBoxLayout()
-                        night_title = QHBoxLayout()
-                        night_label = QLabel(f'  🌙 Night ({len(night_tracks)})')
-                        night_label.setStyleSheet('color: #87CEEB; font-weight: bold; font-size: 11px;')
-                        night_title.addWidget(night_label)
-                        night_title.addStretch()
-                        
-                        clear_btn = QPushButton('Clear All')
-                        clear_btn.setFixedWidth(70)
-                        clear_btn.setStyleSheet('background-color: #c41e3a; color: white; font-size: 9px; padding: 3px; border-radius: 3px;')
-                        clear_btn.clicked.connect(partial(self._clear_biome_and_refresh, (category, biome_name), 'night'))
-                        night_title.addWidget(clear_btn)
-                        night_section.addLayout(night_title)
-                        
-                        for idx, track_path in enumerate(night_tracks):
-                            track_item = QHBoxLayout()
-                            track_name = Path(track_path).name
-                            track_label = QLabel(f'    • {track_name}')
-                            track_label.setStyleSheet('color: #e6ecff; font-size: 10px;')
-                            track_item.addWidget(track_label)
-                            track_item.addStretch()
-                            
-                            delete_btn = QPushButton('✕')
-                            delete_btn.setFixedSize(20, 20)
-                            delete_btn.setStyleSheet('background-color: #c41e3a; color: white; font-weight: bold; padding: 0px; border-radius: 3px; font-size: 10px;')
-                            delete_btn.setToolTip(f'Remove {track_name}')
-                            delete_btn.clicked.connect(partial(self._remove_track_and_refresh, (category, biome_name), 'night', track_path))
-                            track_item.addWidget(delete_btn)
-                            night_section.addLayout(track_item)
-                            
-                            # Allow UI to respond every 15 widgets
-                            if (idx + 1) % 15 == 0:
-                                QCoreApplication.processEvents()
-                        
-                        self.content_layout.addLayout(night_section)
-                
-                self.content_layout.addSpacing(6)
-    
-    def _display_replace_tracks_section(self):
-        """Display the 'TRACKS TO REPLACE' section with vanilla → custom mapping and remove buttons (shared by Both mode and Replace mode)"""
-        from utils.patch_generator import get_vanilla_tracks_for_biome
-        
+                    rows.append(TrackRow('biome_empty', None, None, None, None, None, None))
+                    continue
+
+                for track_type, tracks in (('day', day_tracks), ('night', night_tracks)):
+                    if not tracks:
+                        continue
+                    # Day/Night title with Clear All button
+                    rows.append(TrackRow('add_section', category, biome_name, track_type, len(tracks), None, None))
+
+                    for track_path in tracks:
+                        rows.append(TrackRow('add_track', category, biome_name, track_type, None, track_path, None))
+                        index_tracks.append((_track_file_name(track_path).casefold(), track_path, track_type == 'day', False, None))
+
+    def _display_replace_tracks_section(self, rows, replace_keys):
+        """Append the 'TRACKS TO REPLACE' rows with vanilla → custom mapping (shared by Both mode and Replace mode)"""
         replace_selections = getattr(self.main_window, 'replace_selections', {})
-        
+
         # Add header
-        replace_header = QLabel('🔄 TRACKS TO REPLACE')
-        replace_header.setStyleSheet('color: #ff9999; font-weight: bold; font-size: 13px; margin-bottom: 4px; margin-top: 8px;')
-        self.content_layout.addWidget(replace_header)
-        
+        rows.append(TrackRow('replace_header', None, None, None, None, None, None))
+
         if not replace_selections:
-            empty_label = QLabel('No tracks to replace.')
-            empty_label.setStyleSheet('color: #b19cd9; font-style: italic; font-size: 11px;')
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.content_layout.addWidget(empty_label)
+            rows.append(TrackRow('replace_empty', None, None, None, None, None, None))
         else:
-            print(f'[TRACKS_VIEWER] Building Replace display for {len(replace_selections)} biome(s)')
-            
-            for (category, biome_name) in sorted(replace_selections.keys()):
+            if TRACKS_VIEWER_DEBUG:
+                print(f'[TRACKS_VIEWER] Building Replace display for {len(replace_selections)} biome(s)')
+
+            for (category, biome_name) in replace_keys:
                 biome_data = replace_selections[(category, biome_name)]
                 day_replace = biome_data.get('day', {})  # dict of {index: path}
                 night_replace = biome_data.get('night', {})  # dict of {index: path}
-                
+
                 replace_count = len(day_replace) + len(night_replace)
-                
-                print(f'[TRACKS_VIEWER] Replace: {category}/{biome_name}: {len(day_replace)} day, {len(night_replace)} night')
-                
-                # Get vanilla tracks for this biome
-                vanilla_data = get_vanilla_tracks_for_biome(category, biome_name)
-                day_vanilla = vanilla_data.get('dayTracks', [])
-                night_vanilla = vanilla_data.get('nightTracks', [])
-                
+
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Replace: {category}/{biome_name}: {len(day_replace)} day, {len(night_replace)} night')
+
+                # Get vanilla track names for this biome (cached)
+                day_vanilla, night_vanilla = _vanilla_track_names(category, biome_name)
+
                 # Biome header with Remove button
-                biome_header = QHBoxLayout()
-                biome_label = QLabel(f'  📍 {category.upper()}: {biome_name}')
-                biome_label.setStyleSheet('color: #ffcccc; font-weight: bold; font-size: 11px;')
-                biome_header.addWidget(biome_label)
-                
-                count_label = QLabel(f'({replace_count} replacement{"" if replace_count == 1 else "s"})')
-                count_label.setStyleSheet('color: #ff9999; font-size: 9px;')
-                biome_header.addWidget(count_label)
-                biome_header.addStretch()
-                
-                # Add Remove biome button
-                remove_biome_btn = QPushButton('✕ Remove')
-                remove_biome_btn.setFixedWidth(80)
-                remove_biome_btn.setStyleSheet('''QPushButton {
-                    background-color: #8b3a3a;
-                    color: white;
-                    font-size: 9px;
-                    padding: 2px;
-                    border-radius: 3px;
-                    border: 1px solid #a04a4a;
-                }
-                QPushButton:hover {
-                    background-color: #a04a4a;
-                    border: 1px solid #c05a5a;
-                }''')
-                remove_biome_btn.setToolTip(f'Remove {biome_name} from Replace selection')
-                remove_biome_btn.clicked.connect(partial(self._remove_replace_biome_and_refresh, (category, biome_name)))
-                biome_header.addWidget(remove_biome_btn)
-                
-                self.content_layout.addLayout(biome_header)
-                
-                # Day replacements
-                if day_replace:
-                    day_section = QVBoxLayout()
-                    day_title = QLabel(f'    🌅 Day ({len(day_replace)})')
-                    day_title.setStyleSheet('color: #FFD700; font-size: 10px;')
-                    day_section.addWidget(day_title)
-                    
-                    for idx, track_path in day_replace.items():
-                        # Get vanilla track name for this index
-                        vanilla_name = Path(day_vanilla[idx]).name if idx < len(day_vanilla) else '?'
-                        custom_name = Path(track_path).name
-                        
-                        track_item = QHBoxLayout()
-                        track_label = QLabel(f'      • {vanilla_name} → {custom_name}')
-                        track_label.setStyleSheet('color: #e6ecff; font-size: 9px;')
-                        track_item.addWidget(track_label)
-                        track_item.addStretch()
-                        
-                        delete_btn = QPushButton('✕')
-                        delete_btn.setFixedSize(20, 20)
-                        delete_btn.setStyleSheet('background-color: #c41e3a; color: white; font-weight: bold; padding: 0px; border-radius: 3px; font-size: 10px;')
-                        delete_btn.setToolTip(f'Remove replacement for {vanilla_name}')
-                        delete_btn.clicked.connect(partial(self._remove_replace_track_and_refresh, (category, biome_name), 'day', idx))
-                        track_item.addWidget(delete_btn)
-                        day_section.addLayout(track_item)
-                    
-                    self.content_layout.addLayout(day_section)
-                
-                # Night replacements
-                if night_replace:
-                    night_section = QVBoxLayout()
-                    night_title = QLabel(f'    🌙 Night ({len(night_replace)})')
-                    night_title.setStyleSheet('color: #87CEEB; font-size: 10px;')
-                    night_section.addWidget(night_title)
-                    
-                    for idx, track_path in night_replace.items():
-                        # Get vanilla track name for this index
-                        vanilla_name = Path(night_vanilla[idx]).name if idx < len(night_vanilla) else '?'
-                        custom_name = Path(track_path).name
-                        
-                        track_item = QHBoxLayout()
-                        track_label = QLabel(f'      • {vanilla_name} → {custom_name}')
-                        track_label.setStyleSheet('color: #e6ecff; font-size: 9px;')
-                        track_item.addWidget(track_label)
-                        track_item.addStretch()
-                        
-                        delete_btn = QPushButton('✕')
-                        delete_btn.setFixedSize(20, 20)
-                        delete_btn.setStyleSheet('background-color: #c41e3a; color: white; font-weight: bold; padding: 0px; border-radius: 3px; font-size: 10px;')
-                        delete_btn.setToolTip(f'Remove replacement for {vanilla_name}')
-                        delete_btn.clicked.connect(partial(self._remove_replace_track_and_refresh, (category, biome_name), 'night', idx))
-                        track_item.addWidget(delete_btn)
-                        night_section.addLayout(track_item)
-                    
-                    self.content_layout.addLayout(night_section)
-                
-                self.content_layout.addSpacing(6)
+                rows.append(TrackRow('replace_biome', category, biome_name, None, replace_count, None, None))
+                index_tracks = self._new_search_entry((category, biome_name), day_replace, night_replace, True)
+
+                for track_type, replacements, vanilla_names in (('day', day_replace, day_vanilla), ('night', night_replace, night_vanilla)):
+                    if not replacements:
+                        continue
+                    rows.append(TrackRow('replace_section', category, biome_name, track_type, len(replacements), None, None))
+
+                    for idx, track_path in replacements.items():
+                        vanilla_name = vanilla_names[idx] if idx < len(vanilla_names) else '?'
+                        rows.append(TrackRow('replace_track', category, biome_name, track_type, idx, track_path, vanilla_name))
+                        index_tracks.append((_track_file_name(track_path).casefold(), track_path, track_type == 'day', True, idx))
 
-    def refresh_display(self):
-        """Rebuild the tracks display"""
+    def _display_remove_vanilla_section(self, rows, selected_biomes):
+        """Append the 'VANILLA TRACKS WILL BE REMOVED' rows (Add mode with Remove Vanilla Tracks enabled)"""
+        # Header with cancel button
+        rows.append(TrackRow('remove_header', None, None, None, None, None, None))
+
+        for (category, biome_name) in sorted(selected_biomes):
+            day_vanilla, night_vanilla = _vanilla_track_names(category, biome_name)
+
+            vanilla_count = len(day_vanilla) + len(night_vanilla)
+            if vanilla_count == 0:
+                continue
+
+            if TRACKS_VIEWER_DEBUG:
+                print(f'[TRACKS_VIEWER] Remove: {category}/{biome_name}: {len(day_vanilla)} day, {len(night_vanilla)} night')
+            rows.append(TrackRow('remove_biome', category, biome_name, None, vanilla_count, None, None))
+
+            for track_type, vanilla_tracks in (('day', day_vanilla), ('night', night_vanilla)):
+                if not vanilla_tracks:
+                    continue
+                rows.append(TrackRow('remove_section', category, biome_name, track_type, len(vanilla_tracks), None, None))
+                for vanilla_name in vanilla_tracks:
+                    rows.append(TrackRow('vanilla_track', category, biome_name, track_type, None, None, vanilla_name))
+
+        # Separator before ADD tracks
+        rows.append(TrackRow('separator', None, None, None, None, None, None))
+
+    def _new_search_entry(self, biome, day, night, is_replace):
+        """Register a biome for search filtering and return its index track list - the row builders fill it
+        as they walk the tracks, so the selections are only iterated once per rebuild"""
+        self.all_track_data.append({'biome': biome, 'day': day, 'night': night, 'is_replace': is_replace})
+        category, biome_name = biome
+        index_entry = {'biome': biome, 'biome_text': f'{category} {biome_name}'.casefold(), 'tracks': []}
+        self.search_index.append(index_entry)
+        return index_entry['tracks']
+
+    def _sorted_selection_keys(self):
+        """(add keys, replace keys) sorted once per rebuild and shared by the row builders and the search index"""
+        add_selections = getattr(self.main_window, 'add_selections', {})
+        replace_selections = getattr(self.main_window, 'replace_selections', {})
+        return sorted(add_selections.keys()), sorted(replace_selections.keys())
+
+    def _build_rows(self, add_keys, replace_keys):
+        """Build the full row list for the current selections (keys come from _sorted_selection_keys).
+        Also rebuilds all_track_data and search_index in the same pass."""
+        # Check if we're in Both mode
+        patch_mode = getattr(self.main_window, 'patch_mode', 'add')
+        replace_selections = getattr(self.main_window, 'replace_selections', {})
+        add_selections = getattr(self.main_window, 'add_selections', {})
+
+        if TRACKS_VIEWER_DEBUG:
+            print(f'[TRACKS_VIEWER] patch_mode={patch_mode}, replace_selections={len(replace_selections)}, add_selections={len(add_selections)}')
+
+        rows = []
+        self.all_track_data = []
+        self.search_index = []  # Lightweight index for searching, filled by the section builders
+        self._flat_search_index = None  # Rebuilt on the next search
+
+        # Replace tracks stay searchable even when this mode doesn't list them
+        replace_shown = patch_mode in ('both', 'replace') and replace_selections
+        if not replace_shown:
+            for biome in replace_keys:
+                data = replace_selections[biome]
+                index_tracks = self._new_search_entry(biome, data.get('day', {}), data.get('night', {}), True)
+                for track_type in ('day', 'night'):
+                    for idx, track_path in data.get(track_type, {}).items():
+                        index_tracks.append((_track_file_name(track_path).casefold(), track_path, track_type == 'day', True, idx))
+
+        # 🆕 BOTH MODE: Show REPLACE tracks first, then ADD tracks
+        if patch_mode == 'both' and replace_selections:
+            if TRACKS_VIEWER_DEBUG:
+                print(f'[TRACKS_VIEWER] Both mode detected - showing Replace + Add tracks')
+
+            # SECTION 1: TRACKS TO REPLACE (use shared method)
+            self._display_replace_tracks_section(rows, replace_keys)
+
+            # SECTION 2: NEW TRACKS WILL BE ADDED (use shared method)
+            self._display_add_tracks_section(rows, add_keys)
+
+        # STANDARD MODE: Show ADD tracks only (Add or Replace mode)
+        else:
+            if TRACKS_VIEWER_DEBUG:
+                print(f'[TRACKS_VIEWER] Standard mode - showing Add tracks only')
+
+            # 🆕 REPLACE MODE: Show TRACKS TO REPLACE
+            if patch_mode == 'replace' and replace_selections:
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Replace mode detected - showing Replace tracks')
+
+                # Use shared helper method for Replace tracks display
+                self._display_replace_tracks_section(rows, replace_keys)
+
+            # 🆕 Check if Remove Vanilla Tracks is enabled (Add mode only)
+            remove_vanilla = getattr(self.main_window, 'remove_vanilla_tracks', False)
+            selected_biomes = getattr(self.main_window, 'selected_biomes', [])
+
+            if patch_mode == 'add' and remove_vanilla and selected_biomes:
+                # Show TRACKS REMOVED section with Cancel button
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Remove vanilla tracks enabled - showing removed tracks')
+                self._display_remove_vanilla_section(rows, selected_biomes)
+
+            if patch_mode == 'replace':
+                # In Replace mode, show ADD header only if there are Add selections
+                if add_selections:
+                    self._display_add_tracks_section(rows, add_keys)
+            else:
+                # In Add mode, always show ADD header and tracks
+                self._display_add_tracks_section(rows, add_keys)
+
+        return rows
+
+    def refresh_display(self, force=False):
+        """Schedule a rebuild of the tracks list - calls made in the same event-loop turn collapse into one"""
+        self._refresh_forced = self._refresh_forced or force
+        self._refresh_timer.start()
+
+    def _do_refresh_display(self, force=None):
+        """Rebuild the tracks list (skipped when the selections haven't changed, unless forced)"""
+        if force is None:
+            force = self._refresh_forced
+        self._refresh_forced = False
+        self._refresh_timer.stop()
         try:
-            print(f'[TRACKS_VIEWER] refresh_display() called')
-            
-            # Import for process events
-            from PyQt5.QtCore import QCoreApplication
-            
-            # Disable updates while building - prevents visual artifacts/bleeding
-            self.setUpdatesEnabled(False)
-            
-            # Scroll to top before clearing and rebuilding
-            self.scroll_area.verticalScrollBar().setValue(0)
-            
-            # Clear old widgets from content_layout (recursive helper)
-            def clear_all_layouts(layout):
-                """Recursively clear all widgets and nested layouts"""
-                while layout.count():
-                    item = layout.takeAt(0)
-                    if item.widget():
-                        widget = item.widget()
-                        widget.deleteLater()
-                    elif item.layout():
-                        clear_all_layouts(item.layout())
-                        
-            clear_all_layouts(self.content_layout)
-            
-            # Allow Qt to process user events (responsive UI) but don't redraw yet
-            QCoreApplication.processEvents()
-            
-            # Clear search to show all tracks again
+            if TRACKS_VIEWER_DEBUG:
+                print(f'[TRACKS_VIEWER] Rebuilding display')
+
+            # Clear search to show all tracks again, dropping any search still in flight so its
+            # (now stale) results can't replace the full list
             self.search_input.blockSignals(True)
             self.search_input.clear()
             self.search_input.blockSignals(False)
             self.current_search = ''
-            
-            # Reset track data
-            self.all_track_data = []
-            
-            # Check if we're in Both mode
-            patch_mode = getattr(self.main_window, 'patch_mode', 'add')
-            replace_selections = getattr(self.main_window, 'replace_selections', {})
-            add_selections = getattr(self.main_window, 'add_selections', {})
-            
-            print(f'[TRACKS_VIEWER] patch_mode={patch_mode}, replace_selections={len(replace_selections)}, add_selections={len(add_selections)}')
-            
-            # 🆕 BOTH MODE: Show REPLACE tracks first, then ADD tracks
-            if patch_mode == 'both' and replace_selections:
-                print(f'[TRACKS_VIEWER] Both mode detected - showing Replace + Add tracks')
-                
-                # SECTION 1: TRACKS TO REPLACE (use shared method)
-                self._display_replace_tracks_section()
-                
-                # SECTION 2: NEW TRACKS WILL BE ADDED (use shared method)
-                self._display_add_tracks_section()
-            
-            # STANDARD MODE: Show ADD tracks only (Add or Replace mode)
+            self.search_debounce_timer.stop()
+            self.current_search_id += 1
+            if self.search_worker:
+                self.search_worker.cancelled.set()
+
+            snapshot = self._selection_snapshot()
+            if force or snapshot != self._last_snapshot:
+                # One model update instead of tearing down and rebuilding widgets
+                # (the search index is collected in the same pass)
+                add_keys, replace_keys = self._sorted_selection_keys()
+                rows = self._build_rows(add_keys, replace_keys)
+                self.tracks_model.set_rows(rows)
+                self._last_snapshot = snapshot
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Display now has {len(rows)} rows')
             else:
-                print(f'[TRACKS_VIEWER] Standard mode - showing Add tracks only')
-                
-                # 🆕 REPLACE MODE: Show TRACKS TO REPLACE
-                if patch_mode == 'replace' and replace_selections:
-                    print(f'[TRACKS_VIEWER] Replace mode detected - showing Replace tracks')
-                    
-                    # Use shared helper method for Replace tracks display
-                    self._display_replace_tracks_section()
-                
-                # 🆕 Check if Remove Vanilla Tracks is enabled (Add mode only)
-                remove_vanilla = getattr(self.main_window, 'remove_vanilla_tracks', False)
-                selected_biomes = getattr(self.main_window, 'selected_biomes', [])
-                
-                if patch_mode == 'add' and remove_vanilla and selected_biomes:
-                    # Show TRACKS REMOVED section with Cancel button
-                    print(f'[TRACKS_VIEWER] Remove vanilla tracks enabled - showing removed tracks')
-                    
-                    # Header with title and cancel button
-                    remove_header_layout = QHBoxLayout()
-                    remove_header_label = QLabel('🗑️ VANILLA TRACKS WILL BE REMOVED (100% of your music guaranteed)')
-                    remove_header_label.setStyleSheet('color: #ff9999; font-weight: bold; font-size: 13px;')
-                    remove_header_label.setToolTip('Remove Mode: ONLY your custom music will play. ⚠️ Can conflict with other REPLACE-based music mods.')
-                    remove_header_layout.addWidget(remove_header_label)
-                    remove_header_layout.addStretch()
-                    
-                    cancel_remove_btn = QPushButton('✕ Cancel Remove')
-                    cancel_remove_btn.setFixedWidth(100)
-                    cancel_remove_btn.setStyleSheet('''QPushButton {
-                        background-color: #8b3a3a;
-                        color: white;
-                        font-size: 9px;
-                        padding: 3px;
-                        border-radius: 3px;
-                        border: 1px solid #a04a4a;
-                    }
-                    QPushButton:hover {
-                        background-color: #a04a4a;
-                        border: 1px solid #c05a5a;
-                    }''')
-                    cancel_remove_btn.setToolTip('Disable removing vanilla tracks')
-                    cancel_remove_btn.clicked.connect(self._on_cancel_remove_vanilla)
-                    remove_header_layout.addWidget(cancel_remove_btn)
-                    
-                    self.content_layout.addLayout(remove_header_layout)
-                    
-                    from utils.patch_generator import get_vanilla_tracks_for_biome
-                    
-                    for (category, biome_name) in sorted(selected_biomes):
-                        vanilla_data = get_vanilla_tracks_for_biome(category, biome_name)
-                        day_vanilla = vanilla_data.get('dayTracks', [])
-                        night_vanilla = vanilla_data.get('nightTracks', [])
-                        
-                        vanilla_count = len(day_vanilla) + len(night_vanilla)
-                        
-                        if vanilla_count > 0:
-                            print(f'[TRACKS_VIEWER] Remove: {category}/{biome_name}: {len(day_vanilla)} day, {len(night_vanilla)} night')
-                            
-                            # Biome header
-                            biome_header = QHBoxLayout()
-                            biome_label = QLabel(f'  📍 {category.upper()}: {biome_name}')
-                            biome_label.setStyleSheet('color: #ffcccc; font-weight: bold; font-size: 11px;')
-                            biome_header.addWidget(biome_label)
-                            
-                            count_label = QLabel(f'({vanilla_count} removal{"" if vanilla_count == 1 else "s"})')
-                            count_label.setStyleSheet('color: #ff9999; font-size: 9px;')
-                            biome_header.addWidget(count_label)
-                            biome_header.addStretch()
-                            
-                            self.content_layout.addLayout(biome_header)
-                            
-                            # Day vanilla tracks
-                            if day_vanilla:
-                                day_section = QVBoxLayout()
-                                day_title = QLabel(f'    🌅 Day ({len(day_vanilla)})')
-                                day_title.setStyleSheet('color: #FFD700; font-size: 10px;')
-                                day_section.addWidget(day_title)
-                                
-                                for track_path in day_vanilla:
-                                    track_name = Path(track_path).name
-                                    track_label = QLabel(f'      • {track_name}')
-                                    track_label.setStyleSheet('color: #e6ecff; font-size: 9px;')
-                                    day_section.addWidget(track_label)
-                                
-                                self.content_layout.addLayout(day_section)
-                            
-                            # Night vanilla tracks
-                            if night_vanilla:
-                                night_section = QVBoxLayout()
-                                night_title = QLabel(f'    🌙 Night ({len(night_vanilla)})')
-                                night_title.setStyleSheet('color: #87CEEB; font-size: 10px;')
-                                night_section.addWidget(night_title)
-                                
-                                for track_path in night_vanilla:
-                                    track_name = Path(track_path).name
-                                    track_label = QLabel(f'      • {track_name}')
-                                    track_label.setStyleSheet('color: #e6ecff; font-size: 9px;')
-                                    night_section.addWidget(track_label)
-                                
-                                self.content_layout.addLayout(night_section)
-                            
-                            self.content_layout.addSpacing(6)
-                    
-                    # Add separator before ADD tracks
-                    separator = QLabel('')
-                    separator.setStyleSheet('border-top: 1px solid #3a4a6a; margin: 12px 0px;')
-                    self.content_layout.addWidget(separator)
-                    
-                if patch_mode == 'replace':
-                    # In Replace mode, show ADD header only if there are Add selections
-                    if add_selections:
-                        self._display_add_tracks_section()
-                else:
-                    # In Add mode, always show ADD header and tracks
-                    self._display_add_tracks_section()
-            
-            # 🆕 Collect track data for search (after building full display)
-            self._collect_track_data()
-            
-            # Add stretch at end to push content to top (prevents floating blank space)
-            self.content_layout.addStretch()
-            
-            # Re-enable updates and redraw the completed display
-            self.setUpdatesEnabled(True)
-            self.update()  # Force full redraw now that we're done
-            
-            # Scroll to top to ensure clean display
-            self.scroll_area.verticalScrollBar().setValue(0)
+                if TRACKS_VIEWER_DEBUG:
+                    print(f'[TRACKS_VIEWER] Selections unchanged, keeping current rows')
+
+            # Leave any search results view and go back to the full list
+            self._show_model(self.tracks_model)
         except Exception as e:
             import traceback
             print(f'[TRACKS_VIEWER] Error in refresh_display: {e}')
             traceback.print_exc()
+
+    def _show_model(self, model):
+        """Point the list view at the full track list or at a search results model.
+        The previous results model (if any) is dropped in one deleteLater() - nothing is torn down row by row."""
+        if self.tracks_view.model() is not model:
+            self.tracks_view.setModel(model)
+        old_results = self.results_model
+        self.results_model = None if model is self.tracks_model else model
+        if old_results is not None and old_results is not model:
+            old_results.deleteLater()
+        self.tracks_view.scrollToTop()
     
-    def _collect_track_data(self):
-        """Collect all track data for search filtering"""
-        self.all_track_data = []
-        self.search_index = []  # Rebuild lightweight index for searching
-        
-        patch_mode = getattr(self.main_window, 'patch_mode', 'add')
-        replace_selections = getattr(self.main_window, 'replace_selections', {})
-        add_selections = getattr(self.main_window, 'add_selections', {})
-        
-        # Collect Replace tracks (in Both mode)
-        for biome in sorted(replace_selections.keys()):
-            data = replace_selections[biome]
-            biome_data = {
-                'biome': biome,
-                'day': data.get('day', {}),
-                'night': data.get('night', {}),
-                'is_replace': True
-            }
-            self.all_track_data.append(biome_data)
-            
-            # Add to search index
-            category, biome_name = biome
-            biome_text = f'{category} {biome_name}'.lower()
-            index_entry = {
-                'biome': biome,
-                'biome_text': biome_text,
-                'tracks': []
-            }
-            
-            # Index day tracks
-            for idx, path in data.get('day', {}).items():
-                track_name = Path(str(path)).name.lower()
-                index_entry['tracks'].append((track_name, path, True, True, idx))
-            
-            # Index night tracks
-            for idx, path in data.get('night', {}).items():
-                track_name = Path(str(path)).name.lower()
-                index_entry['tracks'].append((track_name, path, False, True, idx))
-            
-            if index_entry['tracks']:
-                self.search_index.append(index_entry)
-        
-        # Collect Add tracks (in both Add and Both mode)
-        for biome in sorted(add_selections.keys()):
-            data = add_selections[biome]
-            biome_data = {
-                'biome': biome,
-                'day': data.get('day', []),
-                'night': data.get('night', []),
-                'is_replace': False
-            }
-            self.all_track_data.append(biome_data)
-            
-            # Add to search index
-            category, biome_name = biome
-            biome_text = f'{category} {biome_name}'.lower()
-            index_entry = {
-                'biome': biome,
-                'biome_text': biome_text,
-                'tracks': []
-            }
-            
-            # Index day tracks
-            for path in data.get('day', []):
-                track_name = Path(str(path)).name.lower()
-                index_entry['tracks'].append((track_name, path, True, False, None))
-            
-            # Index night tracks
-            for path in data.get('night', []):
-                track_name = Path(str(path)).name.lower()
-                index_entry['tracks'].append((track_name, path, False, False, None))
-            
-            if index_entry['tracks']:
-                self.search_index.append(index_entry)
-    
-    def _display_filtered_results(self, filtered_data, total_count):
-        """Display the pre-filtered search results (called from worker thread)"""
-        # Scroll to top before clearing and rebuilding
-        self.scroll_area.verticalScrollBar().setValue(0)
-        
-        # Disable updates while building to keep UI responsive
-        self.setUpdatesEnabled(False)
-        
-        # Clear old widgets (recursive helper)
-        def clear_layout(layout):
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-                elif item.layout():
-                    clear_layout(item.layout())
-        
-        clear_layout(self.content_layout)
+    def _display_filtered_results(self, filtered_data, total_count, total_visible):
+        """Display the pre-filtered search results (called from worker thread) - the worker already counted
+        the matching tracks, so total_visible is shown as-is"""
+        # Typing another letter often matches the exact same tracks - keep the rows already on screen
+        if self.results_model is not None and (filtered_data, total_count) == self._shown_results:
+            return
+        self._shown_results = (filtered_data, total_count)
         
-        total_visible = 0
+        # Results become rows of a fresh model, filled while detached and then swapped into the view in one go
+        # (the view only paints what fits in the viewport)
+        rows = []
         
         # Process each biome's tracks
         for biome_data in filtered_data:
-            biome = biome_data['biome']
-            category, biome_name = biome
+            category, biome_name = biome_data['biome']
             is_replace = biome_data['is_replace']
             day_data = biome_data['day']
             night_data = biome_data['night']
             
             # Count total tracks for this biome
-            day_count = len(day_data)
-            night_count = len(night_data)
-            biome_total = day_count + night_count
-            
+            biome_total = len(day_data) + len(night_data)
             if biome_total == 0:
                 continue  # Skip empty biomes
             
-            # Display biome header
-            biome_header = QHBoxLayout()
-            biome_label = QLabel(f'  📍 {category.upper()}: {biome_name}')
-            biome_label.setStyleSheet('color: #ccffcc; font-weight: bold; font-size: 11px;')
-            biome_header.addWidget(biome_label)
-            
-            count_label = QLabel(f'({biome_total} track{"" if biome_total == 1 else "s"})')
-            count_label.setStyleSheet('color: #99ff99; font-size: 9px;')
-            biome_header.addWidget(count_label)
-            biome_header.addStretch()
-            
-            self.content_layout.addLayout(biome_header)
-            
-            # Display day tracks
-            if day_data:
-                day_section = QVBoxLayout()
-                day_title = QLabel(f'    🌅 Day')
-                day_title.setStyleSheet('color: #FFD700; font-size: 10px;')
-                day_section.addWidget(day_title)
-                
-                for idx, (key, track_path) in enumerate(day_data.items() if is_replace else enumerate(day_data)):
-                    track_name = Path(str(track_path)).name
-                    label_text = f'      • [{key}] {track_name}' if is_replace else f'      • {track_name}'
-                    
-                    # Create horizontal layout for track with delete button
-                    track_row = QHBoxLayout()
-                    track_row.setContentsMargins(0, 0, 0, 0)
-                    track_row.setSpacing(4)
-                    
-                    track_label = QLabel(label_text)
-                    track_label.setStyleSheet('color: #e6ecff; font-size: 9px;')
-                    track_row.addWidget(track_label)
-                    track_row.addStretch()
-                    
-                    # Add delete button for this track
-                    delete_btn = QPushButton('✕')
-                    delete_btn.setStyleSheet('background-color: #8B0000; color: white; border: none; font-size: 8px; padding: 1px 4px; border-radius: 2px;')
-                    delete_btn.setFixedSize(16, 16)
-                    delete_btn.setCursor(Qt.PointingHandCursor)
-                    delete_btn.clicked.connect(lambda checked=False, b=biome, t='day', p=track_path: self._remove_track_from_search_and_refresh(b, t, p))
-                    track_row.addWidget(delete_btn)
-                    
-                    day_section.addLayout(track_row)
-                    total_visible += 1
-                    
-                    # Allow UI to respond every 15 widgets
-                    if (idx + 1) % 15 == 0:
-                        QCoreApplication.processEvents()
-                
-                self.content_layout.addLayout(day_section)
-            
-            # Display night tracks
-            if night_data:
-                night_section = QVBoxLayout()
-                night_title = QLabel(f'    🌙 Night')
-                night_title.setStyleSheet('color: #87CEEB; font-size: 10px;')
-                night_section.addWidget(night_title)
-                
-                for idx, (key, track_path) in enumerate(night_data.items() if is_replace else enumerate(night_data)):
-                    track_name = Path(str(track_path)).name
-                    label_text = f'      • [{key}] {track_name}' if is_replace else f'      • {track_name}'
-                    
-                    # Create horizontal layout for track with delete button
-                    track_row = QHBoxLayout()
-                    track_row.setContentsMargins(0, 0, 0, 0)
-                    track_row.setSpacing(4)
-                    
-                    track_label = QLabel(label_text)
-                    track_label.setStyleSheet('color: #e6ecff; font-size: 9px;')
-                    track_row.addWidget(track_label)
-                    track_row.addStretch()
-                    
-                    # Add delete button for this track
-                    delete_btn = QPushButton('✕')
-                    delete_btn.setStyleSheet('background-color: #8B0000; color: white; border: none; font-size: 8px; padding: 1px 4px; border-radius: 2px;')
-                    delete_btn.setFixedSize(16, 16)
-                    delete_btn.setCursor(Qt.PointingHandCursor)
-                    delete_btn.clicked.connect(lambda checked=False, b=biome, t='night', p=track_path: self._remove_track_from_search_and_refresh(b, t, p))
-                    track_row.addWidget(delete_btn)
-                    
-                    night_section.addLayout(track_row)
-                    total_visible += 1
-                    
-                    # Allow UI to respond every 15 widgets
-                    if (idx + 1) % 15 == 0:
-                        QCoreApplication.processEvents()
-                
-                self.content_layout.addLayout(night_section)
+            rows.append(TrackRow('search_biome', category, biome_name, None, biome_total, None, None))
             
-            self.content_layout.addSpacing(6)
-        
-        self.content_layout.addStretch()
+            # Day tracks, then night tracks (Replace tracks keep their slot number)
+            for track_type, tracks in (('day', day_data), ('night', night_data)):
+                if not tracks:
+                    continue
+                rows.append(TrackRow('search_section', category, biome_name, track_type, None, None, None))
+                for key, track_path in (tracks.items() if is_replace else ((None, path) for path in tracks)):
+                    rows.append(TrackRow('search_track', category, biome_name, track_type, key, track_path, None))
         
-        # Re-enable updates and redraw
-        self.setUpdatesEnabled(True)
-        self.update()
+        results_model = TracksModel(self)
+        results_model.set_rows(rows)
+        self._show_model(results_model)
         
         # Update count display
-        if self.current_search:
-            self.count_label.setText(f'({total_visible} / {total_count})')
-            self.count_label.setStyleSheet('color: #FFD700; font-size: 10px; min-width: 60px; font-weight: bold;')
-        else:
-            self.count_label.setText(f'({total_visible} / {total_count})')
-            self.count_label.setStyleSheet('color: #b19cd9; font-size: 10px; min-width: 60px;')
+        self._set_count_text(f'({total_visible} / {total_count})', highlighted=bool(self.current_search))
+
+
+# The main window state patch generation reads, copied on the UI thread before the worker starts so the
+# worker never reads live widgets/selections while the user keeps clicking
+GenerationSnapshot = namedtuple('GenerationSnapshot', 'biomes patch_mode replace_selections add_selections '
+                                'day_tracks night_tracks remove_vanilla_tracks')
+
+
+def _generation_snapshot(main_window):
+    """Freeze the selection state for a PatchGenerationWorker (call on the UI thread)"""
+    import copy
+    return GenerationSnapshot(
+        biomes=list(getattr(main_window, 'selected_biomes', [])),
+        patch_mode=getattr(main_window, 'patch_mode', 'add'),
+        replace_selections=copy.deepcopy(getattr(main_window, 'replace_selections', {})),
+        add_selections=copy.deepcopy(getattr(main_window, 'add_selections', {})),
+        day_tracks=list(getattr(main_window, 'day_tracks', [])),
+        night_tracks=list(getattr(main_window, 'night_tracks', [])),
+        remove_vanilla_tracks=getattr(main_window, 'remove_vanilla_tracks', False),
+    )
 
 
 # Worker class for threaded patch generation
@@ -7366,16 +7569,27 @@ class PatchGenerationWorker(QThread):
     progress_update = pyqtSignal(str)  # Status message updates
     generation_complete = pyqtSignal(dict)  # Results when done: {success, results, error_msg}
     
-    def __init__(self, main_window, mod_name, format_choice):
+    def __init__(self, main_window, mod_name, format_choice, *, snapshot):
         super().__init__()
         self.main_window = main_window
         self.mod_name = mod_name
         self.format_choice = format_choice
+        self.snapshot = snapshot  # GenerationSnapshot from _generation_snapshot()
+        self._last_emit = 0.0
+    
+    PROGRESS_INTERVAL = 0.1  # Seconds between status emits (~10 Hz) - each one is a queued hop to the UI thread
+    
+    def _emit_progress(self, message, force=False):
+        """Emit a status message unless one went out less than PROGRESS_INTERVAL ago (force always emits)"""
+        now = time.monotonic()
+        if force or now - self._last_emit > self.PROGRESS_INTERVAL:
+            self.progress_update.emit(message)
+            self._last_emit = now
     
     def run(self):
         """Execute patch generation in background thread"""
         try:
-            self.progress_update.emit('🔧 Preparing patch generation...')
+            self._emit_progress('🔧 Preparing patch generation...', force=True)
             
             # Call the actual generation logic (this is mostly the original function)
             result = self._do_generation()
@@ -7395,31 +7609,68 @@ class PatchGenerationWorker(QThread):
                 'error_msg': str(e)
             })
     
+    PATCH_WORKERS = 8  # Biomes patched at once - generate_patch is mostly file copies and JSON I/O
+    
+    def _run_patch_jobs(self, mod_path, jobs):
+        """Run generate_patch for every (config, replace_selections) job and return (results in job order,
+        number of successful results).
+        Add-only biomes whose ADD tracks no other job copies fan out over a thread pool. Everything else stays
+        in order on one thread: replace jobs copy under the vanilla file's name, and every ADD track lands in
+        music/ under its basename, so jobs sharing a destination must keep the old last-one-wins outcome."""
+        from collections import Counter
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from utils.patch_generator import generate_patch
+        
+        if not jobs:
+            return [], 0
+        logger = self.main_window.logger
+        job_names = [{Path(str(track)).name for track in config.get('dayTracks', []) + config.get('nightTracks', [])}
+                     for config, _ in jobs]
+        name_counts = Counter(name for names in job_names for name in names)
+        with ThreadPoolExecutor(max_workers=min(self.PATCH_WORKERS, len(jobs))) as pool, \
+                ThreadPoolExecutor(max_workers=1) as replace_queue:
+            futures = {}
+            for (config, replace_sel), names in zip(jobs, job_names):
+                shared = any(name_counts[name] > 1 for name in names)
+                executor = replace_queue if replace_sel or shared else pool
+                future = executor.submit(generate_patch, str(mod_path), config, replace_selections=replace_sel, logger=logger)
+                futures[future] = config['biome']
+            for done, future in enumerate(as_completed(futures), 1):
+                self._emit_progress(f'🔧 Patched {futures[future]} ({done}/{len(jobs)})...')
+            # Dicts keep insertion order, so results come back in job order; result() re-raises a job's error
+            patch_results = []
+            success_count = 0
+            for future in futures:
+                result = future.result()
+                patch_results.append(result)
+                success_count += bool(result.get('success'))
+            return patch_results, success_count
+    
     def _do_generation(self):
         """The actual patch generation logic (moved from main thread)"""
         # This is the core of generate_patch_file() but returns a dict instead of updating UI
         try:
             import shutil
-            from utils.patch_generator import generate_patch
             from utils.atomicwriter import create_mod_folder_structure
             
             mod_name = self.mod_name
-            biomes = getattr(self.main_window, 'selected_biomes', [])
-            patch_mode = getattr(self.main_window, 'patch_mode', 'add')
-            replace_selections = getattr(self.main_window, 'replace_selections', {})
-            add_selections = getattr(self.main_window, 'add_selections', {})
-            day_tracks = getattr(self.main_window, 'day_tracks', [])
-            night_tracks = getattr(self.main_window, 'night_tracks', [])
-            remove_vanilla_tracks = getattr(self.main_window, 'remove_vanilla_tracks', False)
+            snapshot = self.snapshot
+            biomes = snapshot.biomes
+            patch_mode = snapshot.patch_mode
+            replace_selections = snapshot.replace_selections
+            add_selections = snapshot.add_selections
+            day_tracks = snapshot.day_tracks
+            night_tracks = snapshot.night_tracks
+            remove_vanilla_tracks = snapshot.remove_vanilla_tracks
             
             # Construct mod_path once and clear old patches before regeneration
-            starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+            starsound_dir = STARSOUND_DIR
             staging_dir = starsound_dir / 'staging'
-            safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+            safe_mod_name = _safe_mod_name(mod_name)
             mod_path = staging_dir / safe_mod_name
             
             # ✅ CRITICAL: Create mod folder structure with _metadata and required directories
-            self.progress_update.emit('📁 Creating mod folder structure...')
+            self._emit_progress('📁 Creating mod folder structure...')
             create_mod_folder_structure(staging_dir, safe_mod_name)
             self.main_window.logger.log(f'Created mod folder structure for: {safe_mod_name}', context='PatchGen')
             
@@ -7440,15 +7691,13 @@ class PatchGenerationWorker(QThread):
             except Exception as e:
                 self.main_window.logger.warn(f'Could not clear stray patch files: {e}')
             
-            patch_results = []
+            jobs = []  # (config, replace selections or None) per biome to patch, in display order
             
             # CASE A: Replace mode with individual selections
             if patch_mode == 'replace' and replace_selections:
-                self.progress_update.emit(f'🔧 Processing {len(biomes)} biome(s) in Replace mode...')
+                self._emit_progress(f'🔧 Processing {len(biomes)} biome(s) in Replace mode...')
                 
-                for idx, (biome_category, biome_name) in enumerate(biomes, 1):
-                    self.progress_update.emit(f'🔧 Patching {biome_name} ({idx}/{len(biomes)})...')
-                    
+                for biome_category, biome_name in biomes:
                     selections = replace_selections.get((biome_category, biome_name), {})
                     if not selections:
                         continue
@@ -7460,18 +7709,19 @@ class PatchGenerationWorker(QThread):
                         'patchMode': patch_mode
                     }
                     
-                    result = generate_patch(str(mod_path), config, replace_selections=selections, logger=self.main_window.logger)
-                    patch_results.append(result)
+                    jobs.append((config, selections))
             
             # CASE B: Both mode
             elif patch_mode == 'both' and replace_selections:
-                self.progress_update.emit(f'🔧 Processing {len(biomes)} biome(s) in Both mode...')
+                self._emit_progress(f'🔧 Processing {len(biomes)} biome(s) in Both mode...')
                 
-                both_mode_biomes = set(biomes) | set(replace_selections.keys())
+                # Selected biomes in the user's order, then any Replace-only biomes - no set/sort round-trip
+                ordered = dict.fromkeys(biomes)
+                for biome_key in replace_selections.keys():
+                    ordered.setdefault(biome_key, None)
+                both_mode_biomes = list(ordered.keys())
                 
-                for idx, (biome_category, biome_name) in enumerate(sorted(both_mode_biomes), 1):
-                    self.progress_update.emit(f'🔧 Patching {biome_name} ({idx}/{len(both_mode_biomes)})...')
-                    
+                for biome_category, biome_name in both_mode_biomes:
                     replace_sel = replace_selections.get((biome_category, biome_name), {})
                     add_sel = add_selections.get((biome_category, biome_name), {'day': [], 'night': []})
                     day_add_tracks = add_sel.get('day', [])
@@ -7494,18 +7744,15 @@ class PatchGenerationWorker(QThread):
                         'patchMode': 'both'
                     }
                     
-                    result = generate_patch(str(mod_path), config, replace_selections=replace_sel, logger=self.main_window.logger)
-                    patch_results.append(result)
+                    jobs.append((config, replace_sel))
             
             # CASE C: Standard Add/Replace
             else:
-                self.progress_update.emit(f'🔧 Processing {len(biomes)} biome(s) in Add mode...')
+                self._emit_progress(f'🔧 Processing {len(biomes)} biome(s) in Add mode...')
                 
                 has_add_selections = bool(add_selections)
                 
-                for idx, (biome_category, biome_name) in enumerate(biomes, 1):
-                    self.progress_update.emit(f'🔧 Patching {biome_name} ({idx}/{len(biomes)})...')
-                    
+                for biome_category, biome_name in biomes:
                     if has_add_selections:
                         biome_key = (biome_category, biome_name)
                         biome_tracks = add_selections.get(biome_key, {'day': [], 'night': []})
@@ -7537,10 +7784,11 @@ class PatchGenerationWorker(QThread):
                             'remove_vanilla_tracks': remove_vanilla_tracks
                         }
                     
-                    result = generate_patch(str(mod_path), config, logger=self.main_window.logger)
-                    patch_results.append(result)
+                    jobs.append((config, None))
+            
+            patch_results, success_count = self._run_patch_jobs(mod_path, jobs)
             
-            self.progress_update.emit('✅ Generation complete!')
+            self._emit_progress('✅ Generation complete!', force=True)
             
             # Clean up old backups folder in staging (if it exists)
             # All backups are now at root-level StarSound/backups/
@@ -7554,7 +7802,7 @@ class PatchGenerationWorker(QThread):
                 self.main_window.logger.warn(f'Could not clean up old backups folder: {e}')
             
             return {
-                'success': all(r.get('success') for r in patch_results) if patch_results else False,
+                'success': success_count > 0 and success_count == len(patch_results),
                 'patch_results': patch_results,
                 'error': None
             }
@@ -7578,11 +7826,21 @@ class ExportWorker(QThread):
         self.main_window = main_window
         self.mod_name = mod_name
         self.use_pak = use_pak
+        self._last_emit = 0.0
+    
+    PROGRESS_INTERVAL = 0.1  # Seconds between progress emits (~10 Hz) - each one is a queued hop to the UI thread
+    
+    def _emit_progress(self, payload):
+        """Emit a progress update unless one went out less than PROGRESS_INTERVAL ago - 0% and 100% always go out"""
+        now = time.monotonic()
+        if now - self._last_emit > self.PROGRESS_INTERVAL or payload.get('percentage', 0) in (0, 100):
+            self.progress_update.emit(payload)
+            self._last_emit = now
     
     def run(self):
         """Execute mod export in background thread"""
         try:
-            self.progress_update.emit({'message': '📦 Finding Starbound installation...', 'percentage': 10})
+            self._emit_progress({'message': '📦 Finding Starbound installation...', 'percentage': 10})
             result = self._do_export()
             self.export_complete.emit(result)
         except Exception as e:
@@ -7596,6 +7854,39 @@ class ExportWorker(QThread):
                 'error_msg': str(e)
             })
     
+    COPY_WORKERS = 8  # Parallel file copies - overlaps disk latency, the GIL is released during copy syscalls
+    PROGRESS_EVERY = 50  # Emit copy progress every N files instead of per file (avoids flooding the UI thread)
+    
+    @staticmethod
+    def _list_files(root):
+        """All files under root as (source path, path relative to root, size in bytes, mtime in ns) tuples - one
+        os.scandir walk, reusing the dir entries' cached type info instead of stat-ing every path again like
+        rglob + is_file. The stat comes from entry.stat(), which is free on Windows (cached by the directory
+        listing) and one lstat elsewhere - the copy then reuses it instead of stat-ing the source a second time."""
+        files = []
+        stack = [(str(root), '')]
+        while stack:
+            folder, rel_folder = stack.pop()
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_folder, entry.name) if rel_folder else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel_path))
+                    elif entry.is_file():
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((entry.path, rel_path, stat.st_size, stat.st_mtime_ns))
+        return files
+    
+    @staticmethod
+    def _copy_file(src_file, dst_file, mtime_ns):
+        """Copy one staged file's contents - Starbound never looks at file modes, so copy2's full stat copy
+        is skipped. mtime_ns comes from _list_files; the source's mtime is stamped on the copy so the next
+        export can tell the installed file is unchanged."""
+        import shutil
+        shutil.copyfile(src_file, dst_file)
+        os.utime(dst_file, ns=(mtime_ns, mtime_ns))
+        return dst_file
+    
     def _do_export(self):
         """The actual export logic"""
         try:
@@ -7603,21 +7894,23 @@ class ExportWorker(QThread):
             from utils.mod_exporter import export_mod_loose, export_mod_pak
             import shutil
             
-            self.progress_update.emit({'message': '📂 Preparing mod files...', 'percentage': 15})
+            self._emit_progress({'message': '📂 Preparing mod files...', 'percentage': 15})
             
             # Locate staging and Starbound
-            starsound_dir = Path(os.path.dirname(os.path.dirname(__file__)))
+            starsound_dir = STARSOUND_DIR
             staging_dir = starsound_dir / 'staging'
-            safe_mod_name = "".join(c for c in self.mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+            safe_mod_name = _safe_mod_name(self.mod_name)
             staging_mod_path = staging_dir / safe_mod_name
             
-            # Count total files for informational purposes
-            total_files = sum(1 for _ in staging_mod_path.rglob('*') if _.is_file())
+            # List the staged files once - gives the count now and the copy list later
+            staged_files = self._list_files(staging_mod_path) if staging_mod_path.is_dir() else []
+            total_files = len(staged_files)
+            total_bytes = sum(size for _, _, size, _ in staged_files)
             
-            self.progress_update.emit({'message': f'📊 {total_files} files to copy...', 'percentage': 25})
+            self._emit_progress({'message': f'📊 {total_files} files to copy...', 'percentage': 25})
             
             # Find Starbound installation
-            self.progress_update.emit({'message': '🔍 Locating Starbound installation...', 'percentage': 35})
+            self._emit_progress({'message': '🔍 Locating Starbound installation...', 'percentage': 35})
             starbound_path = find_starbound_folder()
             if not starbound_path:
                 return {
@@ -7630,10 +7923,10 @@ class ExportWorker(QThread):
             starbound_mods_path = Path(starbound_path) / 'mods'
             starbound_mods_path.mkdir(parents=True, exist_ok=True)
             
-            self.progress_update.emit({'message': f'📁 Destination: {starbound_mods_path}', 'percentage': 45})
+            self._emit_progress({'message': f'📁 Destination: {starbound_mods_path}', 'percentage': 45})
             
             # Export based on format selection
-            self.progress_update.emit({'message': f'💾 Starting mod export ({total_files} files)...', 'percentage': 55})
+            self._emit_progress({'message': f'💾 Starting mod export ({total_files} files)...', 'percentage': 55})
             
             if self.use_pak:
                 success, message, installed_path = export_mod_pak(
@@ -7650,49 +7943,83 @@ class ExportWorker(QThread):
                 
                 try:
                     target_mod_path = Path(installed_path)
+                    staged_rel_paths = {rel_path for _, rel_path, _, _ in staged_files}
                     
-                    # Delete existing mod folder to ensure clean installation (no old patches remain)
-                    if target_mod_path.exists():
-                        self.progress_update.emit({
-                            'message': f'🗑️  Removing old mod version...',
+                    # Update an existing install in place: remove files that are no longer staged (so no old
+                    # patches remain) and remember what's there, instead of deleting everything and re-copying
+                    installed = {}  # rel path -> (size, mtime in whole seconds) of files kept from the last export
+                    if target_mod_path.is_dir():
+                        self._emit_progress({
+                            'message': '🔁 Checking installed mod for changes...',
                             'percentage': 57
                         })
-                        import shutil
-                        shutil.rmtree(target_mod_path)
-                        self.main_window.logger.log(f'Deleted existing mod folder for clean reinstall: {target_mod_path}')
+                        removed_dirs = set()
+                        for dst_file, rel_path, size, mtime_ns in self._list_files(target_mod_path):
+                            if rel_path in staged_rel_paths:
+                                installed[rel_path] = (size, mtime_ns // 1_000_000_000)
+                            else:
+                                os.remove(dst_file)
+                                removed_dirs.add(os.path.dirname(dst_file))
+                        # Drop folders the removals left empty (deepest first; rmdir refuses non-empty ones)
+                        for folder in sorted(removed_dirs, key=len, reverse=True):
+                            while folder != str(target_mod_path):
+                                try:
+                                    os.rmdir(folder)
+                                except OSError:
+                                    break
+                                folder = os.path.dirname(folder)
                     
                     target_mod_path.mkdir(parents=True, exist_ok=True)
                     
-                    # Copy files and track progress
-                    files_copied = 0
-                    for src_file in staging_mod_path.rglob('*'):
-                        if src_file.is_file():
-                            files_copied += 1
-                            # Calculate relative path for display
-                            rel_path = src_file.relative_to(staging_mod_path)
-                            file_name = src_file.name
-                            
-                            # Emit per-file progress
-                            percentage = int(60 + (files_copied / max(total_files, 1)) * 30)  # 60-90%
-                            self.progress_update.emit({
-                                'message': f'📋 Copying: {file_name} ({files_copied}/{total_files})',
-                                'percentage': percentage
-                            })
-                            
-                            # Copy file
-                            dst_file = target_mod_path / rel_path
-                            dst_file.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(src_file, dst_file)
+                    # Create each destination folder once, skip files identical to the installed ones
+                    # (same size and mtime), then copy the rest in parallel
+                    copy_jobs = []
+                    files_done = bytes_copied = 0
+                    created_dirs = {str(target_mod_path)}
+                    for src_file, rel_path, size, mtime_ns in staged_files:
+                        if installed.get(rel_path) == (size, mtime_ns // 1_000_000_000):
+                            files_done += 1
+                            bytes_copied += size
+                            continue
+                        dst_file = os.path.join(str(target_mod_path), rel_path)
+                        dst_dir = os.path.dirname(dst_file)
+                        if dst_dir not in created_dirs:
+                            os.makedirs(dst_dir, exist_ok=True)
+                            created_dirs.add(dst_dir)
+                        copy_jobs.append((src_file, dst_file, size, mtime_ns))
+                    if installed:
+                        self.main_window.logger.log(
+                            f'Updating existing mod folder in place: {len(copy_jobs)} changed, '
+                            f'{files_done} unchanged: {target_mod_path}')
+                    
+                    from concurrent.futures import ThreadPoolExecutor
+                    with ThreadPoolExecutor(max_workers=self.COPY_WORKERS) as executor:
+                        # map() yields in order and re-raises the first copy error here
+                        copied = executor.map(lambda job: self._copy_file(job[0], job[1], job[3]), copy_jobs)
+                        for dst_file, (_, _, size, _) in zip(copied, copy_jobs):
+                            files_done += 1
+                            bytes_copied += size
+                            if files_done % self.PROGRESS_EVERY == 0 or files_done == total_files:
+                                # Progress by bytes so one big .ogg doesn't stall the bar; file count if all are empty
+                                if total_bytes:
+                                    done = bytes_copied / total_bytes
+                                else:
+                                    done = files_done / max(total_files, 1)
+                                percentage = int(60 + done * 30)  # 60-90%
+                                self._emit_progress({
+                                    'message': f'📋 Copying: {os.path.basename(dst_file)} ({files_done}/{total_files})',
+                                    'percentage': percentage
+                                })
                     
                 except Exception as e:
                     success = False
                     message = f'Failed to copy files: {e}'
                     installed_path = ''
             
-            self.progress_update.emit({'message': '⏳ Finalizing installation...', 'percentage': 90})
+            self._emit_progress({'message': '⏳ Finalizing installation...', 'percentage': 90})
             
             if success:
-                self.progress_update.emit({'message': '✅ Installation complete!', 'percentage': 100})
+                self._emit_progress({'message': '✅ Installation complete!', 'percentage': 100})
             
             return {
                 'success': success,
@@ -7747,88 +8074,3 @@ if __name__ == '__main__':
         
         sys.exit(1)
 
-
-# SearchFilterWorker - background thread for fast track searching
-class SearchFilterWorker(QThread):
-    """Background worker for filtering tracks - keeps UI responsive during search"""
-    filter_complete = pyqtSignal(list, int)  # Emits (filtered_data, total_count)
-    
-    def __init__(self, search_index, query):
-        super().__init__()
-        self.search_index = search_index  # Lightweight index of all tracks
-        self.query = query.lower().strip()  # Search query
-    
-    def run(self):
-        """Execute search in background thread"""
-        try:
-            if not self.query:
-                # No search - return all data
-                filtered_data = []
-                total_count = 0
-                # This shouldn't happen (called from UI), but handle it
-                self.filter_complete.emit([], 0)
-                return
-            
-            # Fast search through lightweight index
-            filtered_data = []
-            total_count = sum(len(entry['tracks']) for entry in self.search_index)
-            
-            for index_entry in self.search_index:
-                biome = index_entry['biome']
-                biome_text = index_entry['biome_text']
-                
-                # Check if biome matches
-                biome_matches = self.query in biome_text
-                
-                # Collect matching tracks
-                day_dict = {}
-                night_dict = {}
-                day_list = []
-                night_list = []
-                is_replace = None
-                
-                for track_name, track_path, is_day, is_replace_mode, key_idx in index_entry['tracks']:
-                    # Track matches if biome matches OR track name matches
-                    if biome_matches or self.query in track_name:
-                        is_replace = is_replace_mode
-                        
-                        if is_replace_mode:
-                            # Replace mode: store as dict with index
-                            if is_day:
-                                day_dict[key_idx] = track_path
-                            else:
-                                night_dict[key_idx] = track_path
-                        else:
-                            # Add mode: store as list
-                            if is_day:
-                                day_list.append(track_path)
-                            else:
-                                night_list.append(track_path)
-                
-                # Only include biome if it has matching tracks
-                if day_dict or night_dict or day_list or night_list:
-                    filtered_data.append({
-                        'biome': biome,
-                        'day': day_dict if is_replace else day_list,
-                        'night': night_dict if is_replace else night_list,
-                        'is_replace': is_replace
-                    })
-            
-            # Calculate total visible (only matching tracks)
-            total_visible = sum(
-                len(d['day']) + len(d['night']) 
-                for d in filtered_data
-            )
-            
-            # Emit results
-            self.filter_complete.emit(filtered_data, total_count)
-        
-        except Exception as e:
-            print(f'[SEARCH_ERROR] Error in search filter: {e}')
-            import traceback
-            traceback.print_exc()
-
-
-
-
-sys.exit(app.exec_())
@@ -1,11 +1,66 @@
+"""
+atomicwriter.py
+
+Handles automatic saving of mod progress into a 'staging' folder inside the StarSound directory.
+Ensures that mod data is backed up before generation for recovery and safety.
+"""
+
+import getpass
+import json
+import os
+import platform
 import shutil
-from utils.audio_utils import convert_to_ogg, get_audio_duration
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from utils.audio_utils import convert_to_ogg, get_audio_duration, sanitize_filename
 from utils.logger import get_logger
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Put src's bytes at dst without copying them when possible: a hard link if both folders are on the same
+    filesystem (O(1), no second copy of the OGG on disk), otherwise shutil.copy2 (which uses the OS copy calls itself).
+    """
+    try:
+        if os.stat(os.path.dirname(src)).st_dev == os.stat(os.path.dirname(dst)).st_dev:
+            try:
+                os.link(src, dst)
+            except FileExistsError:
+                os.remove(dst)
+                os.link(src, dst)
+            return
+    except OSError:
+        pass  # Cross-device, FAT/exFAT or no hard link support - fall back to a real copy
+    shutil.copy2(src, dst)
+
+@lru_cache(maxsize=256)
+def _audio_duration_at(file_path: str, mtime_ns: int):
+    """get_audio_duration keyed on the file's mtime - an edited file gets a new key, so it's probed again"""
+    return get_audio_duration(file_path)
+
+
+def cached_audio_duration(file_path: str):
+    """
+    Duration in minutes of an input file, probing it with ffprobe at most once per modification.
+    Returns None if the file can't be stat-ed or probed.
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+    return _audio_duration_at(file_path, mtime_ns)
+
 
 # Backup, convert, and copy audio for a mod
-def backup_and_convert_audio(file_path: str, mod_folder: str, bitrate: str = '192k', audio_filter: str = '', ffmpeg_log_callback=None, backup_path: str = None) -> tuple:
+def backup_and_convert_audio(file_path: str, mod_folder: str, bitrate: str = '192k', audio_filter: str = '', ffmpeg_log_callback=None, backup_path: str = None, input_duration: float = None) -> tuple:
     """
-    1. Backup the original file to backups/originals
+    1. Backup the original file to backups/originals (copied in the background while step 2 runs)
     2. Convert to OGG in backups/converted with specified bitrate and audio processing
     3. Check output duration (warn if suspiciously short - may indicate audio processing issue)
     4. Copy OGG to music folder
@@ -17,51 +72,97 @@ def backup_and_convert_audio(file_path: str, mod_folder: str, bitrate: str = '19
         audio_filter: FFmpeg audio filter chain (from build_audio_filter_chain)
         ffmpeg_log_callback: Optional callback for FFmpeg output logging
         backup_path: Optional path to root backups folder (e.g., StarSound/backups/{mod_name}). If None, uses legacy staging location.
+        input_duration: Optional duration (minutes) of file_path if the caller already probed it - skips an ffprobe
     
     Returns (success: bool, message: str, ogg_path: str)
     """
-    import os
-    base_name = os.path.splitext(os.path.basename(file_path))[0]
-    from utils.audio_utils import sanitize_filename
+    # Split the path once; the output paths below are built with f-strings (the folders come from
+    # os.path.join, so they never end in a separator)
+    file_name = os.path.split(file_path)[1]
+    base_name = os.path.splitext(file_name)[0]
     sanitized_base = sanitize_filename(base_name)
     # 1. Backup original file
     logger = get_logger()
-    logger.log(f'[DEBUG] backup_and_convert_audio: mod_folder={mod_folder}, backup_path={backup_path}')
+    logger.debug('backup_and_convert_audio', mod_folder=mod_folder, backup_path=backup_path)
     
     # Use provided backup_path (root location) or fallback to legacy staging location
-    if backup_path:
-        originals_dir = os.path.join(backup_path, 'originals')
-    else:
-        originals_dir = os.path.join(mod_folder, 'backups', 'originals')
-    
+    backups_root = backup_path if backup_path else os.path.join(mod_folder, 'backups')
+    originals_dir = os.path.join(backups_root, 'originals')
+    converted_dir = os.path.join(backups_root, 'converted')
+    music_dir = os.path.join(mod_folder, 'music')
     os.makedirs(originals_dir, exist_ok=True)
-    logger.log(f'[DEBUG] Attempting backup: {file_path} → {originals_dir}')
+    os.makedirs(converted_dir, exist_ok=True)
+    os.makedirs(music_dir, exist_ok=True)
+    
+    # Preflight: the backup is a full copy of the source and the OGG is estimated at 15% of it (no extra margin).
+    # The music/ copy is a hard link when it shares converted/'s filesystem, otherwise another OGG's worth.
+    # Each filesystem has to fit what lands on it - bail out before writing anything rather than halfway through
     try:
-        backup_file_path = os.path.join(originals_dir, os.path.basename(file_path))
-        shutil.copy2(file_path, backup_file_path)
-        logger.log(f'[DEBUG] ✓ Backup successful: {backup_file_path}')
+        src_size = os.path.getsize(file_path)
+        ogg_estimate = int(src_size * 0.15)
+        converted_dev = os.stat(converted_dir).st_dev
+        needed_by_device = {}  # st_dev -> [a folder on it, bytes needed there]
+        # (folder, bytes it needs, True if a hard link from converted/ can stand in for the copy)
+        destinations = ((originals_dir, src_size, False), (converted_dir, ogg_estimate, False), (music_dir, ogg_estimate, True))
+        for folder, size, linkable in destinations:
+            dev = os.stat(folder).st_dev
+            if linkable and dev == converted_dev:
+                size = 0
+            needed_by_device.setdefault(dev, [folder, 0])[1] += size
+        space = [(folder, needed, shutil.disk_usage(folder).free) for folder, needed in needed_by_device.values()]
+    except OSError:
+        space = []  # Can't tell - let the copy/convert report any real error
+    for folder, needed_bytes, free_bytes in space:
+        if free_bytes < needed_bytes:
+            msg = (f'Insufficient disk space: need ~{needed_bytes / 1048576:.0f} MB, '
+                   f'{free_bytes / 1048576:.0f} MB free for {folder}')
+            logger.error(f'{msg} ({file_name})')
+            return False, msg, ''
+    
+    logger.debug('Attempting backup', src=file_path, dst=originals_dir)
+    backup_file_path = f'{originals_dir}{os.sep}{file_name}'
+    # The backup copy and ffmpeg both only read the source, so the copy overlaps the conversion
+    # (ffmpeg is a subprocess - nothing holds the GIL while it works)
+    backup_executor = ThreadPoolExecutor(max_workers=1)
+    backup_future = backup_executor.submit(shutil.copy2, file_path, backup_file_path)
+    backup_executor.shutdown(wait=False)
+    # 2. Convert to OGG in backups/converted
+    ogg_path = f'{converted_dir}{os.sep}{sanitized_base}.ogg'
+    # The previous conversion may be hard-linked into music/ (step 3) - unlink it so ffmpeg writes a new file
+    # instead of overwriting the shared one in place
+    try:
+        os.remove(ogg_path)
+    except FileNotFoundError:
+        pass
+    logger.debug('Converting to: %s', ogg_path)
+    success, msg, parsed_input, parsed_output = convert_to_ogg(file_path, ogg_path, bitrate=bitrate, audio_filter=audio_filter, log_callback=ffmpeg_log_callback)
+    try:
+        backup_future.result()
+        logger.debug('✓ Backup successful: %s', backup_file_path)
     except Exception as e:
         logger.error(f'Failed to backup original: {e}')
         return False, f'Failed to backup original: {e}', ''
-    # 2. Convert to OGG in backups/converted
-    if backup_path:
-        converted_dir = os.path.join(backup_path, 'converted')
-    else:
-        converted_dir = os.path.join(mod_folder, 'backups', 'converted')
-    
-    os.makedirs(converted_dir, exist_ok=True)
-    ogg_path = os.path.join(converted_dir, sanitized_base + '.ogg')
-    logger.log(f'[DEBUG] Converting to: {ogg_path}')
-    success, msg = convert_to_ogg(file_path, ogg_path, bitrate=bitrate, audio_filter=audio_filter, log_callback=ffmpeg_log_callback)
     if not success:
         logger.error(f'Conversion failed: {msg}')
         return False, f'Conversion failed: {msg}', ''
-    logger.log(f'[DEBUG] ✓ Conversion successful: {ogg_path}')
+    logger.debug('✓ Conversion successful: %s', ogg_path)
     
     # 2.5. CHECK OUTPUT DURATION (detect audio processing issues)
-    output_duration = get_audio_duration(ogg_path)
-    input_duration = get_audio_duration(file_path)
-    logger.log(f'[DEBUG] Output duration check: input={input_duration:.1f}min, output={output_duration:.1f}min')
+    # ffmpeg already printed both lengths while converting - only fall back to ffprobe for what it didn't
+    output_duration = parsed_output
+    if input_duration is None:
+        input_duration = parsed_input
+    if output_duration is None and input_duration is None:
+        # Two independent ffprobe runs - overlap them so this waits for the slower one, not both
+        with ThreadPoolExecutor(max_workers=2) as probe_executor:
+            output_future = probe_executor.submit(get_audio_duration, ogg_path)
+            input_future = probe_executor.submit(cached_audio_duration, file_path)
+            output_duration, input_duration = output_future.result(), input_future.result()
+    elif output_duration is None:
+        output_duration = get_audio_duration(ogg_path)
+    elif input_duration is None:
+        input_duration = cached_audio_duration(file_path)
+    logger.debug('Output duration check (minutes)', input=input_duration, output=output_duration)
     
     if output_duration is not None and output_duration < 0.1:
         # Output is suspiciously short (less than 6 seconds)
@@ -76,22 +177,20 @@ def backup_and_convert_audio(file_path: str, mod_folder: str, bitrate: str = '19
             # Don't fail here, just warn - user might intentionally trim
     
     # 3. Copy OGG to music folder
-    music_dir = os.path.join(mod_folder, 'music')
-    os.makedirs(music_dir, exist_ok=True)
-    logger.log(f'[DEBUG] backup_and_convert_audio: music_dir={music_dir}')
-    music_ogg_path = os.path.join(music_dir, sanitized_base + '.ogg')
-    logger.log(f'[DEBUG] Copying OGG to: {music_ogg_path}')
+    logger.debug('backup_and_convert_audio', music_dir=music_dir)
+    music_ogg_path = f'{music_dir}{os.sep}{sanitized_base}.ogg'
+    logger.debug('Copying OGG to: %s', music_ogg_path)
     try:
-        shutil.copy2(ogg_path, music_ogg_path)
-        logger.log(f'[DEBUG] ✓ OGG copied to music folder: {music_ogg_path}')
+        _link_or_copy(ogg_path, music_ogg_path)
+        logger.debug('✓ OGG copied to music folder: %s', music_ogg_path)
     except Exception as e:
         logger.error(f'Failed to copy OGG to music: {e}')
         return False, f'Failed to copy OGG to music: {e}', music_ogg_path
-    logger.log(f'[DEBUG] ✓ Audio converted and copied to music: {music_ogg_path}')
+    logger.debug('✓ Audio converted and copied to music: %s', music_ogg_path)
     return True, f'Audio converted and copied to music: {music_ogg_path}', music_ogg_path
-# --- Platform Helper for Cross-Platform Support ---
-import platform
 
+
+# --- Platform Helper for Cross-Platform Support ---
 def get_platform():
     """
     Returns a string identifying the current platform: 'windows', 'linux', 'darwin' (macOS), or 'unknown'.
@@ -106,41 +205,45 @@ def get_platform():
     else:
         return 'unknown'
 
+# Neither the platform nor the home folder changes while the app runs - resolve them once at import
+_PLATFORM = get_platform()
+_HOME = Path.home()
+_DEFAULT_STARBOUND_PATHS = {
+    'windows': _HOME / 'AppData' / 'Local' / 'Steam' / 'steamapps' / 'common' / 'Starbound',
+    # Steam Deck and Linux default Steam library location
+    'linux': _HOME / '.steam' / 'steam' / 'steamapps' / 'common' / 'Starbound',
+    # macOS (rare, but possible)
+    'darwin': _HOME / 'Library' / 'Application Support' / 'Steam' / 'steamapps' / 'common' / 'Starbound',
+}
+
 def get_default_starbound_path():
     """
     Returns the default Starbound install path for the current platform.
     """
-    plat = get_platform()
-    if plat == 'windows':
-        return Path.home() / 'AppData' / 'Local' / 'Steam' / 'steamapps' / 'common' / 'Starbound'
-    elif plat == 'linux':
-        # Steam Deck and Linux default Steam library location
-        return Path.home() / '.steam' / 'steam' / 'steamapps' / 'common' / 'Starbound'
-    elif plat == 'darwin':
-        # macOS (rare, but possible)
-        return Path.home() / 'Library' / 'Application Support' / 'Steam' / 'steamapps' / 'common' / 'Starbound'
-    else:
-        return None
-import getpass
+    return _DEFAULT_STARBOUND_PATHS.get(_PLATFORM)
+
+# Leaf folders of a new mod - makedirs creates mod_folder and biomes/ on the way
+_MOD_SUBDIRS = (
+    'biomes/surface',
+    'biomes/underground',
+    'biomes/space',
+    'music',
+    'music_replacers',
+    'music_add_and_replace',
+    'outputs',
+)
+
 # --- New function: create_mod_folder_structure ---
 def create_mod_folder_structure(final_destination: Path, mod_name: str) -> Path:
     """
     Creates the full mod folder structure for a new mod, including subfolders and a _metadata file.
     Returns the path to the created mod folder.
     """
-    import os
     mod_folder = final_destination / mod_name
-    directories = [
-        'biomes/surface',
-        'biomes/underground',
-        'biomes/space',
-        'music',
-        'music_replacers',
-        'music_add_and_replace',
-        'outputs'
-    ]
-    for dir in directories:
-        (mod_folder / dir).mkdir(parents=True, exist_ok=True)
+    # Plain string joins - no Path object per subfolder
+    mod_folder_str = os.fspath(mod_folder)
+    for subdir in _MOD_SUBDIRS:
+        os.makedirs(f'{mod_folder_str}/{subdir}', exist_ok=True)
     
     # NOTE: backups/originals and backups/converted are no longer created in staging
     # They are now centralized in StarSound/backups/{mod_name}/ (root location)
@@ -158,22 +261,20 @@ def create_mod_folder_structure(final_destination: Path, mod_name: str) -> Path:
     }
     metadata_path = mod_folder / '_metadata'
     try:
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            import json
-            json.dump(metadata, f, indent=2)
+        # orjson is optional - same 2-space layout, much faster encoder when it's installed.
+        # Either way it's a single write call, no file object kept open across a with block
+        if orjson is not None:
+            metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            metadata_path.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
     except Exception as e:
         print(f"[AtomicWriter] Failed to write _metadata: {e}")
     return mod_folder
-"""
-atomicwriter.py
 
-Handles automatic saving of mod progress into a 'staging' folder inside the StarSound directory.
-Ensures that mod data is backed up before generation for recovery and safety.
-"""
-
-import json
-from pathlib import Path
-from datetime import datetime
+# Characters kept in staging folder names (ASCII letters/digits, space, underscore, hyphen)
+_STAGING_NAME_ALLOWED = frozenset(string.ascii_letters + string.digits + ' _-')
+# str.translate table that deletes every other ASCII character
+_STAGING_NAME_DELETE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _STAGING_NAME_ALLOWED))
 
 
 def save_mod_to_staging(mod_data: dict, mod_name: str, starsound_dir: Path) -> Path:
@@ -187,20 +288,30 @@ def save_mod_to_staging(mod_data: dict, mod_name: str, starsound_dir: Path) -> P
     staging_dir = starsound_dir / 'staging'
     staging_dir.mkdir(parents=True, exist_ok=True)
 
-    safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
-    folder_name = safe_mod_name
-    mod_folder = staging_dir / folder_name
-    # Handle duplicates: add ' Copy', ' Copy1', ' Copy2', etc.
+    if mod_name.isascii():
+        # Fast path: one C-level pass instead of a per-character generator
+        safe_mod_name = mod_name.translate(_STAGING_NAME_DELETE).rstrip()
+    else:
+        # Non-ASCII names keep accented/unicode letters but still lose symbols and emoji
+        safe_mod_name = "".join(c for c in mod_name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+    # Handle duplicates: add ' Copy', ' Copy2', ' Copy3', etc.
+    # mkdir(exist_ok=False) checks and claims the name in one step, so two saves can't pick the same folder
     copy_index = 0
-    while mod_folder.exists():
+    while True:
+        if copy_index == 0:
+            folder_name = safe_mod_name
+        elif copy_index == 1:
+            folder_name = f"{safe_mod_name} Copy"
+        else:
+            folder_name = f"{safe_mod_name} Copy{copy_index}"
+        mod_folder = staging_dir / folder_name
+        try:
+            mod_folder.mkdir(exist_ok=False)
+            break
+        except FileExistsError:
             copy_index += 1
-            if copy_index == 1:
-                folder_name = f"{safe_mod_name} Copy"
-            else:
-                folder_name = f"{safe_mod_name} Copy{copy_index}"
-            mod_folder = staging_dir / folder_name
 
-        # Create full mod folder structure and _metadata
+    # Create full mod folder structure and _metadata
     create_mod_folder_structure(staging_dir, folder_name)
 
     return mod_folder
@@ -1,6 +1,10 @@
 import re
 
 # --- Filename Sanitization ---
+_SEPARATORS_TO_UNDERSCORE = str.maketrans({' ': '_', '.': '_', '-': '_'})
+_NON_FILENAME_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+_REPEATED_UNDERSCORES = re.compile(r'_+')
+
 def sanitize_filename(name: str) -> str:
     """
     Converts a string to a safe filename:
@@ -11,9 +15,9 @@ def sanitize_filename(name: str) -> str:
     - Strips leading/trailing underscores
     - Falls back to hash if result is empty (handles Unicode-only filenames like Japanese)
     """
-    sanitized = name.replace(' ', '_').replace('.', '_').replace('-', '_')
-    sanitized = re.sub(r'[^a-zA-Z0-9_]', '', sanitized)
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = name.translate(_SEPARATORS_TO_UNDERSCORE)
+    sanitized = _NON_FILENAME_CHARS.sub('', sanitized)
+    sanitized = _REPEATED_UNDERSCORES.sub('_', sanitized)
     sanitized = sanitized.lower().strip('_')
     
     # EDGE CASE: If sanitization results in empty string (all special characters),
@@ -30,23 +34,6 @@ import subprocess
 import sys
 import shutil
 
-def ensure_ffmpeg_installed():
-    """
-    Ensures ffmpeg is available: always prefer local install in utils/ffmpeg-8.0.1-full_build/bin/ffmpeg.exe (Windows) or ffmpeg (Linux/Mac), fallback to PATH.
-    Returns (success: bool, message: str, ffmpeg_path: str)
-    """
-    import sys
-    ffmpeg_local = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin', 'ffmpeg.exe')
-    if os.path.isfile(ffmpeg_local):
-        return True, 'ffmpeg found in utils/ffmpeg-8.0.1-full_build/bin', ffmpeg_local
-    # Fallback: check PATH (cross-platform)
-    ffmpeg_name = 'ffmpeg.exe' if sys.platform.startswith('win') else 'ffmpeg'
-    import shutil
-    ffmpeg_path = shutil.which(ffmpeg_name)
-    if ffmpeg_path:
-        return True, 'ffmpeg found in PATH', ffmpeg_path
-    return False, 'ffmpeg not found in local folder or PATH', ''
-
 def convert_to_wav(input_path, output_path):
     """
     Converts input audio file to WAV using ffmpeg.
@@ -57,35 +44,49 @@ def convert_to_wav(input_path, output_path):
         return False, f"FFmpeg not available: {msg}"
     try:
         # Lower volume by 50% using ffmpeg's volume filter
-        cmd = [ffmpeg_path, '-y', '-i', input_path, '-filter:a', 'volume=0.3', output_path]
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
-        if result.returncode == 0:
+        # Nothing is parsed from the output, so ffmpeg only prints errors (no banner, stream info or progress)
+        threads = str(_ffmpeg_threads())
+        cmd = [ffmpeg_path, '-hide_banner', '-nostats', '-loglevel', 'error', '-y', '-threads', threads, '-i', input_path,
+               '-filter:a', 'volume=0.3', '-threads', threads, output_path]
+        returncode, last_lines = _run_ffmpeg_streaming(cmd)
+        if returncode == 0:
             return True, f"Converted to {output_path} (volume reduced)"
         else:
-            return False, f"ffmpeg error: {result.stderr}"
+            return False, "ffmpeg error: " + "\n".join(last_lines)
     except Exception as e:
         return False, f"Conversion failed: {e}"
 
-if __name__ == '__main__':
-    # Utility: Fix ship_confirm.wav from ship_confirm1.ogg
-    sfx_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sfx')
-    ogg_path = os.path.join(sfx_dir, 'ship_confirm1.ogg')
-    wav_path = os.path.join(sfx_dir, 'ship_confirm.wav')
-    ok, msg = convert_to_wav(ogg_path, wav_path)
-    print('WAV conversion:', msg)
 # audio_utils.py
 # Audio validation and conversion utilities for Starbound Music Mod Generator (Python)
 
+import csv
+import json
+import math
 import os
 import subprocess
 import sys
 import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from stat import S_ISREG
 
 # Maximum allowed audio file size (500 MB) - prevents crashes and playback issues in Starbound
 MAX_FILE_SIZE = 500 * 1024 * 1024
 
+_FFMPEG_BIN_DIR = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin')
+
+@lru_cache(maxsize=1)
 def ensure_ffmpeg_installed():
-    ffmpeg_local = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin', 'ffmpeg.exe')
+    """
+    Ensures ffmpeg is available: always prefer local install in utils/ffmpeg-8.0.1-full_build/bin/ffmpeg.exe (Windows) or ffmpeg (Linux/Mac), fallback to PATH.
+    Returns (success: bool, message: str, ffmpeg_path: str)
+    Resolved once per session - call ensure_ffmpeg_installed.cache_clear() after installing ffmpeg to look again.
+    """
+    ffmpeg_local = os.path.join(_FFMPEG_BIN_DIR, 'ffmpeg.exe')
     if os.path.isfile(ffmpeg_local):
         return True, 'ffmpeg found in utils/ffmpeg-8.0.1-full_build/bin', ffmpeg_local
     ffmpeg_name = 'ffmpeg.exe' if sys.platform.startswith('win') else 'ffmpeg'
@@ -94,21 +95,146 @@ def ensure_ffmpeg_installed():
         return True, 'ffmpeg found in PATH', ffmpeg_path
     return False, 'ffmpeg not found in local folder or PATH', ''
 
+@lru_cache(maxsize=1)
+def _ensure_ffprobe():
+    """
+    Path to ffprobe, found the same way as ffmpeg (local build first, then PATH). Resolved once per session.
+    Falls back to the local path when it's missing everywhere, so callers fail with a clear 'not found' error.
+    """
+    ffprobe_local = os.path.join(_FFMPEG_BIN_DIR, 'ffprobe.exe')
+    if os.path.isfile(ffprobe_local):
+        return ffprobe_local
+    return shutil.which('ffprobe.exe' if sys.platform.startswith('win') else 'ffprobe') or ffprobe_local
+
+def _ffmpeg_threads():
+    """ffmpeg -threads value for a single ffmpeg run: one thread per core"""
+    return max(1, os.cpu_count() or 1)
+
+def _run_ffmpeg_streaming(cmd, log_callback=None, tail=200, timeout=None, stall_timeout=None):
+    """
+    Run an ffmpeg command, reading its console output (stderr) line by line as it arrives instead of
+    buffering all of it - a long encode prints a progress line every fraction of a second.
+    log_callback gets every line; only the last `tail` lines are kept for error messages and parsing.
+    Raises subprocess.TimeoutExpired (after killing ffmpeg) if it runs longer than timeout seconds, or if
+    stall_timeout seconds pass without a new output line (a watchdog instead of a wall-clock limit -
+    pair it with -progress so a healthy run keeps printing however long it takes).
+    Returns (returncode, last_lines: list of str)
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, encoding='utf-8', errors='replace')
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+    if timer:
+        timer.daemon = True
+        timer.start()
+    
+    last_activity = [time.monotonic()]
+    finished = threading.Event()
+    
+    def watch_for_stall():
+        while not finished.wait(1.0):
+            if time.monotonic() - last_activity[0] > stall_timeout:
+                kill_on_timeout()
+                return
+    
+    if stall_timeout:
+        threading.Thread(target=watch_for_stall, daemon=True).start()
+    last_lines = deque(maxlen=tail)
+    try:
+        for line in process.stderr:
+            last_activity[0] = time.monotonic()
+            line = line.rstrip()
+            last_lines.append(line)
+            if log_callback:
+                log_callback(line)
+        process.stderr.close()
+        returncode = process.wait()
+    finally:
+        finished.set()
+        # A raising log_callback leaves the loop early - don't orphan ffmpeg blocked on a pipe nobody reads
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        if timer:
+            timer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout or stall_timeout)
+    return returncode, list(last_lines)
+
+
+@lru_cache(maxsize=256)
+def _probe_file_at(file_path, mtime_ns, size):
+    """Run ffprobe once for format + streams as JSON. mtime/size are only the cache key - an edited file is probed again"""
+    result = subprocess.run([
+        _ensure_ffprobe(), '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', file_path
+    ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+    # json.loads takes the raw bytes directly - no text-mode decode of the pipe
+    return json.loads(result.stdout)
+
+def _stat_regular_file(file_path):
+    """os.stat result if file_path is a regular file, else None - one stat call covering isfile() and getsize()"""
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return file_stat if S_ISREG(file_stat.st_mode) else None
+
+def _probe_file(file_path, file_stat=None):
+    """
+    ffprobe info for file_path ({'format': {...}, 'streams': [...]}), shared by the duration and format checks
+    so validating a file spawns one ffprobe instead of one per check. Raises on error (missing file, bad ffprobe output).
+    Pass file_stat if the caller already has os.stat(file_path). Treat the returned dict as read-only - it's the cached copy.
+    """
+    if file_stat is None:
+        file_stat = os.stat(file_path)
+    return _probe_file_at(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+def batch_probe(file_paths, max_workers=None):
+    """
+    Probe many files at once before they're validated one by one. The ffprobe runs overlap (each is a
+    subprocess, mostly start-up time), and the results land in _probe_file's cache, so the following
+    get_audio_duration / validate_file_duration / validate_file_format calls don't spawn anything.
+    Returns {file_path: probe info, or None if it couldn't be probed}
+    """
+    def probe_or_none(file_path):
+        try:
+            return _probe_file(file_path)
+        except Exception:
+            return None
+    
+    file_paths = list(dict.fromkeys(file_paths))  # Each file once, in order
+    if not file_paths:
+        return {}
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 2, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(file_paths, executor.map(probe_or_none, file_paths)))
+
+def _probe_duration_seconds(file_path, file_stat=None):
+    return float(_probe_file(file_path, file_stat)['format']['duration'])
 
 def validate_file_exists(file_path):
-    return os.path.isfile(file_path)
+    return _stat_regular_file(file_path) is not None
 
-def validate_file_size(file_path):
+def validate_file_size(file_path, file_stat=None):
     """
     Validates that audio file does not exceed 500MB size limit.
     Large files can crash the game or cause playback issues in Starbound.
+    file_stat: os.stat(file_path) if the caller already has it (saves the stat call here)
     Returns (valid: bool, file_size_mb: float, message: str)
     """
     try:
-        if not os.path.isfile(file_path):
+        if file_stat is None:
+            file_stat = _stat_regular_file(file_path)
+        if file_stat is None:
             return False, 0, f"File not found: {file_path}"
         
-        file_size = os.path.getsize(file_path)
+        file_size = file_stat.st_size
         file_size_mb = file_size / (1024 * 1024)
         
         if file_size > MAX_FILE_SIZE:
@@ -123,13 +249,8 @@ def validate_file_duration(file_path, max_minutes=30):
     Uses ffprobe to get audio duration in seconds.
     Returns (valid: bool, duration_seconds: float, message: str)
     """
-    ffprobe_path = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin', 'ffprobe.exe')
     try:
-        result = subprocess.run([
-            ffprobe_path, '-v', 'error', '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', file_path
-        ], capture_output=True, text=True, encoding='utf-8', errors='replace', check=True)
-        duration = float(result.stdout.strip())
+        duration = _probe_duration_seconds(file_path)
         duration_minutes = duration / 60
         if duration_minutes > max_minutes:
             return False, duration, f"File is {duration_minutes:.1f} minutes - exceeds {max_minutes} minute limit"
@@ -148,29 +269,56 @@ def get_audio_duration(file_path):
     Returns:
         float: Duration in minutes, or None if unable to determine
     """
-    ffprobe_path = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin', 'ffprobe.exe')
     try:
-        result = subprocess.run([
-            ffprobe_path, '-v', 'error', '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', file_path
-        ], capture_output=True, text=True, encoding='utf-8', errors='replace', check=True)
-        
-        duration_seconds = float(result.stdout.strip())
+        duration_seconds = _probe_duration_seconds(file_path)
         duration_minutes = duration_seconds / 60.0
         return duration_minutes
     except Exception as e:
         # Silently fail - return None if unable to get duration
         return None
 
+# Seconds without any ffmpeg progress output before a split is considered stuck and killed
+SPLIT_STALL_TIMEOUT = 60
+# -progress key/value lines; out_time_ms is the output position in microseconds (despite the name)
+_PROGRESS_OUT_TIME_RE = re.compile(r'^out_time_ms=(\d+)$')
+_PROGRESS_LINE_RE = re.compile(r'^\w+=\S*$')
+
+# Source codecs the splitter can stream-copy (no decode/re-encode), and the segment container each goes into.
+# Every PCM/FLAC frame is a keyframe, so the segment muxer can cut them anywhere
+_STREAM_COPY_SEGMENT_FORMATS = {
+    'pcm_s16le': 'wav',
+    'pcm_s24le': 'wav',
+    'pcm_f32le': 'wav',
+    'flac': 'flac',
+}
+
+def _remove_partial_segments(list_path, segment_pattern):
+    """Delete the segments a failed split left in the music folder: every one ffmpeg finished (listed in the
+    segment_list CSV) plus the next number, the one it was still writing"""
+    names = []
+    try:
+        with open(list_path, newline='', encoding='utf-8') as f:
+            names = [row[0] for row in csv.reader(f) if row]
+    except OSError:
+        pass
+    folder = os.path.dirname(segment_pattern)
+    paths = [os.path.join(folder, name) for name in names] + [segment_pattern % (len(names) + 1)]
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=None) -> dict:
     """
     Split audio file into manageable segments using FFmpeg.
     
-    Uses FFmpeg's segment muxer to split file into chunks without re-encoding
-    (fast operation, preserves quality). Output files are WAV format for lossless
-    processing. Final naming convention: original_track_part1.wav, original_track_part2.wav, etc.
+    Uses FFmpeg's segment muxer to split file into chunks. PCM WAV and FLAC sources are
+    stream-copied (no decode or re-encode, so the split is I/O-bound) into WAV/FLAC segments;
+    anything else is decoded to PCM WAV segments for lossless processing.
+    Final naming convention: original_track_part1.wav, original_track_part2.wav, etc. (.flac for FLAC sources)
     
-    WAV segments will later receive blanket audio processing before final OGG conversion.
+    Segments will later receive blanket audio processing before final OGG conversion.
     
     Args:
         file_path: Path to audio file to split
@@ -180,7 +328,7 @@ def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=No
     Returns:
         dict: {
             'success': bool,
-            'split_files': ['/path/to/part1.wav', '/path/to/part2.wav', ...],
+            'split_files': ['/path/to/part1.wav', '/path/to/part2.wav', ...],  # .flac for FLAC sources
             'segment_durations': [24.5, 24.3, 18.2],  # minutes per segment
             'segment_count': int,
             'message': str
@@ -199,8 +347,9 @@ def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=No
         segment_length_minutes = 25
     
     try:
-        # Validate input file exists
-        if not os.path.isfile(file_path):
+        # Validate input file exists (the same stat result keys the duration probe below)
+        file_stat = _stat_regular_file(file_path)
+        if file_stat is None:
             return {
                 'success': False,
                 'split_files': [],
@@ -209,8 +358,13 @@ def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=No
                 'message': f'File not found: {file_path}'
             }
         
-        # Get total duration
-        total_duration_minutes = get_audio_duration(file_path)
+        # Get total duration and the source codec (one cached ffprobe covers both)
+        try:
+            probe_info = _probe_file(file_path, file_stat)
+            total_duration_minutes = float(probe_info['format']['duration']) / 60.0
+        except Exception:
+            probe_info = None
+            total_duration_minutes = None
         if not total_duration_minutes:
             return {
                 'success': False,
@@ -223,16 +377,16 @@ def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=No
         # Calculate segment count and duration in seconds
         segment_length_seconds = segment_length_minutes * 60
         total_duration_seconds = total_duration_minutes * 60
-        segment_count = -(-int(total_duration_seconds) // segment_length_seconds)  # Ceiling division
+        # Ceiling on the float duration - truncating to whole seconds first could drop a short tail segment
+        segment_count = max(1, math.ceil(total_duration_seconds / segment_length_seconds))
         
         log_msg(f'Splitting {file_path} ({total_duration_minutes:.1f} min) into {segment_count} segments')
         log_msg(f'DEBUG: Using {segment_length_minutes} min per segment = {segment_length_seconds} seconds ({segment_length_seconds} -segment_time param)')
         
         # Get FFmpeg path
-        ffmpeg_dir = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin')
-        ffmpeg_path = os.path.join(ffmpeg_dir, 'ffmpeg.exe')
+        ffmpeg_found, _, ffmpeg_path = ensure_ffmpeg_installed()
         
-        if not os.path.isfile(ffmpeg_path):
+        if not ffmpeg_found:
             return {
                 'success': False,
                 'split_files': [],
@@ -241,81 +395,131 @@ def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=No
                 'message': 'FFmpeg not found'
             }
         
-        # Create temp directory for segment output
+        # Segments are written straight to their final names next to the source - no temp dir or renames
         input_dir = os.path.dirname(file_path)
-        temp_dir = os.path.join(input_dir, '.starsound_splits_temp')
-        os.makedirs(temp_dir, exist_ok=True)
+        # Get base filename without extension
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        
+        # PCM/FLAC sources are already lossless: copy the audio packets into the segments instead of transcoding
+        audio_streams = [st for st in (probe_info or {}).get('streams', []) if st.get('codec_type') == 'audio']
+        source_codec = audio_streams[0].get('codec_name') if audio_streams else None
+        copy_format = _STREAM_COPY_SEGMENT_FORMATS.get(source_codec)
+        segment_format = copy_format or 'wav'
+        segment_ext = '.' + segment_format
         
         # Run FFmpeg segment command
-        # -vn: Skip video streams (handles embedded cover art in MP3s)
         # -f segment: output format is segments
         # -segment_time: duration of each segment in seconds
-        # -segment_format: format of each segment (WAV for lossless)
+        # -segment_format: format of each segment (WAV, or FLAC when copying a FLAC source)
         # -reset_timestamps: reset timestamps for each segment (important for seamless playback)
-        # -c:a pcm_s16le: PCM 16-bit audio codec (standard for WAV, no quality loss)
+        # -segment_start_number: number segments from 1 so the pattern gives part1, part2, ...
+        # -segment_list (csv): ffmpeg's own manifest of the segments it wrote - "name,start,end" per line
+        # -progress pipe:2 -nostats: machine-readable progress on stderr (drives the log and the stall watchdog)
+        # -hide_banner -loglevel error: otherwise only errors, so a failure's message isn't buried in stream info
+        # Stream copy: -map 0:a:0 -c copy (first audio stream only, packets copied as-is - no decode)
+        # Otherwise: -vn skips video streams (embedded cover art in MP3s), -c:a pcm_s16le decodes to 16-bit PCM
         # Audio processing and final OGG conversion happens AFTER splitting
-        segment_pattern = os.path.join(temp_dir, 'segment_%03d.wav')
-        
-        cmd = [
-            ffmpeg_path,
-            '-i', file_path,
-            '-vn',  # ← NO VIDEO (skip embedded cover art, metadata, etc)
-            '-f', 'segment',
-            '-segment_time', str(segment_length_seconds),
-            '-segment_format', 'wav',
-            '-reset_timestamps', '1',
-            '-c:a', 'pcm_s16le',  # ← PCM audio (standard WAV codec, lossless)
-            '-y',  # Overwrite without asking
-            segment_pattern
-        ]
+        # Final naming: original_track_part1.wav, original_track_part2.wav, etc. ('%' in the name is escaped for the pattern)
+        segment_pattern = os.path.join(input_dir, base_name.replace('%', '%%') + '_part%d' + segment_ext)
+        list_fd, list_path = tempfile.mkstemp(prefix='starsound_segments_', suffix='.csv')
+        os.close(list_fd)
+        segment_list_args = ['-segment_list', list_path, '-segment_list_type', 'csv']
+        
+        if copy_format:
+            log_msg(f'Source is {source_codec} - stream-copying into {segment_format} segments (no re-encode)')
+            cmd = [
+                ffmpeg_path,
+                '-hide_banner', '-loglevel', 'error',
+                '-i', file_path,
+                '-progress', 'pipe:2', '-nostats',
+                '-map', '0:a:0',  # ← Audio only (skips embedded cover art, metadata, etc)
+                '-c', 'copy',  # ← Copy packets as-is, lossless and no CPU-bound decode
+                '-f', 'segment',
+                '-segment_time', str(segment_length_seconds),
+                '-segment_format', segment_format,
+                '-reset_timestamps', '1',
+                '-segment_start_number', '1',
+                *segment_list_args,
+                '-y',  # Overwrite without asking
+                segment_pattern
+            ]
+        else:
+            threads = str(_ffmpeg_threads())
+            cmd = [
+                ffmpeg_path,
+                '-hide_banner', '-loglevel', 'error',
+                '-threads', threads,  # Decoder threads (input side)
+                '-i', file_path,
+                '-progress', 'pipe:2', '-nostats',
+                '-vn',  # ← NO VIDEO (skip embedded cover art, metadata, etc)
+                '-f', 'segment',
+                '-segment_time', str(segment_length_seconds),
+                '-segment_format', 'wav',
+                '-reset_timestamps', '1',
+                '-segment_start_number', '1',
+                *segment_list_args,
+                '-c:a', 'pcm_s16le',  # ← PCM audio (standard WAV codec, lossless)
+                '-threads', threads,  # Encoder/filter threads (output side)
+                '-y',  # Overwrite without asking
+                segment_pattern
+            ]
+        
+        # Log progress every 10% instead of every progress block
+        next_report = [10]
+        
+        def on_progress_line(line):
+            match = _PROGRESS_OUT_TIME_RE.match(line)
+            if not match:
+                return
+            percent = min(100.0, int(match.group(1)) / 1e6 / total_duration_seconds * 100)
+            if percent >= next_report[0]:
+                log_msg(f'Progress: {percent:.0f}%')
+                next_report[0] = (int(percent) // 10 + 1) * 10
         
         log_msg(f'Running FFmpeg: {" ".join(cmd[:5])}...')
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=600)  # 10-minute timeout
-        
-        if result.returncode != 0:
-            return {
-                'success': False,
-                'split_files': [],
-                'segment_durations': [],
-                'segment_count': 0,
-                'message': f'FFmpeg error: {result.stderr}'
-            }
-        
-        # Get base filename without extension
-        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        completed = False
+        try:
+            # No wall-clock limit - long files just take longer; only a run that stops reporting progress is killed
+            returncode, last_lines = _run_ffmpeg_streaming(cmd, on_progress_line, stall_timeout=SPLIT_STALL_TIMEOUT)
+            
+            if returncode != 0:
+                return {
+                    'success': False,
+                    'split_files': [],
+                    'segment_durations': [],
+                    'segment_count': 0,
+                    'message': 'FFmpeg error: ' + '\n'.join(line for line in last_lines if not _PROGRESS_LINE_RE.match(line))
+                }
+            
+            # Collect the segments from ffmpeg's manifest - exact names and durations, no probing or guessing
+            with open(list_path, newline='', encoding='utf-8') as f:
+                segment_rows = [row for row in csv.reader(f) if len(row) >= 3]
+            completed = True
+        finally:
+            # Segments go straight into the user's folder - don't leave a failed or stalled run's parts behind
+            if not completed:
+                _remove_partial_segments(list_path, segment_pattern)
+            try:
+                os.remove(list_path)
+            except OSError:
+                pass
         
-        # Rename segments to follow naming convention
-        # segment_000.wav → base_name_part1.wav, base_name_part2.wav, etc.
         split_files = []
         segment_durations = []
         
-        for i in range(segment_count):
-            temp_file = os.path.join(temp_dir, f'segment_{i:03d}.wav')
-            
-            if not os.path.isfile(temp_file):
-                log_msg(f'Warning: Expected segment file not found: {temp_file}')
+        for name, start, end in (row[:3] for row in segment_rows):
+            final_path = os.path.join(input_dir, name)
+            if not os.path.isfile(final_path):
+                log_msg(f'Warning: Listed segment file not found: {final_path}')
                 continue
-            
-            # Final name: original_track_part1.wav, original_track_part2.wav, etc.
-            final_name = f'{base_name}_part{i + 1}.wav'
-            final_path = os.path.join(input_dir, final_name)
-            
-            # Move from temp to final location
-            shutil.move(temp_file, final_path)
             split_files.append(final_path)
             
-            # Get duration of this segment
-            segment_duration = get_audio_duration(final_path)
-            if segment_duration:
-                segment_durations.append(segment_duration)
-            
-            log_msg(f'Created: {final_name} ({segment_duration:.1f} min)' if segment_duration else f'Created: {final_name}')
+            segment_duration = max(0.0, float(end) - float(start)) / 60.0
+            segment_durations.append(segment_duration)
+            log_msg(f'Created: {name} ({segment_duration:.1f} min)')
         
-        # Cleanup temp directory
-        try:
-            os.rmdir(temp_dir)
-        except:
-            pass  # Dir might not be empty, that's okay
+        if len(split_files) != segment_count:
+            log_msg(f'Note: expected {segment_count} segments from the duration, ffmpeg wrote {len(split_files)}')
         
         log_msg(f'Successfully split into {len(split_files)} segments')
         
@@ -333,7 +537,7 @@ def split_audio_file(file_path: str, segment_length_minutes: int = 25, logger=No
             'split_files': [],
             'segment_durations': [],
             'segment_count': 0,
-            'message': 'FFmpeg operation timed out (took longer than 10 minutes)'
+            'message': f'FFmpeg stalled (no progress for {SPLIT_STALL_TIMEOUT} seconds)'
         }
     except Exception as e:
         return {
@@ -349,83 +553,69 @@ def validate_file_format(file_path):
     Uses ffprobe to check if file is OGG and 44100Hz.
     Returns (valid: bool, message: str)
     """
-    ffprobe_path = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin', 'ffprobe.exe')
     try:
-        result = subprocess.run([
-            ffprobe_path, '-v', 'error', '-select_streams', 'a:0',
-            '-show_entries', 'stream=codec_name,sample_rate',
-            '-of', 'default=noprint_wrappers=1', file_path
-        ], capture_output=True, text=True, encoding='utf-8', errors='replace', check=True)
-        lines = result.stdout.splitlines()
-        codec = None
-        sample_rate = None
-        for line in lines:
-            if line.startswith('codec_name='):
-                codec = line.split('=', 1)[1]
-            if line.startswith('sample_rate='):
-                sample_rate = line.split('=', 1)[1]
+        # First audio stream, same as ffprobe's -select_streams a:0
+        audio_streams = [st for st in _probe_file(file_path).get('streams', []) if st.get('codec_type') == 'audio']
+        codec = audio_streams[0].get('codec_name') if audio_streams else None
+        sample_rate = audio_streams[0].get('sample_rate') if audio_streams else None
         if codec != 'vorbis' or sample_rate != '44100':
             return False, f"File must be OGG (vorbis) and 44100Hz. Got codec={codec}, sample_rate={sample_rate}"
         return True, "OK"
     except Exception as e:
         return False, f"Error reading format: {e}"
 
+# astats summary lines ("[Parsed_astats_0 @ ...] Peak level dB: -0.512"), one per channel plus "Overall"
+_PEAK_LEVEL_RE = re.compile(r'Peak level dB:\s*(-?\d+(?:\.\d+)?|-?inf)', re.IGNORECASE)
+# How much of the file the quality check analyses - the start is enough for a volume heuristic
+QUALITY_CHECK_SECONDS = 60
+
 def check_audio_quality(file_path):
     """
     Check for audio quality issues: peak clipping, very low volume, etc.
     Returns (has_issues: bool, warnings: list_of_strings)
     
     Note: This is informational only. Invalid readings (like -inf dB) are skipped.
+    Only the first QUALITY_CHECK_SECONDS of the file are analysed.
     """
     warnings = []
-    ffmpeg_path, ffprobe_path = None, None
     
     try:
-        # Find ffmpeg paths
-        ffmpeg_dir = os.path.join(os.path.dirname(__file__), 'ffmpeg-8.0.1-full_build', 'bin')
-        ffmpeg_path = os.path.join(ffmpeg_dir, 'ffmpeg.exe')
-        ffprobe_path = os.path.join(ffmpeg_dir, 'ffprobe.exe')
+        # Find ffmpeg path
+        ffmpeg_found, _, ffmpeg_path = ensure_ffmpeg_installed()
         
-        if not os.path.isfile(ffmpeg_path) or not os.path.isfile(ffprobe_path):
+        if not ffmpeg_found:
             return False, []  # Skip check if ffmpeg not available
         
         # Check for peak levels using astats filter
+        threads = str(_ffmpeg_threads())
         cmd = [
             ffmpeg_path,
+            '-hide_banner', '-nostats',  # Only the astats summary is read - skip the banner and progress lines
+            '-threads', threads,
+            '-t', str(QUALITY_CHECK_SECONDS),  # Read only the start of the file
             '-i', file_path,
             '-af', 'astats=metadata=1:reset=1',
+            '-threads', threads,
             '-f', 'null',
             '-'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=10)
-        output = result.stderr  # ffmpeg stats go to stderr
-        
-        # Parse for peak values
-        peak_found = False
-        for line in output.split('\n'):
-            if 'Peak level dB' in line:
-                try:
-                    # Extract dB value (format: "Peak level dB: X.XXX")
-                    db_str = line.split(':')[-1].strip().split()[0]
-                    
-                    # Skip invalid readings
-                    if 'inf' in db_str.lower() or db_str == '-' or db_str == '':
-                        continue
-                    
-                    peak_db = float(db_str)
-                    peak_found = True
-                    
-                    # Warn if peak is very close to 0 dB (clipping risk)
-                    if peak_db > -1.0:
-                        warnings.append(f"⚠ WARNING: Audio peaks at {peak_db:.1f} dB (risk of distortion). Consider lowering source volume.")
-                    elif peak_db > -6.0:
-                        warnings.append(f"⚠ Audio peaks at {peak_db:.1f} dB. May need compression adjustment.")
-                    elif peak_db < -40.0 and peak_found:
-                        warnings.append(f"ℹ Audio soft (peaks at {peak_db:.1f} dB). Normalization can help if needed.")
-                    break  # Found valid peak, stop searching
-                except (ValueError, IndexError):
-                    continue
+        # astats prints its summary at the very end, so the default tail is plenty
+        _, last_lines = _run_ffmpeg_streaming(cmd, timeout=10)
+        output = '\n'.join(last_lines)  # ffmpeg stats go to stderr
+        
+        # Parse for peak values - the loudest channel decides (skip invalid -inf readings from silence)
+        peaks = [float(db) for db in _PEAK_LEVEL_RE.findall(output) if 'inf' not in db.lower()]
+        peak_db = max(peaks, default=None)
+        
+        if peak_db is not None:
+            # Warn if peak is very close to 0 dB (clipping risk)
+            if peak_db > -1.0:
+                warnings.append(f"⚠ WARNING: Audio peaks at {peak_db:.1f} dB (risk of distortion). Consider lowering source volume.")
+            elif peak_db > -6.0:
+                warnings.append(f"⚠ Audio peaks at {peak_db:.1f} dB. May need compression adjustment.")
+            elif peak_db < -40.0:
+                warnings.append(f"ℹ Audio soft (peaks at {peak_db:.1f} dB). Normalization can help if needed.")
         
         return len(warnings) > 0, warnings
         
@@ -436,6 +626,8 @@ def check_audio_quality(file_path):
         # Silently fail - this is optional quality checking
         return False, []
 
+_TIME_STRING_RE = re.compile(r'(?:([-+\d.]*)\s*hr)?\s*(?:([-+\d.]*)\s*m)?\s*(?:([-+\d.]*)\s*s)?')
+
 def parse_time_string(time_str: str) -> float:
     """
     Parse time string and return total seconds.
@@ -452,34 +644,38 @@ def parse_time_string(time_str: str) -> float:
     except ValueError:
         pass
     
+    # One match pulls out the hr/m/s numbers (any part may be missing; trailing text is ignored)
+    hours, minutes, seconds = _TIME_STRING_RE.match(time_str).groups()
     try:
-        hours = 0.0
-        minutes = 0.0
-        seconds = 0.0
-        
-        # Extract hours
-        if 'hr' in time_str:
-            hr_parts = time_str.split('hr', 1)
-            hours = float(hr_parts[0].strip()) if hr_parts[0].strip() else 0.0
-            time_str = hr_parts[1] if len(hr_parts) > 1 else ""
-        
-        # Extract minutes
-        if 'm' in time_str:
-            m_parts = time_str.split('m', 1)
-            m_str = m_parts[0].strip()
-            minutes = float(m_str) if m_str else 0.0
-            time_str = m_parts[1] if len(m_parts) > 1 else ""
-        
-        # Extract seconds
-        if 's' in time_str:
-            s_str = time_str.split('s', 1)[0].strip()
-            seconds = float(s_str) if s_str else 0.0
-        
-        total = hours * 3600.0 + minutes * 60.0 + seconds
-        return total
-    except (ValueError, IndexError, AttributeError):
+        return float(hours or 0.0) * 3600.0 + float(minutes or 0.0) * 60.0 + float(seconds or 0.0)
+    except ValueError:
         return 0.0
 
+# Print the option dump / final chain on every build_audio_filter_chain call. Off by default - the chain
+# for each file is already shown in the FFmpeg log by convert_to_ogg.
+DEBUG_FILTER_CHAIN = False
+
+# Fixed filter strings for the presets (Stage 4 and Stage 6 below)
+_COMPRESSION_PRESETS = {
+    # Threshold in linear scale: -20dB = 0.1
+    'gentle': 'acompressor=threshold=0.1:ratio=4:attack=0.05:release=0.05',
+    # Threshold in linear scale: -15dB = 0.178
+    'moderate': 'acompressor=threshold=0.178:ratio=6:attack=0.02:release=0.03',
+    # Threshold in linear scale: -10dB = 0.316
+    'aggressive': 'acompressor=threshold=0.316:ratio=8:attack=0.01:release=0.01',
+}
+# NOTE: Gains are conservative to avoid clipping after loudness boost stages
+_EQ_PRESETS = {
+    # Bass boost +2dB (was +3), mid unchanged, treble -1.5dB (was -2)
+    'warm': ('lowshelf=f=200:g=2', 'equalizer=f=1000:g=0:w=0.7', 'highshelf=f=8000:g=-1.5'),
+    # Bass +1.5dB (was +2), mid +0.5dB (was +1), treble -2dB (was -3)
+    'dark': ('lowshelf=f=200:g=1.5', 'equalizer=f=1000:g=0.5:w=0.7', 'highshelf=f=8000:g=-2'),
+    # Bass flat, mid +0.5dB (was +1) @ 1kHz, treble +2dB (was +3) @ 5kHz
+    'bright': ('equalizer=f=1000:g=0.5:w=0.7', 'highshelf=f=5000:g=2'),
+}
+_DEBUG_OPTION_KEYS = ('trim', 'silence_trim', 'sonic_scrubber', 'compression', 'soft_clip', 'eq',
+                      'de_esser', 'normalize', 'stereo_to_mono', 'fade')
+
 def build_audio_filter_chain(audio_processing_options: dict, file_duration_minutes: float = None) -> str:
     """
     Constructs FFmpeg audio filter chain based on selected processing options.
@@ -514,24 +710,43 @@ def build_audio_filter_chain(audio_processing_options: dict, file_duration_minut
     
     Returns: FFmpeg filter chain string (empty if no processing selected)
     """
-    filters = []
-    
     # LOG: Show what tools are enabled
-    print("[AUDIO TOOLS DEBUG] Checking audio processing options:")
-    print(f"  - trim: {audio_processing_options.get('trim')}")
-    print(f"  - silence_trim: {audio_processing_options.get('silence_trim')}")
-    print(f"  - sonic_scrubber: {audio_processing_options.get('sonic_scrubber')}")
-    print(f"  - compression: {audio_processing_options.get('compression')}")
-    print(f"  - soft_clip: {audio_processing_options.get('soft_clip')}")
-    print(f"  - eq: {audio_processing_options.get('eq')}")
-    print(f"  - de_esser: {audio_processing_options.get('de_esser')}")
-    print(f"  - normalize: {audio_processing_options.get('normalize')}")
-    print(f"  - stereo_to_mono: {audio_processing_options.get('stereo_to_mono')}")
-    print(f"  - fade: {audio_processing_options.get('fade')}")
-    
-    # SAFETY CHECK: If silence_trim is True, log it loudly
-    if audio_processing_options.get('silence_trim'):
-        print("[AUDIO TOOLS DEBUG] ⚠️ WARNING: SILENCE_TRIM IS ENABLED - This will remove leading/trailing silence!")
+    if DEBUG_FILTER_CHAIN:
+        print("[AUDIO TOOLS DEBUG] Checking audio processing options:")
+        for key in _DEBUG_OPTION_KEYS:
+            print(f"  - {key}: {audio_processing_options.get(key)}")
+        
+        # SAFETY CHECK: If silence_trim is True, log it loudly
+        if audio_processing_options.get('silence_trim'):
+            print("[AUDIO TOOLS DEBUG] ⚠️ WARNING: SILENCE_TRIM IS ENABLED - This will remove leading/trailing silence!")
+    
+    # A batch usually shares one options dict, so identical options reuse the cached string
+    try:
+        frozen_options = tuple(sorted((key, _freeze_option(value)) for key, value in audio_processing_options.items()))
+        hash(frozen_options)
+        final_filter = _build_audio_filter_chain_cached(frozen_options, file_duration_minutes)
+    except TypeError:
+        # Something unhashable (or unsortable) in the options - build it uncached
+        final_filter = _build_audio_filter_chain_cached.__wrapped__(tuple(audio_processing_options.items()), file_duration_minutes)
+    
+    if DEBUG_FILTER_CHAIN:
+        print(f"[AUDIO TOOLS DEBUG] Final filter chain: {final_filter if final_filter else '(EMPTY - no processing selected)'}")
+    return final_filter
+
+def _freeze_option(value):
+    """Hashable stand-in for an option value (lists -> tuples, dicts -> sorted item tuples)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_option(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_option(item)) for key, item in value.items()))
+    return value
+
+@lru_cache(maxsize=32)
+def _build_audio_filter_chain_cached(frozen_options, file_duration_minutes):
+    """build_audio_filter_chain's work, keyed on the options as a sorted (key, value) tuple. Debug output stays in the wrapper"""
+
+    audio_processing_options = dict(frozen_options)
+    filters = []
     
     # Stage 1: Audio Trimmer (precise start/end time control)
     # Applied first so all downstream effects work on the trimmed segment
@@ -597,15 +812,7 @@ def build_audio_filter_chain(audio_processing_options: dict, file_duration_minut
     # Stage 4: Compression
     if audio_processing_options.get('compression'):
         preset = audio_processing_options.get('compression_preset', 'moderate').lower()
-        if preset == 'gentle':
-            # Threshold in linear scale: -20dB = 0.1
-            filters.append('acompressor=threshold=0.1:ratio=4:attack=0.05:release=0.05')
-        elif preset == 'aggressive':
-            # Threshold in linear scale: -10dB = 0.316
-            filters.append('acompressor=threshold=0.316:ratio=8:attack=0.01:release=0.01')
-        else:  # moderate (default)
-            # Threshold in linear scale: -15dB = 0.178
-            filters.append('acompressor=threshold=0.178:ratio=6:attack=0.02:release=0.03')
+        filters.append(_COMPRESSION_PRESETS.get(preset, _COMPRESSION_PRESETS['moderate']))  # moderate (default)
     
     # Stage 5: Soft Clipping/Limiting
     # More aggressive to protect against clipping from filter stages
@@ -618,20 +825,7 @@ def build_audio_filter_chain(audio_processing_options: dict, file_duration_minut
     # Peak limiting happens before EQ to catch any peaks from gain changes
     if audio_processing_options.get('eq'):
         preset = audio_processing_options.get('eq_preset', 'bright').lower()
-        if preset == 'warm':
-            # Bass boost +2dB (was +3), mid unchanged, treble -1.5dB (was -2)
-            filters.append('lowshelf=f=200:g=2')
-            filters.append('equalizer=f=1000:g=0:w=0.7')
-            filters.append('highshelf=f=8000:g=-1.5')
-        elif preset == 'dark':
-            # Bass +1.5dB (was +2), mid +0.5dB (was +1), treble -2dB (was -3)
-            filters.append('lowshelf=f=200:g=1.5')
-            filters.append('equalizer=f=1000:g=0.5:w=0.7')
-            filters.append('highshelf=f=8000:g=-2')
-        else:  # bright (default)
-            # Bass flat, mid +0.5dB (was +1) @ 1kHz, treble +2dB (was +3) @ 5kHz
-            filters.append('equalizer=f=1000:g=0.5:w=0.7')
-            filters.append('highshelf=f=5000:g=2')
+        filters.extend(_EQ_PRESETS.get(preset, _EQ_PRESETS['bright']))  # bright (default)
     
     # Stage 7: De-Esser (Reduce sibilance - harsh S/T sounds)
     if audio_processing_options.get('de_esser'):
@@ -677,7 +871,8 @@ def build_audio_filter_chain(audio_processing_options: dict, file_duration_minut
             fade_out_duration = parse_time_string(str(fade_out_duration))
             
             # LOG: Show fade parameters for debugging
-            print(f"[AUDIO TOOLS DEBUG] Fade settings: in={fade_in}s, out_start={fade_out_start}s, out_duration={fade_out_duration}s, file_duration={file_duration_minutes}min")
+            if DEBUG_FILTER_CHAIN:
+                print(f"[AUDIO TOOLS DEBUG] Fade settings: in={fade_in}s, out_start={fade_out_start}s, out_duration={fade_out_duration}s, file_duration={file_duration_minutes}min")
             
             filters.append(f'afade=t=in:st=0:d={fade_in}')
             filters.append(f'afade=t=out:st={fade_out_start}:d={fade_out_duration}')
@@ -687,28 +882,70 @@ def build_audio_filter_chain(audio_processing_options: dict, file_duration_minut
             pass
     
     # Join all filters with commas
-    final_filter = ','.join(filters) if filters else ''
-    print(f"[AUDIO TOOLS DEBUG] Final filter chain: {final_filter if final_filter else '(EMPTY - no processing selected)'}")
-    return final_filter
+    return ','.join(filters) if filters else ''
+
+# ffmpeg prints the input's length when it opens it ("Duration: 00:03:21.45, start: ...") and the encoded
+# position on every progress line ("... time=00:03:21.40 bitrate=..."); the last time= is the output length
+_FFMPEG_DURATION_RE = re.compile(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+_FFMPEG_TIME_RE = re.compile(r'time=(\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
+def _ffmpeg_minutes(match):
+    """HH:MM:SS.ss regex match -> minutes"""
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 60 + int(minutes) + float(seconds) / 60.0
 
-def convert_to_ogg(input_path, output_path, bitrate='192k', audio_filter='', log_callback=None):
+
+def _parse_ffmpeg_durations(lines):
+    """(input minutes, output minutes) read from ffmpeg's console output, None for whichever wasn't printed"""
+    input_minutes = output_minutes = None
+    for line in lines:
+        if input_minutes is None:
+            match = _FFMPEG_DURATION_RE.search(line)
+            if match:
+                input_minutes = _ffmpeg_minutes(match)
+        for match in _FFMPEG_TIME_RE.finditer(line):
+            output_minutes = _ffmpeg_minutes(match)
+    return input_minutes, output_minutes
+
+
+# build_audio_filter_chain's Stage 1 trim, always the first filter when present
+_LEADING_ATRIM_RE = re.compile(r'^atrim=start=([\d.]+):end=([\d.]+)(?:,|$)')
+
+
+def _trim_to_input_seek(audio_filter):
+    """
+    Turn a leading atrim filter into input options: (['-ss', start, '-to', end], rest of the chain).
+    atrim decodes everything up to the end point and throws the start away; -ss/-to on the input make
+    ffmpeg seek straight to the start instead. Returns ([], audio_filter) when the chain doesn't start with atrim.
+    """
+    match = _LEADING_ATRIM_RE.match(audio_filter or '')
+    if not match:
+        return [], audio_filter
+    start, end = match.groups()
+    return ['-ss', start, '-to', end], audio_filter[match.end():]
+
+
+def convert_to_ogg(input_path, output_path, bitrate='192k', audio_filter='', log_callback=None, threads=None):
     """
     Converts input audio file to OGG Vorbis 44100Hz stereo using ffmpeg.
     If log_callback is provided, streams ffmpeg output to it in real time.
-    Returns (success: bool, message: str)
+    threads: ffmpeg -threads limit. Defaults to 2 (libvorbis gains little beyond that), or 1 on a single-core machine.
+    Returns (success: bool, message: str, input_minutes, output_minutes) - the durations are parsed from
+    ffmpeg's own output (None if it didn't print them), so callers don't need separate ffprobe runs.
     """
     # Validate file size before attempting conversion (prevents crashes/issues in Starbound)
     valid, file_size_mb, size_msg = validate_file_size(input_path)
     if not valid:
         if log_callback:
             log_callback(f"File size validation failed: {size_msg}")
-        return False, size_msg
+        return False, size_msg, None, None
     
     success, msg, ffmpeg_path = ensure_ffmpeg_installed()
     if not success:
         if log_callback:
             log_callback(f"FFmpeg not available: {msg}")
-        return False, f"FFmpeg not available: {msg}"
+        return False, f"FFmpeg not available: {msg}", None, None
     try:
         # LOG: Show what we're about to do
         if log_callback:
@@ -720,37 +957,55 @@ def convert_to_ogg(input_path, output_path, bitrate='192k', audio_filter='', log
             else:
                 log_callback(f"[DEBUG] Audio Filter Chain: (NONE - no processing)")
         
+        if not threads:
+            threads = min(2, _ffmpeg_threads())
+        # Trim by seeking the input rather than decoding and discarding everything before the start
+        seek_args, audio_filter = _trim_to_input_seek(audio_filter)
+        # -threads before -i limits the decoder, the second one (below) the filters/encoder
+        # No -nostats/-loglevel here: the Duration line and the time= stats are parsed below, only the banner goes
         cmd = [
-            ffmpeg_path, '-y', '-i', input_path,
+            ffmpeg_path, '-hide_banner', '-y', '-threads', str(threads), *seek_args, '-i', input_path,
             '-vn', '-acodec', 'libvorbis', '-ar', '44100', '-ac', '2', '-b:a', bitrate
         ]
         
         # Add audio filter if provided
         if audio_filter:
             cmd.extend(['-af', audio_filter])
+        cmd.extend(['-threads', str(threads)])
         
         cmd.append(output_path)
         
-        if log_callback:
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding='utf-8', errors='replace', bufsize=1)
-            for line in process.stdout:
-                # Suppress non-critical FFmpeg warnings about clipping
-                # These are now handled by the pre-limiter stage in the filter chain
-                if 'clipping' not in line.lower():
-                    log_callback(line.rstrip())
-            process.stdout.close()
-            returncode = process.wait()
-            if returncode == 0:
-                return True, f"Converted to {output_path}"
-            else:
-                return False, f"ffmpeg error: nonzero exit code {returncode}"
+        # The input 'Duration:' line comes early and can scroll out of the kept tail - hold on to it
+        duration_lines = []
+        
+        def on_line(line):
+            if not duration_lines and 'Duration:' in line:
+                duration_lines.append(line)
+            # Suppress non-critical FFmpeg warnings about clipping
+            # These are now handled by the pre-limiter stage in the filter chain
+            if log_callback and 'clipping' not in line.lower():
+                log_callback(line)
+        
+        returncode, last_lines = _run_ffmpeg_streaming(cmd, on_line)
+        input_minutes, output_minutes = _parse_ffmpeg_durations(duration_lines + last_lines)
+        if returncode == 0:
+            return True, f"Converted to {output_path}", input_minutes, output_minutes
+        elif log_callback:
+            return False, f"ffmpeg error: nonzero exit code {returncode}", input_minutes, output_minutes
         else:
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
-            if result.returncode == 0:
-                return True, f"Converted to {output_path}"
-            else:
-                return False, f"ffmpeg error: {result.stderr}"
+            return False, "ffmpeg error: " + '\n'.join(last_lines), input_minutes, output_minutes
     except Exception as e:
         if log_callback:
             log_callback(f"Conversion failed: {e}")
-        return False, f"Conversion failed: {e}"
+        return False, f"Conversion failed: {e}", None, None
+
+
+# Runs after everything above is defined - convert_to_wav needs ensure_ffmpeg_installed, _ffmpeg_threads
+# and _run_ffmpeg_streaming from further down
+if __name__ == '__main__':
+    # Utility: Fix ship_confirm.wav from ship_confirm1.ogg
+    sfx_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sfx')
+    ogg_path = os.path.join(sfx_dir, 'ship_confirm1.ogg')
+    wav_path = os.path.join(sfx_dir, 'ship_confirm.wav')
+    ok, msg = convert_to_wav(ogg_path, wav_path)
+    print('WAV conversion:', msg)
@@ -3,11 +3,25 @@
 import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def validate_json_file(path):
+    # Parse straight from bytes (no text-mode decode); orjson when installed, called once per mod's _metadata
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except Exception as e:
+        return False, None, str(e)
+    if orjson is not None:
+        try:
+            return True, orjson.loads(raw), None
+        except Exception:
+            pass  # orjson is stricter (NaN/Infinity, big ints) - let the stdlib parser have the final say
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return True, data, None
+        return True, json.loads(raw), None
     except Exception as e:
         return False, None, str(e)
 
@@ -34,8 +48,13 @@ def check_starbound_config(config_path):
                 info.append(f"✓ {file} JSON is valid")
     # Check mods directory
     mods_path = os.path.join(config_path, 'mods')
-    if os.path.isdir(mods_path):
-        mod_dirs = [d for d in os.listdir(mods_path) if os.path.isdir(os.path.join(mods_path, d)) and not d.startswith('.')]
+    mods_exists = os.path.isdir(mods_path)
+    mod_dirs = []
+    if mods_exists:
+        # One scandir pass: DirEntry.is_dir() comes from the directory listing itself (no stat per entry),
+        # and the list is reused by the metadata check below instead of listing the folder again
+        with os.scandir(mods_path) as entries:
+            mod_dirs = [entry.name for entry in entries if not entry.name.startswith('.') and entry.is_dir()]
         if mod_dirs:
             info.append(f"✓ StarSound export directory exists with {len(mod_dirs)} generated mod(s)")
             building_mods = [d for d in mod_dirs if d.endswith('_BUILDING')]
@@ -54,28 +73,34 @@ def check_starbound_config(config_path):
     # Check player directory
     player_path = os.path.join(config_path, 'player')
     if os.path.isdir(player_path):
-        player_files = [f for f in os.listdir(player_path) if f.endswith('.player') and not f.startswith('.')]
-        if player_files:
-            info.append(f"✓ Player directory exists with {len(player_files)} character(s)")
+        # Characters and total entries tallied in the same pass
+        player_count = 0
+        entry_count = 0
+        with os.scandir(player_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                entry_count += 1
+                if entry.name.endswith('.player'):
+                    player_count += 1
+        if player_count:
+            info.append(f"✓ Player directory exists with {player_count} character(s)")
         else:
-            all_files = [f for f in os.listdir(player_path) if not f.startswith('.')]
-            info.append(f"✓ Player directory exists ({len(all_files)} file(s) total, no characters created yet)")
+            info.append(f"✓ Player directory exists ({entry_count} file(s) total, no characters created yet)")
     else:
         warnings.append("Player directory not found (will be created on first launch)")
     # Advanced checks: mod metadata
     corrupted_count = 0
     checked_count = 0
-    if os.path.isdir(mods_path):
-        for d in os.listdir(mods_path):
-            mod_dir = os.path.join(mods_path, d)
-            if os.path.isdir(mod_dir) and not d.startswith('.'):
-                metadata_path = os.path.join(mod_dir, '_metadata')
-                if os.path.isfile(metadata_path):
-                    valid, _, _ = validate_json_file(metadata_path)
-                    checked_count += 1
-                    if not valid:
-                        corrupted_count += 1
-                        warnings.append(f'Mod "{d}" has corrupted _metadata file')
+    if mods_exists:
+        for d in mod_dirs:
+            metadata_path = os.path.join(mods_path, d, '_metadata')
+            if os.path.isfile(metadata_path):
+                valid, _, _ = validate_json_file(metadata_path)
+                checked_count += 1
+                if not valid:
+                    corrupted_count += 1
+                    warnings.append(f'Mod "{d}" has corrupted _metadata file')
         if checked_count > 0:
             if corrupted_count == 0:
                 info.append(f"✓ Checked {checked_count} mod(s) - all metadata files valid")
@@ -1,140 +1,145 @@
+import glob
 import os
+import re
+from collections import deque
+
+# Known benign Starbound log messages - one case-insensitive pattern, so a line is classified in a single scan
+_BENIGN_RE = re.compile(
+    r'vortex|mods_go_here|unrecognized file|discord|could not find.*asset|asset.*could not find'
+    r'|could not find sound|unknown item|shader|opengl|warning',
+    re.IGNORECASE)
+# Most recent lines kept per category - a runaway log can't fill memory with QListWidget rows
+MAX_REPORTED_LINES = 1000
+
+# Lines with [Error], [Exception], [CRITICAL], or 'fatal' (critical unless they also match a benign pattern)
+_CRITICAL_RE = re.compile(r'\[error\]|\[exception\]|\[critical\]|fatal', re.IGNORECASE)
 
 def read_starbound_log(log_path):
     """
     Analyze a Starbound log file and return critical and benign errors.
+    The log is streamed line by line; only the last MAX_REPORTED_LINES of each kind are returned,
+    criticalCount/benignCount have the full totals.
     """
     if not os.path.isfile(log_path):
         return {'success': False, 'message': 'Log file does not exist.'}
-    with open(log_path, encoding='utf-8', errors='replace') as f:
-        lines = f.readlines()
-    critical_errors = []
-    benign_errors = []
-    for line in lines:
-        if is_critical_error(line):
-            critical_errors.append(line.strip())
-        elif is_benign_error(line):
-            benign_errors.append(line.strip())
+    critical_errors = deque(maxlen=MAX_REPORTED_LINES)
+    benign_errors = deque(maxlen=MAX_REPORTED_LINES)
+    critical_count = 0
+    benign_count = 0
+    with open(log_path, 'rb') as f:
+        for raw_line in f:
+            line = raw_line.decode('utf-8', 'replace')
+            kind = classify_line(line)
+            if kind == 'benign':
+                benign_errors.append(line.strip())
+                benign_count += 1
+            elif kind == 'critical':
+                critical_errors.append(line.strip())
+                critical_count += 1
     return {
         'success': True,
-        'criticalErrors': critical_errors,
-        'benignErrors': benign_errors
+        'criticalErrors': list(critical_errors),
+        'benignErrors': list(benign_errors),
+        'criticalCount': critical_count,
+        'benignCount': benign_count
     }
 
+def classify_line(line):
+    """
+    'benign', 'critical' or None for one log line. Benign is checked first: a critical-looking line that
+    matches a benign pattern is benign. At most two regex searches, no lower().
+    """
+    if _BENIGN_RE.search(line):
+        return 'benign'
+    if _CRITICAL_RE.search(line):
+        return 'critical'
+    return None
+
 def is_critical_error(line):
     # Heuristic: lines with [Error], [Exception], [CRITICAL], or 'fatal' not matching benign patterns
-    lower = line.lower()
-    if '[error]' in lower or '[exception]' in lower or '[critical]' in lower or 'fatal' in lower:
-        if not is_benign_error(line):
-            return True
-    return False
+    return classify_line(line) == 'critical'
 
 def is_benign_error(line):
     # Known benign Starbound log messages
-    lower = line.lower()
-    if 'vortex' in lower:
-        return True
-    if 'mods_go_here' in lower:
-        return True
-    if 'unrecognized file' in lower:
-        return True
-    if 'discord' in lower:
-        return True
-    if 'could not find' in lower and 'asset' in lower:
-        return True
-    if 'could not find sound' in lower:
-        return True
-    if 'unknown item' in lower:
-        return True
-    if 'shader' in lower or 'opengl' in lower:
-        return True
-    if 'warning' in lower:
-        return True
-    return False
+    return classify_line(line) == 'benign'
+
+def _pattern(*words):
+    """Case-insensitive regex matching any of the given literal substrings"""
+    return re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+
+# explain_starbound_error's rules, checked in order: (topic, [(detail, explanation), ...], fallback for the topic)
+_ERROR_EXPLANATIONS = [
+    (_pattern('music', 'audio', 'sound'), [
+        (_pattern('not found', 'cannot find'), 'Audio file not found. Check that your music file exists at the specified path.'),
+        (_pattern('format', 'unsupported'), 'Unsupported audio format. Make sure your music files are in .ogg format.'),
+        (_pattern('decode', 'corrupt'), 'Audio file is corrupted or unreadable. Try re-encoding your music files.'),
+    ], 'Audio file issue. Verify your music files and try re-adding them.'),
+    (_pattern('json', 'patch'), [
+        (_pattern('parse', 'syntax'), 'JSON format error in patch file. Check for missing commas, quotes, or brackets.'),
+        (_pattern('not found'), 'Patch cannot find the target location in assets. Verify biome/path names are correct.'),
+        (_pattern('operation', 'invalid'), 'Invalid patch operation. Ensure your patch follows Starbound format rules.'),
+    ], 'Issue with patch file. Re-generate your mod patch and try again.'),
+    (_pattern('asset', 'file', 'path'), [
+        (_pattern('not found', 'missing'), 'Required file or directory not found. Check your mod folder structure.'),
+        (_pattern('permission', 'access denied'), 'Permission denied. Try running Starbound as Administrator or check file permissions.'),
+        (_pattern('duplicate'), 'Duplicate file or conflict detected. Remove duplicate entries from your patch.'),
+    ], 'File system issue. Verify your mod folder structure is correct.'),
+    (_pattern('mod', 'load'), [
+        (_pattern('dependency'), 'Mod dependency issue. This mod requires another mod to be loaded first.'),
+        (_pattern('conflict'), 'Mod conflict detected. Disable conflicting mods and try again.'),
+        (_pattern('version', 'compatibility'), 'Mod compatibility issue. Update your mods to compatible versions.'),
+    ], 'Mod loading issue. Check mod compatibility and dependencies.'),
+    (_pattern('memory', 'out of', 'too many'), [], 'Out of memory. Close other programs and restart Starbound.'),
+    (_pattern('crash', 'exception', 'fatal'), [], 'Game crashed. Check mod compatibility and disable conflicting mods.'),
+    (_pattern('server', 'connect', 'network'), [], 'Server connection issue. Check your internet connection.'),
+]
 
 def explain_starbound_error(error):
-    lower = error.lower()
-    if 'music' in lower or 'audio' in lower or 'sound' in lower:
-        if 'not found' in lower or 'cannot find' in lower:
-            return 'Audio file not found. Check that your music file exists at the specified path.'
-        if 'format' in lower or 'unsupported' in lower:
-            return 'Unsupported audio format. Make sure your music files are in .ogg format.'
-        if 'decode' in lower or 'corrupt' in lower:
-            return 'Audio file is corrupted or unreadable. Try re-encoding your music files.'
-        return 'Audio file issue. Verify your music files and try re-adding them.'
-    if 'json' in lower or 'patch' in lower:
-        if 'parse' in lower or 'syntax' in lower:
-            return 'JSON format error in patch file. Check for missing commas, quotes, or brackets.'
-        if 'not found' in lower:
-            return 'Patch cannot find the target location in assets. Verify biome/path names are correct.'
-        if 'operation' in lower or 'invalid' in lower:
-            return 'Invalid patch operation. Ensure your patch follows Starbound format rules.'
-        return 'Issue with patch file. Re-generate your mod patch and try again.'
-    if 'asset' in lower or 'file' in lower or 'path' in lower:
-        if 'not found' in lower or 'missing' in lower:
-            return 'Required file or directory not found. Check your mod folder structure.'
-        if 'permission' in lower or 'access denied' in lower:
-            return 'Permission denied. Try running Starbound as Administrator or check file permissions.'
-        if 'duplicate' in lower:
-            return 'Duplicate file or conflict detected. Remove duplicate entries from your patch.'
-        return 'File system issue. Verify your mod folder structure is correct.'
-    if 'mod' in lower or 'load' in lower:
-        if 'dependency' in lower:
-            return 'Mod dependency issue. This mod requires another mod to be loaded first.'
-        if 'conflict' in lower:
-            return 'Mod conflict detected. Disable conflicting mods and try again.'
-        if 'version' in lower or 'compatibility' in lower:
-            return 'Mod compatibility issue. Update your mods to compatible versions.'
-        return 'Mod loading issue. Check mod compatibility and dependencies.'
-    if 'memory' in lower or 'out of' in lower or 'too many' in lower:
-        return 'Out of memory. Close other programs and restart Starbound.'
-    if 'crash' in lower or 'exception' in lower or 'fatal' in lower:
-        return 'Game crashed. Check mod compatibility and disable conflicting mods.'
-    if 'server' in lower or 'connect' in lower or 'network' in lower:
-        return 'Server connection issue. Check your internet connection.'
+    for topic, details, fallback in _ERROR_EXPLANATIONS:
+        if topic.search(error):
+            for detail, explanation in details:
+                if detail.search(error):
+                    return explanation
+            return fallback
     return 'Error detected. Check logs for more details or verify mod installation.'
 
+# get_benign_error_explanation's rules, checked in order (same patterns as _BENIGN_RE)
+_BENIGN_EXPLANATIONS = [
+    (_pattern('vortex.deployment.json'), 'Vortex mod manager message that enables Vortex to manage mods in your Starbound folder. Safe to ignore.'),
+    (_pattern('mods_go_here'), 'Starbound folder reminder. It is how Starbound organizes it\'s mod folder. Safe to ignore.'),
+    (_pattern('unrecognized file'), 'Unrecognized file warning. Usually harmless, but may indicate a file with metadata issues such as incorrect file names or missing attributes.'),
+    (_pattern('discord'), 'Discord integration warning. Safe to ignore.'),
+    (re.compile(r'could not find.*asset|asset.*could not find', re.IGNORECASE), 'Missing asset warning. Usually harmless unless mod is missing content.'),
+    (_pattern('could not find sound'), 'Missing sound warning. Usually harmless unless it affects gameplay or mod functionality.'),
+    (_pattern('unknown item'), 'Unknown item warning. Usually harmless unless it affects gameplay or mod functionality.'),
+    (_pattern('shader', 'opengl'), 'Graphics driver or shader warning. Safe to ignore.'),
+    (_pattern('warning'), 'General warning. Usually not critical.'),
+]
+
 def get_benign_error_explanation(error):
-    lower = error.lower()
-    if 'vortex.deployment.json' in lower:
-        return 'Vortex mod manager message that enables Vortex to manage mods in your Starbound folder. Safe to ignore.'
-    if 'mods_go_here' in lower:
-        return 'Starbound folder reminder. It is how Starbound organizes it\'s mod folder. Safe to ignore.'
-    if 'unrecognized file' in lower:
-        return 'Unrecognized file warning. Usually harmless, but may indicate a file with metadata issues such as incorrect file names or missing attributes.'
-    if 'discord' in lower:
-        return 'Discord integration warning. Safe to ignore.'
-    if 'could not find' in lower and 'asset' in lower:
-        return 'Missing asset warning. Usually harmless unless mod is missing content.'
-    if 'could not find sound' in lower:
-        return 'Missing sound warning. Usually harmless unless it affects gameplay or mod functionality.'
-    if 'unknown item' in lower:
-        return 'Unknown item warning. Usually harmless unless it affects gameplay or mod functionality.'
-    if 'shader' in lower or 'opengl' in lower:
-        return 'Graphics driver or shader warning. Safe to ignore.'
-    if 'warning' in lower:
-        return 'General warning. Usually not critical.'
+    for pattern, explanation in _BENIGN_EXPLANATIONS:
+        if pattern.search(error):
+            return explanation
     return 'Benign Starbound log message. Safe to ignore.'
 
+# Common Starbound storage folders, searched in order (the actual Starbound storage path first).
+# Expanded once at import - the environment and home folder don't change during a session
+_LOG_SEARCH_DIRS = [os.path.normpath(d) for d in (
+    r'c:/Steam/steamapps/common/Starbound/storage',
+    os.path.expandvars(r'%ProgramFiles(x86)%/Steam/steamapps/common/Starbound/storage'),
+    os.path.expandvars(r'%ProgramFiles%/Steam/steamapps/common/Starbound/storage'),
+    os.path.expanduser(r'~/AppData/Local/Steam/steamapps/common/Starbound/storage'),
+    os.path.expanduser(r'~/Steam/steamapps/common/Starbound/storage'),
+    os.path.expanduser(r'~/Documents/Starbound/storage'),
+    os.path.expanduser(r'~/Starbound/storage'),
+)]
+
 def auto_detect_log():
     """
     Attempts to find the most recent starbound.log file in common Starbound locations.
     Returns a dict with 'success', 'logPath', and 'message'.
     """
-    import os
-    import glob
-    # Add the actual Starbound storage path first
-    possible_dirs = [
-        r'c:/Steam/steamapps/common/Starbound/storage',
-        os.path.expandvars(r'%ProgramFiles(x86)%/Steam/steamapps/common/Starbound/storage'),
-        os.path.expandvars(r'%ProgramFiles%/Steam/steamapps/common/Starbound/storage'),
-        os.path.expanduser(r'~/AppData/Local/Steam/steamapps/common/Starbound/storage'),
-        os.path.expanduser(r'~/Steam/steamapps/common/Starbound/storage'),
-        os.path.expanduser(r'~/Documents/Starbound/storage'),
-        os.path.expanduser(r'~/Starbound/storage'),
-    ]
-    for d in possible_dirs:
-        d = os.path.normpath(d)
+    for d in _LOG_SEARCH_DIRS:
         if os.path.isdir(d):
             log_path = os.path.join(d, 'starbound.log')
             if os.path.isfile(log_path):
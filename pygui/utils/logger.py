@@ -20,19 +20,45 @@ def get_logger():
     return _logger_instance
 # logger.py
 # Simple logging system for Starbound Music Mod Generator (Python)
+import atexit
+import heapq
 import os
+import re
 import datetime
-from pathlib import Path
 
 
 import platform
 import getpass
-import glob
+import threading
+
+# Optional: CPU/memory lines in the log header
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# First and last lines of the log header - used to detect and replace it
+_HEADER_MARKER = '=================== StarSound Log File ===================='
+_HEADER_END = '------------------ BOOT COMPLETE -------------------------'
+
+# Session log names: starsoundlog<N>_<DATE-TIME>.txt - group 1 is N
+_SESSION_LOG_RE = re.compile(r'^starsoundlog(\d+)_.*\.txt$')
 
 class StarSoundLogger:
+    # Patch generation logs from several worker threads - one writer at a time keeps entries and the
+    # AStarSoundlog_current.txt mirror whole
+    _write_lock = threading.Lock()
+    # Append handles for the session log and its AStarSoundlog_current.txt mirror, opened once in __init__
+    _session_fh = None
+    _current_fh = None
+    # Header lines that stay the same for the whole session, built on first use by _build_header_str()
+    _static_header = None
+    # Set once _write_header() has started the session log
+    _header_written = False
+
     def log(self, message, level='INFO', context=None):
         """
-        Append a log entry to the session log file, then overwrite AStarSoundlog_current.txt with the latest log.
+        Append a log entry to the session log file and to AStarSoundlog_current.txt, which mirrors it.
         context: string or list of tags for the [context/tags] field.
         """
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -43,50 +69,52 @@ class StarSoundLogger:
         else:
             context_str = str(context)
         entry = f'[{timestamp}] [{level}] [{context_str}] {message}\n'
-        # Only write header if file does not exist
-        if not os.path.exists(self.log_path):
-            self._write_header()
-        # Append log entry to session log
-        try:
-            with open(self.log_path, 'a', encoding='utf-8') as f:
-                f.write(entry)
-        except Exception as e:
-            print(f'[LOGGER ERROR] Failed to append log: {e}')
-        # Overwrite AStarSoundlog_current.txt with the latest session log
-        try:
-            current_log = os.path.join(os.path.dirname(__file__), '..', 'starsoundlogs', 'AStarSoundlog_current.txt')
-            with open(self.log_path, 'r', encoding='utf-8') as src, open(current_log, 'w', encoding='utf-8') as dst:
-                dst.write(src.read())
-        except Exception as e:
-            print(f'[LOGGER ERROR] Failed to update current log: {e}')
+        with self._write_lock:
+            # The header went in when the log was opened, so this is just one append to each file -
+            # no exists() check and no copying the whole session log into the mirror per entry
+            try:
+                self._session_fh.write(entry)
+            except Exception as e:
+                print(f'[LOGGER ERROR] Failed to append log: {e}')
+            try:
+                self._current_fh.write(entry)
+            except Exception as e:
+                print(f'[LOGGER ERROR] Failed to update current log: {e}')
 
     def warn(self, message, context=None):
         self.log(message, level='WARNING', context=context)
 
     def error(self, message, context=None):
         self.log(message, level='ERROR', context=context)
+
     def __init__(self):
         # Always create a new sequentially numbered log file for each session
         log_dir = os.path.join(os.path.dirname(__file__), '..', 'starsoundlogs')
         os.makedirs(log_dir, exist_ok=True)
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
         # Find the next available log number
-        existing_logs = sorted(Path(log_dir).glob('starsoundlog*_*.txt'), key=lambda f: f.stat().st_mtime)
+        # scandir entries carry their own stat (cached after the first call, and free on Windows), so sorting
+        # by mtime doesn't stat every log file again the way Path.glob + Path.stat() did
+        existing_logs = []  # (mtime, path) per session log
         max_num = 0
-        for log in existing_logs:
-            name = log.stem
-            if name.startswith('starsoundlog'):
-                parts = name.split('_')[0]  # e.g. 'starsoundlog1'
-                num_part = ''.join(filter(str.isdigit, parts.replace('starsoundlog', '')))
-                if num_part.isdigit():
-                    max_num = max(max_num, int(num_part))
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                match = _SESSION_LOG_RE.match(entry.name)
+                if match:
+                    existing_logs.append((entry.stat().st_mtime, entry.path))
+                    max_num = max(max_num, int(match.group(1)))
         next_num = max_num + 1
         self.log_path = os.path.join(log_dir, f'starsoundlog{next_num}_{timestamp}.txt')
-        # Keep only the 10 most recent logs, delete older ones
+        self._current_log_path = os.path.join(log_dir, 'AStarSoundlog_current.txt')
+        # Keep only the 10 most recent logs (9 old + this one), delete older ones. Picking the 9 newest with a
+        # heap avoids sorting everything when an old install has piled up thousands of logs
         if len(existing_logs) >= 10:
-            for old_log in existing_logs[:-9]:
+            keep = {path for _, path in heapq.nlargest(9, existing_logs)}
+            for _, old_log in existing_logs:
+                if old_log in keep:
+                    continue
                 try:
-                    os.remove(old_log)
+                    os.unlink(old_log)
                 except Exception as e:
                     print(f'[LOGGER WARNING] Failed to delete old log: {old_log} ({e})')
         self.session_id = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
@@ -103,6 +131,56 @@ class StarSoundLogger:
             'last_action': None
         }
         self._write_header()
+        self._open_log_files()
+        atexit.register(self._close_log_files)
+
+    # Set STARSOUND_DEBUG_LOG=0 to skip [DEBUG] entries entirely - debug() then returns before formatting its arguments
+    is_debug = os.environ.get('STARSOUND_DEBUG_LOG', '1') != '0'
+
+    def debug(self, message, *args, context=None, **fields):
+        """
+        Log a '[DEBUG] ...' entry. Pass values as %-style args (debug('Copying %s', path)) or as
+        keyword fields (debug('Converting', src=path) -> '[DEBUG] Converting: src=...') so the
+        string is only built when is_debug is on.
+        """
+        if not self.is_debug:
+            return
+        if args:
+            message = message % args
+        if fields:
+            message += ': ' + ', '.join(
+                f'{key}={value:.2f}' if isinstance(value, float) else f'{key}={value}'
+                for key, value in fields.items()
+            )
+        self.log('[DEBUG] ' + message, context=context)
+
+    def _open_log_files(self):
+        """
+        (Re)open the session log and AStarSoundlog_current.txt for line-buffered appends. The mirror is reset
+        to a full copy of the session log here - the only whole-file copy; log() appends to both after that.
+        """
+        self._close_log_files()
+        try:
+            self._session_fh = open(self.log_path, 'a', encoding='utf-8', buffering=1)
+        except Exception as e:
+            print(f'[LOGGER ERROR] Failed to open session log: {e}')
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as src:
+                content = src.read()
+            self._current_fh = open(self._current_log_path, 'w', encoding='utf-8', buffering=1)
+            self._current_fh.write(content)
+        except Exception as e:
+            print(f'[LOGGER ERROR] Failed to update current log: {e}')
+
+    def _close_log_files(self):
+        for fh in (self._session_fh, self._current_fh):
+            if fh is not None:
+                try:
+                    fh.close()
+                except Exception:
+                    pass
+        self._session_fh = None
+        self._current_fh = None
 
     def update_metadata(self, **kwargs):
         """
@@ -115,83 +193,17 @@ class StarSoundLogger:
         for key, value in kwargs.items():
             if key in self.session_metadata:
                 self.session_metadata[key] = value
-        # Rewrite the header with updated metadata
-        self._rewrite_header_with_metadata()
+        # Rewrite the header with updated metadata, then reopen both files (the mirror picks up the new header)
+        with self._write_lock:
+            self._close_log_files()
+            self._rewrite_header_with_metadata()
+            self._open_log_files()
 
     def _rewrite_header_with_metadata(self):
         """
         Rewrites the header at the top of the log file with the current metadata, preserving all log entries below.
         """
-        header_marker = '=================== StarSound Log File ===================='  # Used to detect header
-        # Generate new header
-        try:
-            import psutil
-        except Exception:
-            psutil = None
-        try:
-            user = getpass.getuser()
-        except Exception:
-            user = 'Unknown'
-        try:
-            now = datetime.datetime.now()
-        except Exception:
-            now = 'Unknown'
-        try:
-            os_info = f'{platform.system()} {platform.release()} ({platform.machine()})'
-        except Exception:
-            os_info = 'Unknown'
-        app_version = '1.0.0'
-        node_version = 'N/A (Python)'
-        debug_mode = 'Yes' if __debug__ else 'No'
-        try:
-            cpu_core_count = psutil.cpu_count(logical=True) if psutil else 'Unknown'
-        except Exception:
-            cpu_core_count = 'Unknown'
-        try:
-            total_memory_mb = int(psutil.virtual_memory().total / (1024 * 1024)) if psutil else 'Unknown'
-        except Exception:
-            total_memory_mb = 'Unknown'
-        try:
-            high_res_time = f'{datetime.datetime.now().isoformat()}'
-        except Exception:
-            high_res_time = 'Unknown'
-
-        header_lines = [
-            header_marker,
-            '',
-        ]
-        if now != 'Unknown':
-            header_lines.append(f'Local Date/Time: {now.strftime("%m/%d/%Y %I:%M:%S %p %Z")}')
-            header_lines.append(f'Session Start: {now.isoformat()}')
-        header_lines.append(f'Session ID: {self.session_id}')
-        if app_version not in ('Unknown', 'N/A'):
-            header_lines.append(f'App Version: {app_version}')
-        if os_info not in ('Unknown', 'N/A'):
-            header_lines.append(f'OS: {os_info}')
-        if node_version not in ('Unknown', 'N/A'):
-            header_lines.append(f'Node.js: {node_version}')
-        if user not in ('Unknown', 'N/A'):
-            header_lines.append(f'User: {user}')
-        if debug_mode not in ('Unknown', 'N/A'):
-            header_lines.append(f'Debug Mode: {debug_mode}')
-        if cpu_core_count not in ('Unknown', 'N/A', 'Unknown'):
-            header_lines.append(f'CPU Core Count: {cpu_core_count}')
-        if total_memory_mb not in ('Unknown', 'N/A', 'Unknown'):
-            header_lines.append(f'Total Memory: {total_memory_mb} MB')
-        if high_res_time not in ('Unknown', 'N/A'):
-            header_lines.append(f'High-Resolution Time: {high_res_time}')
-        header_lines.append('')
-        header_lines.append('------------------ APP METADATA START --------------------')
-        meta = self._format_metadata_kv(self.session_metadata)
-        if meta:
-            header_lines.append(meta)
-        header_lines.append('------------------ APP METADATA END ----------------------')
-        header_lines.append('')
-        header_lines.append('Log Format: [timestamp] [LEVEL] [context/tags] message')
-        header_lines.append('')
-        header_lines.append('------------------ BOOT COMPLETE -------------------------')
-        header_lines.append('')
-        header_str = '\n'.join(header_lines)
+        header_str = self._build_header_str()
 
         # Read the existing log file, skip old header if present
         log_entries = ''
@@ -201,7 +213,7 @@ class StarSoundLogger:
             # Find where the header ends (after BOOT COMPLETE)
             end_idx = 0
             for i, line in enumerate(lines):
-                if '------------------ BOOT COMPLETE -------------------------' in line:
+                if _HEADER_END in line:
                     end_idx = i + 1
                     break
             log_entries = ''.join(lines[end_idx:])
@@ -217,99 +229,80 @@ class StarSoundLogger:
     def _format_metadata_kv(self, meta):
         return '\n'.join(f'{k}: {v}' for k, v in meta.items() if v not in (None, '', 'Unknown'))
 
-    def _write_header(self):
-        header_marker = '=================== StarSound Log File ===================='  # Used to detect header
-        header_lines = []
-        try:
-            import psutil
-        except Exception:
-            psutil = None
+    def _static_header_lines(self):
+        """
+        Header lines that can't change during a session (session ID, OS, user, CPU/memory), worked out once -
+        psutil.virtual_memory() and the platform calls aren't cheap, and the header is rebuilt on every
+        update_metadata(). Fields that couldn't be read are left out.
+        """
         try:
             user = getpass.getuser()
         except Exception:
-            user = 'Unknown'
-        try:
-            now = datetime.datetime.now()
-        except Exception:
-            now = 'Unknown'
+            user = None
         try:
             os_info = f'{platform.system()} {platform.release()} ({platform.machine()})'
         except Exception:
-            os_info = 'Unknown'
-        app_version = '1.0.0'
-        node_version = 'N/A (Python)'
-        debug_mode = 'Yes' if __debug__ else 'No'
+            os_info = None
         try:
-            cpu_core_count = psutil.cpu_count(logical=True) if psutil else 'Unknown'
+            cpu_core_count = psutil.cpu_count(logical=True) if psutil else None
         except Exception:
-            cpu_core_count = 'Unknown'
+            cpu_core_count = None
         try:
-            total_memory_mb = int(psutil.virtual_memory().total / (1024 * 1024)) if psutil else 'Unknown'
+            total_memory_mb = int(psutil.virtual_memory().total / (1024 * 1024)) if psutil else None
         except Exception:
-            total_memory_mb = 'Unknown'
-        try:
-            high_res_time = f'{datetime.datetime.now().isoformat()}'
-        except Exception:
-            high_res_time = 'Unknown'
+            total_memory_mb = None
+        fields = [
+            ('Session ID', self.session_id),
+            ('App Version', '1.0.0'),
+            ('OS', os_info),
+            ('Node.js', 'N/A (Python)'),
+            ('User', user),
+            ('Debug Mode', 'Yes' if __debug__ else 'No'),
+            ('CPU Core Count', cpu_core_count),
+        ]
+        lines = [f'{name}: {value}' for name, value in fields if value is not None]
+        if total_memory_mb is not None:
+            lines.append(f'Total Memory: {total_memory_mb} MB')
+        return lines
 
+    def _build_header_str(self):
+        """The full log header: cached static lines plus the current time and session_metadata"""
+        if self._static_header is None:
+            self._static_header = self._static_header_lines()
+        now = datetime.datetime.now()
         header_lines = [
-            header_marker,
+            _HEADER_MARKER,
             '',
+            f'Local Date/Time: {now.strftime("%m/%d/%Y %I:%M:%S %p %Z")}',
+            f'Session Start: {now.isoformat()}',
+            *self._static_header,
+            f'High-Resolution Time: {datetime.datetime.now().isoformat()}',
+            '',
+            '------------------ APP METADATA START --------------------',
         ]
-        if now != 'Unknown':
-            header_lines.append(f'Local Date/Time: {now.strftime("%m/%d/%Y %I:%M:%S %p %Z")}')
-            header_lines.append(f'Session Start: {now.isoformat()}')
-        header_lines.append(f'Session ID: {self.session_id}')
-        if app_version not in ('Unknown', 'N/A'):
-            header_lines.append(f'App Version: {app_version}')
-        if os_info not in ('Unknown', 'N/A'):
-            header_lines.append(f'OS: {os_info}')
-        if node_version not in ('Unknown', 'N/A'):
-            header_lines.append(f'Node.js: {node_version}')
-        if user not in ('Unknown', 'N/A'):
-            header_lines.append(f'User: {user}')
-        if debug_mode not in ('Unknown', 'N/A'):
-            header_lines.append(f'Debug Mode: {debug_mode}')
-        if cpu_core_count not in ('Unknown', 'N/A', 'Unknown'):
-            header_lines.append(f'CPU Core Count: {cpu_core_count}')
-        if total_memory_mb not in ('Unknown', 'N/A', 'Unknown'):
-            header_lines.append(f'Total Memory: {total_memory_mb} MB')
-        if high_res_time not in ('Unknown', 'N/A'):
-            header_lines.append(f'High-Resolution Time: {high_res_time}')
-        header_lines.append('')
-        header_lines.append('------------------ APP METADATA START --------------------')
         meta = self._format_metadata_kv(self.session_metadata)
         if meta:
             header_lines.append(meta)
-        header_lines.append('------------------ APP METADATA END ----------------------')
-        header_lines.append('')
-        header_lines.append('Log Format: [timestamp] [LEVEL] [context/tags] message')
-        header_lines.append('')
-        header_lines.append('------------------ BOOT COMPLETE -------------------------')
-        header_lines.append('')
-        header_str = '\n'.join(header_lines)
-
-        # Check if file exists and if header is present
-        needs_header = True
-        if os.path.exists(self.log_path):
-            try:
-                with open(self.log_path, 'r', encoding='utf-8') as f:
-                    first_line = f.readline().strip()
-                    if first_line == header_marker:
-                        needs_header = False
-            except Exception:
-                pass
+        header_lines += [
+            '------------------ APP METADATA END ----------------------',
+            '',
+            'Log Format: [timestamp] [LEVEL] [context/tags] message',
+            '',
+            _HEADER_END,
+            '',
+        ]
+        return '\n'.join(header_lines)
 
-        if needs_header:
-            # Prepend header to existing log (if any)
-            try:
-                old_content = ''
-                if os.path.exists(self.log_path):
-                    with open(self.log_path, 'r', encoding='utf-8') as f:
-                        old_content = f.read()
-                with open(self.log_path, 'w', encoding='utf-8') as f:
-                    f.write(header_str)
-                    if old_content:
-                        f.write(old_content if old_content.startswith('\n') else '\n' + old_content)
-            except Exception as e:
-                print(f'[LOGGER ERROR] Failed to write log header: {e}')
+    def _write_header(self):
+        """
+        Start the session log with its header. __init__ picks a new numbered file for every session, so there is
+        nothing to check on disk - the _header_written flag makes repeat calls a no-op instead.
+        """
+        if self._header_written:
+            return
+        try:
+            with open(self.log_path, 'w', encoding='utf-8') as f:
+                f.write(self._build_header_str())
+            self._header_written = True
+        except Exception as e:
+            print(f'[LOGGER ERROR] Failed to write log header: {e}')
@@ -0,0 +1,125 @@
+"""
+Test: _link_or_copy in atomicwriter.py (putting the converted OGG into music/)
+
+This test verifies that:
+1. On one filesystem the destination is a hard link to the source (same inode, no second copy)
+2. An existing destination is replaced, not appended to
+3. When hard links fail, the shutil.copy2 fallback writes identical bytes (empty and multi-MB files)
+4. The fallback copy keeps the source's modification time, like copy2
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Add pygui to path so we can import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pygui'))
+
+from utils import atomicwriter
+from utils.atomicwriter import _link_or_copy
+
+
+def _no_hard_links(src, dst):
+    raise OSError('hard links not supported')
+
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test1_same_filesystem_links():
+    """Same folder, same device - the destination shares the source's inode"""
+    print("\n✓ TEST 1: Hard link on the same filesystem")
+    print("=" * 60)
+    tmp = tempfile.mkdtemp()
+    try:
+        src = os.path.join(tmp, 'track.ogg')
+        dst = os.path.join(tmp, 'track_music.ogg')
+        _write(src, b'OggS' * 10)
+        _link_or_copy(src, dst)
+        assert os.path.samefile(src, dst), 'destination is not a hard link'
+        print("✓ destination is the same file as the source")
+    finally:
+        shutil.rmtree(tmp)
+    return True
+
+
+def test2_overwrites_existing():
+    """A longer existing destination is replaced, not left with trailing bytes"""
+    print("\n✓ TEST 2: Existing destination overwritten")
+    print("=" * 60)
+    tmp = tempfile.mkdtemp()
+    try:
+        src = os.path.join(tmp, 'new.ogg')
+        dst = os.path.join(tmp, 'old.ogg')
+        _write(src, b'new')
+        _write(dst, b'old and much longer')
+        _link_or_copy(src, dst)
+        with open(dst, 'rb') as f:
+            assert f.read() == b'new', 'destination not replaced'
+        print("✓ destination replaced")
+    finally:
+        shutil.rmtree(tmp)
+    return True
+
+
+def test3_fallback_contents_match():
+    """With os.link failing, copy2 produces byte-identical separate files"""
+    print("\n✓ TEST 3: Copy fallback bytes match the source")
+    print("=" * 60)
+    tmp = tempfile.mkdtemp()
+    original_link = atomicwriter.os.link
+    atomicwriter.os.link = _no_hard_links
+    try:
+        for name, data in (('empty.ogg', b''), ('small.ogg', b'OggS' * 10), ('big.ogg', os.urandom(3 * 1024 * 1024 + 7))):
+            src = os.path.join(tmp, name)
+            dst = os.path.join(tmp, 'copy_' + name)
+            _write(src, data)
+            _link_or_copy(src, dst)
+            assert not os.path.samefile(src, dst), f'{name}: expected a real copy, got a link'
+            with open(dst, 'rb') as f:
+                assert f.read() == data, f'{name}: contents differ'
+            print(f"✓ {name} ({len(data)} bytes) copied intact")
+    finally:
+        atomicwriter.os.link = original_link
+        shutil.rmtree(tmp)
+    return True
+
+
+def test4_fallback_mtime_preserved():
+    """The copy2 fallback carries the source's modification time over to a separate file"""
+    print("\n✓ TEST 4: Copy fallback preserves modification time")
+    print("=" * 60)
+    tmp = tempfile.mkdtemp()
+    original_link = atomicwriter.os.link
+    atomicwriter.os.link = _no_hard_links
+    try:
+        src = os.path.join(tmp, 'track.ogg')
+        dst = os.path.join(tmp, 'track_copy.ogg')
+        _write(src, b'x' * 1000)
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+        _link_or_copy(src, dst)
+        assert not os.path.samefile(src, dst), 'expected a real copy, got a link'
+        assert int(os.stat(dst).st_mtime) == 1_600_000_000, 'mtime not copied'
+        print("✓ mtime matches the source")
+    finally:
+        atomicwriter.os.link = original_link
+        shutil.rmtree(tmp)
+    return True
+
+
+if __name__ == '__main__':
+    results = [
+        test1_same_filesystem_links(),
+        test2_overwrites_existing(),
+        test3_fallback_contents_match(),
+        test4_fallback_mtime_preserved(),
+    ]
+    print("\n" + "=" * 60)
+    if all(results):
+        print("✅ ALL LINK OR COPY TESTS PASSED")
+    else:
+        print("❌ SOME TESTS FAILED")
+        sys.exit(1)